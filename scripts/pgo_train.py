@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+PGO training workload for the HRM mobile optimizer
+==================================================
+
+Replays a representative request mix through HRMMobileOptimizer, cycling
+through every battery, thermal and memory band, so a profile-guided CPython
+build lays out its hot dispatch paths for this workload.
+
+Build CPython for the mobile runtime with this script as the profile task:
+
+    ./configure --enable-optimizations --with-lto [--enable-bolt]
+    make PROFILE_TASK="/path/to/universal-soul-ai/scripts/pgo_train.py"
+
+It can also be run directly as a quick smoke benchmark:
+
+    python scripts/pgo_train.py --requests 10000
+"""
+
+import argparse
+import asyncio
+import itertools
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from thinkmesh_core.config import HRMConfig
+from thinkmesh_core.hrm.mobile_optimizer import HRMMobileOptimizer, ThermalState
+
+# One representative level per band the optimizer distinguishes
+BATTERY_LEVELS = (0.1, 0.25, 0.4, 0.6, 0.9)
+MEMORY_PRESSURES = (0.2, 0.6, 0.75, 0.9)
+THERMAL_STATES = tuple(state.value for state in ThermalState)
+
+STRATEGY = {
+    "approach": "hierarchical_decomposition",
+    "complexity": 0.8,
+    "key_steps": ["Analyze request", "Gather context", "Plan response", "Draft", "Review"],
+    "resource_requirements": {"processing_intensity": "high", "memory_usage": "medium"},
+    "context_requirements": ["history", "preferences", "device"]
+}
+
+RESPONSE = "This is a representative sentence from a generated response. " * 30
+
+
+class _Request:
+    """Stand-in for an HRM request as seen by optimize_request"""
+
+    def __init__(self):
+        self.mobile_constraints = None
+        self.timeout_seconds = 30
+
+
+async def replay(requests: int) -> float:
+    """Drive the optimizer through the request mix, returning elapsed seconds"""
+    optimizer = HRMMobileOptimizer(HRMConfig())
+    await optimizer.initialize()
+    await optimizer.optimize_model_loading(Path("models/hrm_27m_mobile.gguf"), "int8", 512)
+
+    states = itertools.cycle(itertools.product(BATTERY_LEVELS, THERMAL_STATES, MEMORY_PRESSURES))
+    start = time.perf_counter()
+
+    for i in range(requests):
+        # Device conditions change every few requests, as on a real handset
+        if i % 8 == 0:
+            battery_level, thermal_state, memory_pressure = next(states)
+            await optimizer.update_device_state(
+                battery_level, thermal_state, memory_pressure, cpu_usage=0.5
+            )
+
+        await optimizer.optimize_request(_Request())
+        strategy = await optimizer.optimize_strategy(
+            {**STRATEGY, "resource_requirements": dict(STRATEGY["resource_requirements"])},
+            optimizer.get_current_constraints_snapshot()
+        )
+        await optimizer.optimize_execution_result({"response": RESPONSE}, strategy)
+
+    elapsed = time.perf_counter() - start
+    await optimizer.shutdown()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=10000,
+                        help="number of requests to replay (default: 10000)")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)  # Keep the profile focused on optimizer code
+
+    elapsed = asyncio.run(replay(args.requests))
+    print(f"Replayed {args.requests} requests in {elapsed:.3f}s "
+          f"({elapsed / args.requests * 1e6:.1f} us/request)")
+
+
+if __name__ == "__main__":
+    main()
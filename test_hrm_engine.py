@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+HRM Engine Test Suite
+
+Tests request batching and shutdown behaviour of the HRM engine,
+device sampling and thermal model variants, request classification by the strategic planner and
+the learning engine's persistence and batching.
+Runs under pytest or directly as a script.
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from thinkmesh_core.config import HRMConfig
+from thinkmesh_core.hrm import engine as engine_module
+from thinkmesh_core.hrm.engine import HRMEngine
+from thinkmesh_core.hrm.learning_engine import LearningEngine
+from thinkmesh_core.hrm.mobile_optimizer import HRMMobileOptimizer, ThermalState
+from thinkmesh_core.hrm.strategic_planner import StrategicPlanner, _analyze_text
+from thinkmesh_core.hrm.task_executor import TaskExecutor
+from thinkmesh_core.interfaces import UserContext
+
+
+def _make_context() -> UserContext:
+    return UserContext(
+        user_id="test_user",
+        preferences={},
+        session_data={},
+        device_info={},
+        privacy_settings={}
+    )
+
+
+async def _make_engine(model_dir: str, **config_overrides) -> HRMEngine:
+    model_path = Path(model_dir) / "hrm_test.gguf"
+    model_path.write_bytes(b"\0" * 4096)
+    engine = HRMEngine(HRMConfig(model_path=str(model_path), **config_overrides))
+    await engine.initialize()
+    return engine
+
+
+def test_shutdown_during_slow_batch_releases_caller():
+    """A request whose batch is in flight must finish when the engine shuts down"""
+    async def scenario():
+        with tempfile.TemporaryDirectory() as model_dir:
+            engine = await _make_engine(model_dir)
+            executing = asyncio.Event()
+
+            async def slow_execute_strategy(strategy, context, **kwargs):
+                executing.set()
+                await asyncio.sleep(60)
+
+            engine.task_executor.execute_strategy = slow_execute_strategy
+
+            caller = asyncio.create_task(engine.process_request("hello there", _make_context()))
+            await asyncio.wait_for(executing.wait(), timeout=5)
+
+            await engine.shutdown()
+            done, _ = await asyncio.wait({caller}, timeout=5)
+
+            assert caller in done, "caller still waiting after shutdown"
+            assert caller.cancelled() or caller.exception() is not None
+
+    asyncio.run(scenario())
+
+
+def test_inflected_keywords_classify_like_their_base_form():
+    """Inflected keywords ("implementing", "systems", "designs") must still count"""
+    planner = StrategicPlanner(HRMConfig())
+    asyncio.run(planner.initialize())
+
+    analysis = planner._analyze_request(
+        "Implementing an optimization for our systems architecture designs", _make_context()
+    )
+    assert analysis["domain"] == "technical"
+    assert analysis["user_intent"] == "task_completion"
+    assert analysis["complexity"] > 0.25
+
+    # Short keywords are not inflected, so "is" and "does" match nothing
+    analysis = planner._analyze_request("Is this done? He does it.", _make_context())
+    assert analysis["domain"] == "general"
+    assert analysis["user_intent"] == "general_inquiry"
+
+
+def _fake_psutil(battery_percent: float, temperature_c: float) -> SimpleNamespace:
+    process = mock.Mock()
+    process.memory_info.return_value = SimpleNamespace(rss=600 * 1024 * 1024)
+    process.cpu_percent.return_value = 40.0
+    return SimpleNamespace(
+        Process=mock.Mock(return_value=process),
+        cpu_percent=mock.Mock(side_effect=AssertionError("system-wide CPU read")),
+        virtual_memory=mock.Mock(return_value=SimpleNamespace(percent=35.0)),
+        sensors_battery=mock.Mock(return_value=SimpleNamespace(percent=battery_percent)),
+        sensors_temperatures=mock.Mock(
+            return_value={"cpu": [SimpleNamespace(current=temperature_c)]}
+        )
+    )
+
+
+def test_device_sampling_reaches_the_mobile_optimizer():
+    """Sampled battery and thermal readings drive quantization and the optimizer"""
+    async def scenario():
+        fake_psutil = _fake_psutil(battery_percent=20.0, temperature_c=85.0)
+        with tempfile.TemporaryDirectory() as model_dir, \
+                mock.patch.object(engine_module, "psutil", fake_psutil, create=True), \
+                mock.patch.object(engine_module, "PSUTIL_AVAILABLE", True):
+            engine = await _make_engine(model_dir, quantization="INT8")
+            try:
+                assert engine._sampler_task is not None
+                assert engine._loaded_quantization == "INT4"
+                assert (engine.battery_level, engine.thermal_state) == (20.0, "hot")
+
+                constraints = engine.mobile_optimizer.get_current_constraints_snapshot()
+                assert constraints["battery_level"] == 0.2
+                assert constraints["thermal_state"] == "hot"
+                assert constraints["memory_pressure"] == 0.35
+                assert constraints["cpu_usage"] == 0.4
+
+                # Process RSS is reported on its own, outside the component
+                # memory thresholds
+                metrics = await engine.get_metrics()
+                assert metrics["process_rss_mb"] == 600.0
+                assert "memory_usage_mb" not in metrics
+                assert metrics["cpu_usage_percent"] == 40.0
+            finally:
+                await engine.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_no_sampler_without_psutil():
+    """Without a device source the sampler is not started and defaults stand"""
+    async def scenario():
+        with tempfile.TemporaryDirectory() as model_dir, \
+                mock.patch.object(engine_module, "PSUTIL_AVAILABLE", False):
+            engine = await _make_engine(model_dir, quantization="INT8")
+            try:
+                assert engine._sampler_task is None
+                assert (engine.battery_level, engine.thermal_state) == (100.0, "normal")
+                assert engine._loaded_quantization == "INT8"
+            finally:
+                await engine.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_thermal_model_ladder_skips_missing_variants():
+    """Only variant files that exist are offered for a thermal state"""
+    with tempfile.TemporaryDirectory() as model_dir:
+        model_path = Path(model_dir) / "hrm.gguf"
+        small_path = Path(model_dir) / "hrm-small.gguf"
+        model_path.write_bytes(b"\0" * 16)
+        small_path.write_bytes(b"\0" * 16)
+
+        ladder = HRMMobileOptimizer._build_thermal_model_ladder(model_path)
+
+        assert ladder == {
+            ThermalState.NORMAL: str(model_path),
+            ThermalState.WARM: str(small_path)
+        }
+
+
+def test_engine_maps_the_variant_for_the_thermal_state():
+    """The engine loads the thermal variant and switches as the device heats and cools"""
+    async def scenario():
+        fake_psutil = _fake_psutil(battery_percent=90.0, temperature_c=70.0)
+        with tempfile.TemporaryDirectory() as model_dir, \
+                mock.patch.object(engine_module, "psutil", fake_psutil, create=True), \
+                mock.patch.object(engine_module, "PSUTIL_AVAILABLE", True):
+            for suffix in ("-small", "-tiny"):
+                (Path(model_dir) / f"hrm_test{suffix}.gguf").write_bytes(b"\0" * 4096)
+            engine = await _make_engine(model_dir)
+            try:
+                assert engine._loaded_model_path.name == "hrm_test-small.gguf"
+
+                fake_psutil.sensors_temperatures.return_value = {"cpu": [SimpleNamespace(current=85.0)]}
+                await engine._sample_device()
+                assert engine._loaded_model_path.name == "hrm_test-tiny.gguf"
+                assert engine._model_mmap is not None
+
+                fake_psutil.sensors_temperatures.return_value = {"cpu": [SimpleNamespace(current=40.0)]}
+                await engine._sample_device()
+                assert engine._loaded_model_path.name == "hrm_test.gguf"
+            finally:
+                await engine.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_batched_execution_skips_mobile_metadata():
+    """The engine's batch path leaves mobile metadata off; direct calls keep it"""
+    async def scenario():
+        config = HRMConfig()
+        optimizer = HRMMobileOptimizer(config)
+        await optimizer.initialize()
+        planner = StrategicPlanner(config, mobile_optimizer=optimizer)
+        await planner.initialize()
+        executor = TaskExecutor(config, mobile_optimizer=optimizer)
+        await executor.initialize()
+
+        context = _make_context()
+        strategy = await planner.create_strategy("Explain how batteries work", context, {})
+
+        [batched] = await executor.execute_strategy_batch([(strategy, context)])
+        assert "response" in batched
+        assert "mobile_optimizations" not in batched
+
+        direct = await executor.execute_strategy(strategy, context)
+        assert "mobile_optimizations" in direct
+
+    asyncio.run(scenario())
+
+
+def test_optimization_history_records_and_stays_bounded():
+    """Strategy adjustments are recorded, keeping only the most recent entries"""
+    async def scenario():
+        optimizer = HRMMobileOptimizer(HRMConfig(optimization_history_cap=2))
+        await optimizer.initialize()
+
+        # Nothing to adjust on a cool, charged device
+        await optimizer.optimize_strategy({"approach": "direct_response"}, {})
+        assert len(optimizer.optimization_history) == 0
+
+        await optimizer.update_device_state(
+            battery_level=0.9, thermal_state="hot", memory_pressure=0.2, cpu_usage=0.3
+        )
+        for _ in range(3):
+            await optimizer.optimize_strategy({"approach": "hierarchical_decomposition"}, {})
+
+        assert len(optimizer.optimization_history) == 2
+        entry = optimizer.optimization_history[-1]
+        assert entry["target"] == "strategy"
+        assert entry["thermal_state"] == "hot"
+        assert "thermal_throttling" in entry["optimizations"]
+
+    asyncio.run(scenario())
+
+
+_INFLECTED_KEYWORD_CASES = [
+    ("implementing", "technical"),
+    ("systems", "domain.technical"),
+    ("optimization", "technical"),
+    ("designs", "domain.creative"),
+    ("debugging", "domain.problem_solving"),
+    ("programmer", "domain.technical"),
+    ("designer", "intent.creative"),
+    ("analysis", "domain.analytical"),
+    ("solutions", "intent.problem_solving"),
+    ("executor", "intent.task_completion"),
+    ("studies", "domain.analytical")
+]
+
+
+@pytest.mark.parametrize("word, tag", _INFLECTED_KEYWORD_CASES)
+def test_inflected_keyword_hits_its_group(word, tag):
+    """Plural, -ing, -ion, doubled-consonant and agent-noun forms count as their keyword"""
+    hits, _ = _analyze_text(f"Some {word} today")
+    assert hits.get(tag) == 1
+
+
+_UNINFLECTED_CASES = [
+    ("is", "personal"),
+    ("does", "intent.task_completion"),
+    ("miner", "personal"),
+    ("muster", "important")
+]
+
+
+@pytest.mark.parametrize("word, tag", _UNINFLECTED_CASES)
+def test_function_words_are_not_inflected(word, tag):
+    """Short keywords and agent nouns of function words stay unmatched"""
+    hits, _ = _analyze_text(word)
+    assert tag not in hits
+
+
+def test_keyword_and_its_inflection_count_once():
+    hits, _ = _analyze_text("system systems")
+    assert hits["domain.technical"] == 1
+
+
+_STRATEGIES = [
+    {"domain": "technical", "intent": "task_completion", "complexity": 0.7, "approach": "hierarchical_decomposition"},
+    {"domain": "general", "intent": "general_inquiry", "complexity": 0.2, "approach": "direct_response"},
+    {"domain": "analytical", "intent": "learning", "complexity": 0.5, "approach": "systematic_analysis"}
+]
+
+
+async def _learn_interactions(learning: LearningEngine, count: int) -> None:
+    for i in range(count):
+        context = _make_context()
+        context.user_id = f"user_{i % 2}"
+        result = {"confidence_score": 0.6 + (i % 4) * 0.1,
+                  "performance_metrics": {"execution_time_ms": 300 + i * 10}}
+        await learning.learn_from_interaction(
+            f"request {i}", _STRATEGIES[i % len(_STRATEGIES)], result, context
+        )
+
+
+def test_learning_data_round_trip_restores_patterns():
+    """Reloaded records rebuild the same patterns, aggregates and versions"""
+    async def scenario():
+        with tempfile.TemporaryDirectory() as data_dir:
+            config = HRMConfig(learning_data_path=data_dir)
+            learning = LearningEngine(config)
+            await learning.initialize()
+            await _learn_interactions(learning, 10)
+            await learning.shutdown()
+
+            reloaded = LearningEngine(config)
+            await reloaded.initialize()
+            await reloaded.shutdown()
+
+            assert len(reloaded.learning_records) == 10
+            assert reloaded.user_patterns == learning.user_patterns
+            assert reloaded.user_aggregates == learning.user_aggregates
+            assert reloaded._user_versions == learning._user_versions
+            assert (await reloaded.get_user_adaptations("user_0") ==
+                    await learning.get_user_adaptations("user_0"))
+
+    asyncio.run(scenario())
+
+
+def test_partial_learning_data_starts_empty():
+    """A missing or truncated payload file is logged, not fatal"""
+    async def scenario():
+        with tempfile.TemporaryDirectory() as data_dir:
+            config = HRMConfig(learning_data_path=data_dir)
+            learning = LearningEngine(config)
+            await learning.initialize()
+            await _learn_interactions(learning, 6)
+            await learning.shutdown()
+
+            payloads = next(Path(data_dir).glob("*.jsonl"))
+            content = payloads.read_text()
+            payloads.write_text(content[:len(content) // 2])
+            truncated = LearningEngine(config)
+            await truncated.initialize()
+            assert truncated.learning_records == []
+            assert not truncated.user_patterns
+            await truncated.shutdown()
+
+            payloads.unlink()
+            missing = LearningEngine(config)
+            await missing.initialize()
+            assert missing.learning_records == []
+            await missing.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_lone_interaction_skips_batch_window():
+    """A single interaction is learned without waiting out the batch window"""
+    async def scenario():
+        learning = LearningEngine(HRMConfig())
+        learning.learning_batch_latency_ms = 500.0
+        await learning.initialize()
+        try:
+            start = time.perf_counter()
+            await _learn_interactions(learning, 1)
+            assert time.perf_counter() - start < 0.25
+        finally:
+            await learning.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_interactions_share_a_batch():
+    """Interactions queued together are learned in one batch"""
+    async def scenario():
+        learning = LearningEngine(HRMConfig())
+        await learning.initialize()
+        batch_sizes = []
+        learn_batch = learning._learn_batch
+
+        def recording_learn_batch(interactions):
+            batch_sizes.append(len(interactions))
+            return learn_batch(interactions)
+
+        learning._learn_batch = recording_learn_batch
+        try:
+            context = _make_context()
+            await asyncio.gather(*(
+                learning.learn_from_interaction(f"request {i}", _STRATEGIES[0], {}, context)
+                for i in range(5)
+            ))
+            assert batch_sizes == [5]
+            assert len(learning.learning_records) == 5
+        finally:
+            await learning.shutdown()
+
+    asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    test_shutdown_during_slow_batch_releases_caller()
+    test_device_sampling_reaches_the_mobile_optimizer()
+    test_no_sampler_without_psutil()
+    test_thermal_model_ladder_skips_missing_variants()
+    test_engine_maps_the_variant_for_the_thermal_state()
+    test_batched_execution_skips_mobile_metadata()
+    test_optimization_history_records_and_stays_bounded()
+    test_inflected_keywords_classify_like_their_base_form()
+    for word, tag in _INFLECTED_KEYWORD_CASES:
+        test_inflected_keyword_hits_its_group(word, tag)
+    for word, tag in _UNINFLECTED_CASES:
+        test_function_words_are_not_inflected(word, tag)
+    test_keyword_and_its_inflection_count_once()
+    test_learning_data_round_trip_restores_patterns()
+    test_partial_learning_data_starts_empty()
+    test_lone_interaction_skips_batch_window()
+    test_concurrent_interactions_share_a_batch()
+    print("✅ All HRM engine tests passed")
@@ -55,6 +55,22 @@ class HRMConfig:
     battery_aware: bool = True
     thermal_throttling: bool = True
     memory_limit_mb: int = 512
+    
+    # Request micro-batching
+    max_batch_size: int = 8
+    batch_window_ms: float = 10.0
+    
+    # Background resource sampling
+    sampling_interval_s: float = 2.0
+    
+    # Minimum interval between mobile device state polls
+    device_poll_interval_s: float = 0.5
+    
+    # Most recent mobile optimization records kept (0 = unbounded)
+    optimization_history_cap: int = 512
+    
+    # Learning persistence (learning data is kept in memory only when unset)
+    learning_data_path: Optional[str] = None
 
 
 @dataclass
@@ -147,6 +163,7 @@ class MobileConfig:
 class MonitoringConfig:
     """Monitoring and health check configuration"""
     health_check_interval_seconds: int = 30
+    health_check_timeout_seconds: float = 10.0  # Per-component check timeout
     metrics_collection_enabled: bool = True
     error_reporting_enabled: bool = True
     
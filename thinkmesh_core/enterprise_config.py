@@ -9,17 +9,36 @@ Copyright (c) 2025 SynergyCore™ AI Systems
 """
 
 import os
+import sys
 import json
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Set
+from dataclasses import dataclass, field, fields, is_dataclass, replace
 from pathlib import Path
 
 from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# Interned default feature flag names so flag lookups hit the identity fast path
+_FEATURE_FLAG_KEYS = tuple(sys.intern(name) for name in (
+    "synergycore_orchestration",
+    "cogniflow_reasoning",
+    "edgemind_local_ai",
+    "opticore_optimization",
+    "codeswarm_development",
+    "enterprise_security",
+    "compliance_monitoring",
+    "cost_optimization",
+    "distributed_processing",
+    "enterprise_analytics",
+))
 
-@dataclass
+# Config directories already created by save_to_file in this process
+_ENSURED_DIRS: Set[str] = set()
+
+
+@dataclass(frozen=True)
 class SynergyCoreEnterpriseBranding:
     """SynergyCore™ Enterprise Platform branding and UI configuration"""
     platform_name: str = "SynergyCore™ AI Platform"
@@ -46,7 +65,7 @@ class SynergyCoreEnterpriseBranding:
     enterprise_logo_path: str = "assets/images/synergycore_enterprise.png"
 
 
-@dataclass
+@dataclass(frozen=True)
 class CogniFlowConfig:
     """CogniFlow™ Reasoning Engine configuration"""
     model_path: str = "models/cogniflow_27m_mobile.gguf"
@@ -68,7 +87,7 @@ class CogniFlowConfig:
     enterprise_security: bool = True
 
 
-@dataclass
+@dataclass(frozen=True)
 class SynergyCoreConfig:
     """SynergyCore™ Orchestration Platform configuration"""
     max_concurrent_agents: int = 8  # Increased for enterprise
@@ -88,7 +107,7 @@ class SynergyCoreConfig:
     load_balancing: bool = True
 
 
-@dataclass
+@dataclass(frozen=True)
 class EdgeMindConfig:
     """EdgeMind™ Local AI Service configuration"""
     server_port: int = 8080
@@ -111,7 +130,7 @@ class EdgeMindConfig:
     enterprise_encryption: bool = True
 
 
-@dataclass
+@dataclass(frozen=True)
 class OptiCoreConfig:
     """OptiCore™ Resource Optimizer configuration"""
     # Resource optimization (expanded beyond mobile)
@@ -136,7 +155,7 @@ class OptiCoreConfig:
     memory_pressure_handling: bool = True
 
 
-@dataclass
+@dataclass(frozen=True)
 class NeuralMeshDataConfig:
     """NeuralMesh™ Data Management configuration"""
     storage_path: str = "data/neuralmesh"
@@ -161,7 +180,15 @@ class NeuralMeshDataConfig:
     index_update_interval_hours: int = 12  # More frequent for enterprise
 
 
-@dataclass
+_DEFAULT_ALERT_THRESHOLDS: Mapping[str, float] = MappingProxyType({
+    "cpu_usage": 80.0,
+    "memory_usage": 85.0,
+    "response_time_ms": 2000.0,
+    "error_rate": 5.0
+})
+
+
+@dataclass(frozen=True)
 class EnterpriseMonitoringConfig:
     """Enterprise monitoring and compliance configuration"""
     health_check_interval_seconds: int = 15  # More frequent for enterprise
@@ -180,13 +207,42 @@ class EnterpriseMonitoringConfig:
     compliance_monitoring: bool = True
     cost_monitoring: bool = True
     
-    # Enterprise alerting
-    alert_thresholds: Dict[str, float] = field(default_factory=lambda: {
-        "cpu_usage": 80.0,
-        "memory_usage": 85.0,
-        "response_time_ms": 2000.0,
-        "error_rate": 5.0
-    })
+    # Enterprise alerting (read-only; replace() the config to change thresholds)
+    alert_thresholds: Mapping[str, float] = field(
+        default_factory=lambda: _DEFAULT_ALERT_THRESHOLDS
+    )
+    
+    def __post_init__(self):
+        # The config is shared, so its thresholds must not be mutable either
+        if not isinstance(self.alert_thresholds, MappingProxyType):
+            object.__setattr__(
+                self, "alert_thresholds", MappingProxyType(dict(self.alert_thresholds))
+            )
+
+
+def _config_to_dict(config: Any) -> Dict[str, Any]:
+    """Convert a configuration dataclass (and nested configs) to a dictionary"""
+    result = {}
+    for config_field in fields(config):
+        value = getattr(config, config_field.name)
+        if is_dataclass(value):
+            value = _config_to_dict(value)
+        elif isinstance(value, MappingProxyType):
+            value = dict(value)
+        result[config_field.name] = value
+    return result
+
+
+# Shared default component configurations. They are frozen, so every
+# NeuralMeshConfig can reference the same instances until a field is
+# overridden, at which point the owner gets its own copy via replace().
+_DEFAULT_BRANDING = SynergyCoreEnterpriseBranding()
+_DEFAULT_COGNIFLOW = CogniFlowConfig()
+_DEFAULT_SYNERGYCORE = SynergyCoreConfig()
+_DEFAULT_EDGEMIND = EdgeMindConfig()
+_DEFAULT_OPTICORE = OptiCoreConfig()
+_DEFAULT_DATA = NeuralMeshDataConfig()
+_DEFAULT_MONITORING = EnterpriseMonitoringConfig()
 
 
 @dataclass
@@ -194,13 +250,13 @@ class NeuralMeshConfig:
     """Main NeuralMesh™ Enterprise Platform configuration container"""
     
     # Component configurations
-    branding: SynergyCoreEnterpriseBranding = field(default_factory=SynergyCoreEnterpriseBranding)
-    cogniflow: CogniFlowConfig = field(default_factory=CogniFlowConfig)
-    synergycore: SynergyCoreConfig = field(default_factory=SynergyCoreConfig)
-    edgemind: EdgeMindConfig = field(default_factory=EdgeMindConfig)
-    opticore: OptiCoreConfig = field(default_factory=OptiCoreConfig)
-    data: NeuralMeshDataConfig = field(default_factory=NeuralMeshDataConfig)
-    monitoring: EnterpriseMonitoringConfig = field(default_factory=EnterpriseMonitoringConfig)
+    branding: SynergyCoreEnterpriseBranding = field(default_factory=lambda: _DEFAULT_BRANDING)
+    cogniflow: CogniFlowConfig = field(default_factory=lambda: _DEFAULT_COGNIFLOW)
+    synergycore: SynergyCoreConfig = field(default_factory=lambda: _DEFAULT_SYNERGYCORE)
+    edgemind: EdgeMindConfig = field(default_factory=lambda: _DEFAULT_EDGEMIND)
+    opticore: OptiCoreConfig = field(default_factory=lambda: _DEFAULT_OPTICORE)
+    data: NeuralMeshDataConfig = field(default_factory=lambda: _DEFAULT_DATA)
+    monitoring: EnterpriseMonitoringConfig = field(default_factory=lambda: _DEFAULT_MONITORING)
     
     # Enterprise environment settings
     environment: str = "enterprise"  # development, staging, enterprise, production
@@ -209,18 +265,9 @@ class NeuralMeshConfig:
     compliance_mode: bool = True
     
     # Enterprise feature flags
-    feature_flags: Dict[str, bool] = field(default_factory=lambda: {
-        "synergycore_orchestration": True,
-        "cogniflow_reasoning": True,
-        "edgemind_local_ai": True,
-        "opticore_optimization": True,
-        "codeswarm_development": True,
-        "enterprise_security": True,
-        "compliance_monitoring": True,
-        "cost_optimization": True,
-        "distributed_processing": True,
-        "enterprise_analytics": True
-    })
+    feature_flags: Dict[str, bool] = field(
+        default_factory=lambda: dict.fromkeys(_FEATURE_FLAG_KEYS, True)
+    )
     
     # Backward compatibility aliases
     @property
@@ -307,15 +354,19 @@ class NeuralMeshConfig:
         
         # Component-specific environment variables
         if os.getenv("NEURALMESH_COGNIFLOW_MODEL_PATH"):
-            config.cogniflow.model_path = os.getenv("NEURALMESH_COGNIFLOW_MODEL_PATH")
+            config.cogniflow = replace(
+                config.cogniflow, model_path=os.getenv("NEURALMESH_COGNIFLOW_MODEL_PATH")
+            )
         
         if os.getenv("NEURALMESH_DATA_PATH"):
-            config.data.storage_path = os.getenv("NEURALMESH_DATA_PATH")
+            config.data = replace(config.data, storage_path=os.getenv("NEURALMESH_DATA_PATH"))
         
         # Backward compatibility environment variables
         if os.getenv("THINKMESH_HRM_MODEL_PATH"):
             logger.warning("THINKMESH_HRM_MODEL_PATH is deprecated. Use NEURALMESH_COGNIFLOW_MODEL_PATH")
-            config.cogniflow.model_path = os.getenv("THINKMESH_HRM_MODEL_PATH")
+            config.cogniflow = replace(
+                config.cogniflow, model_path=os.getenv("THINKMESH_HRM_MODEL_PATH")
+            )
         
         logger.info("NeuralMesh™ configuration loaded from environment variables")
         return config
@@ -323,8 +374,11 @@ class NeuralMeshConfig:
     def save_to_file(self, config_path: str) -> None:
         """Save configuration to JSON file"""
         try:
-            # Ensure directory exists
-            Path(config_path).parent.mkdir(parents=True, exist_ok=True)
+            # Ensure directory exists (once per process)
+            config_dir = str(Path(config_path).parent)
+            if config_dir not in _ENSURED_DIRS:
+                Path(config_dir).mkdir(parents=True, exist_ok=True)
+                _ENSURED_DIRS.add(config_dir)
             
             with open(config_path, 'w') as f:
                 json.dump(self._to_dict(), f, indent=2)
@@ -341,30 +395,31 @@ class NeuralMeshConfig:
             if hasattr(self, key):
                 attr = getattr(self, key)
                 if hasattr(attr, '__dict__'):
-                    # Update nested configuration objects
-                    for nested_key, nested_value in value.items():
-                        if hasattr(attr, nested_key):
-                            setattr(attr, nested_key, nested_value)
+                    # Nested configurations are frozen; swap in an updated copy
+                    overrides = {
+                        nested_key: nested_value
+                        for nested_key, nested_value in value.items()
+                        if hasattr(attr, nested_key)
+                    }
+                    if overrides:
+                        setattr(self, key, replace(attr, **overrides))
                 else:
                     setattr(self, key, value)
     
     def _to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary"""
-        result = {}
-        for key, value in self.__dict__.items():
-            if hasattr(value, '__dict__'):
-                result[key] = value.__dict__
-            else:
-                result[key] = value
-        return result
+        return _config_to_dict(self)
     
     def get_feature_flag(self, flag_name: str, default: bool = False) -> bool:
         """Get enterprise feature flag value"""
-        return self.feature_flags.get(flag_name, default)
+        try:
+            return self.feature_flags[flag_name]
+        except KeyError:
+            return default
     
     def set_feature_flag(self, flag_name: str, enabled: bool) -> None:
         """Set enterprise feature flag value"""
-        self.feature_flags[flag_name] = enabled
+        self.feature_flags[sys.intern(flag_name)] = enabled
         logger.info(f"Enterprise feature flag '{flag_name}' set to {enabled}")
 
 
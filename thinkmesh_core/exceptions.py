@@ -6,9 +6,14 @@ Comprehensive exception system with specific error codes,
 user-friendly messages, and debugging information.
 """
 
-from typing import Dict, Any, Optional
+import sys
+import logging
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, Mapping, Optional, Tuple, final
 from enum import Enum
 
+from .logging import get_logger
+
 
 class ErrorCode(Enum):
     """ThinkMesh error codes for categorization and handling"""
@@ -70,9 +75,93 @@ class ErrorCode(Enum):
     PRIVACY_POLICY_VIOLATION = 1705
 
 
+# User-facing messages and recovery suggestions, built once at import
+_DEFAULT_USER_MESSAGE = sys.intern(
+    "ThinkMesh encountered an unexpected issue. Please try again."
+)
+
+_RAW_USER_MESSAGES = {
+    ErrorCode.SYSTEM_INITIALIZATION_FAILED:
+        "ThinkMesh is having trouble starting up. Please restart the app.",
+    ErrorCode.HRM_MODEL_LOAD_FAILED:
+        "The AI brain couldn't load properly. Please check your device storage.",
+    ErrorCode.VOICE_STT_FAILED:
+        "I couldn't understand what you said. Please try speaking again.",
+    ErrorCode.BATTERY_CRITICALLY_LOW:
+        "Your battery is very low. ThinkMesh will reduce functionality to save power.",
+    ErrorCode.NETWORK_UNAVAILABLE:
+        "No internet connection detected. ThinkMesh will work offline.",
+}
+
+_DEFAULT_RECOVERY_SUGGESTIONS = tuple(sys.intern(suggestion) for suggestion in (
+    "Restart the app",
+    "Check device resources",
+    "Contact support if issue persists"
+))
+
+_RAW_RECOVERY_SUGGESTIONS = {
+    ErrorCode.HRM_MODEL_LOAD_FAILED: (
+        "Check available storage space",
+        "Restart the app",
+        "Clear app cache",
+        "Update to latest version"
+    ),
+    ErrorCode.BATTERY_CRITICALLY_LOW: (
+        "Connect device to charger",
+        "Enable battery saver mode",
+        "Close other apps",
+        "Reduce ThinkMesh usage"
+    ),
+    ErrorCode.NETWORK_UNAVAILABLE: (
+        "Check WiFi connection",
+        "Try mobile data",
+        "Move to area with better signal",
+        "Continue using offline features"
+    ),
+    ErrorCode.MEMORY_PRESSURE_HIGH: (
+        "Close other apps",
+        "Restart device",
+        "Clear app cache",
+        "Free up device storage"
+    )
+}
+
+# Read-only views with interned strings so message comparisons hit the identity fast path
+_USER_MESSAGES: Mapping[ErrorCode, str] = MappingProxyType({
+    code: sys.intern(message) for code, message in _RAW_USER_MESSAGES.items()
+})
+
+_RECOVERY_SUGGESTIONS: Mapping[ErrorCode, Tuple[str, ...]] = MappingProxyType({
+    code: tuple(sys.intern(suggestion) for suggestion in suggestions)
+    for code, suggestions in _RAW_RECOVERY_SUGGESTIONS.items()
+})
+
+
+def _plain_details(details: Dict[str, Any]) -> Dict[str, Any]:
+    """Details with lazy or read-only mappings turned into plain dicts for serialization"""
+    return {
+        key: dict(value) if isinstance(value, Mapping) and not isinstance(value, dict) else value
+        for key, value in details.items()
+    }
+
+
+def _codes_in_range(lower: int, upper: int) -> FrozenSet[ErrorCode]:
+    """Error codes whose value falls in [lower, upper)"""
+    return frozenset(code for code in ErrorCode if lower <= code.value < upper)
+
+
 class ThinkMeshException(Exception):
     """Base exception class for all ThinkMesh errors"""
     
+    __slots__ = (
+        "error_code", "error_code_value", "error_code_name",
+        "_message_str", "details", "_user_message", "recovery_suggestions"
+    )
+    
+    # Subclasses restrict error codes to their own category
+    _ALLOWED_CODES: Optional[FrozenSet[ErrorCode]] = None
+    _CODE_CATEGORY = ""
+    
     def __init__(
         self,
         message: str,
@@ -81,105 +170,133 @@ class ThinkMeshException(Exception):
         user_message: Optional[str] = None,
         recovery_suggestions: Optional[list] = None
     ):
+        allowed_codes = self._ALLOWED_CODES
+        if allowed_codes is not None and error_code not in allowed_codes:
+            raise ValueError(
+                f"{type(self).__name__} requires {self._CODE_CATEGORY} error code"
+            )
         super().__init__(message)
+        self._message_str = message
         self.error_code = error_code
+        self.error_code_value = error_code.value
+        self.error_code_name = error_code.name
         self.details = details or {}
-        self.user_message = user_message or self._generate_user_message()
+        self._user_message = user_message or None
         self.recovery_suggestions = recovery_suggestions or []
+    
+    @property
+    def user_message(self) -> str:
+        """User-friendly error message, generated on first access"""
+        if self._user_message is None:
+            self._user_message = self._generate_user_message()
+        return self._user_message
+    
+    @user_message.setter
+    def user_message(self, value: str) -> None:
+        self._user_message = value
         
     def _generate_user_message(self) -> str:
         """Generate user-friendly error message"""
-        user_messages = {
-            ErrorCode.SYSTEM_INITIALIZATION_FAILED: 
-                "ThinkMesh is having trouble starting up. Please restart the app.",
-            ErrorCode.HRM_MODEL_LOAD_FAILED:
-                "The AI brain couldn't load properly. Please check your device storage.",
-            ErrorCode.VOICE_STT_FAILED:
-                "I couldn't understand what you said. Please try speaking again.",
-            ErrorCode.BATTERY_CRITICALLY_LOW:
-                "Your battery is very low. ThinkMesh will reduce functionality to save power.",
-            ErrorCode.NETWORK_UNAVAILABLE:
-                "No internet connection detected. ThinkMesh will work offline.",
-        }
-        
-        return user_messages.get(
-            self.error_code, 
-            "ThinkMesh encountered an unexpected issue. Please try again."
-        )
+        return _USER_MESSAGES.get(self.error_code, _DEFAULT_USER_MESSAGE)
     
-    def to_dict(self) -> Dict[str, Any]:
+    def to_log_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary for logging/serialization"""
         return {
-            "error_code": self.error_code.value,
-            "error_name": self.error_code.name,
-            "message": str(self),
+            "error_code": self.error_code_value,
+            "error_name": self.error_code_name,
+            "message": self._message_str,
             "user_message": self.user_message,
-            "details": self.details,
+            "details": _plain_details(self.details),
+            "recovery_suggestions": self.recovery_suggestions
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Backward compatibility alias for to_log_dict()"""
+        return self.to_log_dict()
+    
+    def to_user_response(self) -> Dict[str, Any]:
+        """Build the user-facing error response returned by API entry points"""
+        return {
+            "success": False,
+            "error": self.user_message,
+            "error_code": self.error_code_value,
             "recovery_suggestions": self.recovery_suggestions
         }
 
 
+@final
 class HRMEngineException(ThinkMeshException):
     """Exceptions related to HRM engine operations"""
     
-    def __init__(self, message: str, error_code: ErrorCode, **kwargs):
-        if error_code.value < 1100 or error_code.value >= 1200:
-            raise ValueError("HRMEngineException requires HRM-specific error code")
-        super().__init__(message, error_code, **kwargs)
+    __slots__ = ()
+    _ALLOWED_CODES = _codes_in_range(1100, 1200)
+    _CODE_CATEGORY = "HRM-specific"
 
 
+@final
 class MultiAgentException(ThinkMeshException):
     """Exceptions related to multi-agent operations"""
     
-    def __init__(self, message: str, error_code: ErrorCode, **kwargs):
-        if error_code.value < 1200 or error_code.value >= 1300:
-            raise ValueError("MultiAgentException requires agent-specific error code")
-        super().__init__(message, error_code, **kwargs)
+    __slots__ = ()
+    _ALLOWED_CODES = _codes_in_range(1200, 1300)
+    _CODE_CATEGORY = "agent-specific"
 
 
+@final
 class VoiceInterfaceException(ThinkMeshException):
     """Exceptions related to voice interface operations"""
     
-    def __init__(self, message: str, error_code: ErrorCode, **kwargs):
-        if error_code.value < 1300 or error_code.value >= 1400:
-            raise ValueError("VoiceInterfaceException requires voice-specific error code")
-        super().__init__(message, error_code, **kwargs)
+    __slots__ = ()
+    _ALLOWED_CODES = _codes_in_range(1300, 1400)
+    _CODE_CATEGORY = "voice-specific"
 
 
+@final
 class LocalAIException(ThinkMeshException):
     """Exceptions related to local AI operations"""
     
-    def __init__(self, message: str, error_code: ErrorCode, **kwargs):
-        if error_code.value < 1400 or error_code.value >= 1500:
-            raise ValueError("LocalAIException requires local AI-specific error code")
-        super().__init__(message, error_code, **kwargs)
+    __slots__ = ()
+    _ALLOWED_CODES = _codes_in_range(1400, 1500)
+    _CODE_CATEGORY = "local AI-specific"
 
 
+@final
 class DataManagerException(ThinkMeshException):
     """Exceptions related to data management operations"""
     
-    def __init__(self, message: str, error_code: ErrorCode, **kwargs):
-        if error_code.value < 1500 or error_code.value >= 1600:
-            raise ValueError("DataManagerException requires data-specific error code")
-        super().__init__(message, error_code, **kwargs)
+    __slots__ = ()
+    _ALLOWED_CODES = _codes_in_range(1500, 1600)
+    _CODE_CATEGORY = "data-specific"
 
 
+@final
 class MobileOptimizationException(ThinkMeshException):
     """Exceptions related to mobile optimization"""
     
-    def __init__(self, message: str, error_code: ErrorCode, **kwargs):
-        if error_code.value < 1600 or error_code.value >= 1700:
-            raise ValueError("MobileOptimizationException requires mobile-specific error code")
-        super().__init__(message, error_code, **kwargs)
+    __slots__ = ()
+    _ALLOWED_CODES = _codes_in_range(1600, 1700)
+    _CODE_CATEGORY = "mobile-specific"
 
 
+@final
 class SecurityException(ThinkMeshException):
     """Exceptions related to security and privacy"""
     
-    def __init__(self, message: str, error_code: ErrorCode, **kwargs):
-        if error_code.value < 1700 or error_code.value >= 1800:
-            raise ValueError("SecurityException requires security-specific error code")
-        super().__init__(message, error_code, **kwargs)
+    __slots__ = ()
+    _ALLOWED_CODES = _codes_in_range(1700, 1800)
+    _CODE_CATEGORY = "security-specific"
+
+
+# Loggers used by handle_exception_gracefully, keyed by module name
+_handler_loggers: Dict[str, logging.Logger] = {}
+
+
+def _get_handler_logger(module_name: str) -> logging.Logger:
+    """Get (and cache) the logger for a decorated function's module"""
+    logger = _handler_loggers.get(module_name)
+    if logger is None:
+        logger = _handler_loggers.setdefault(module_name, get_logger(module_name))
+    return logger
 
 
 # Utility functions for exception handling
@@ -190,21 +307,14 @@ def handle_exception_gracefully(func):
             return await func(*args, **kwargs)
         except ThinkMeshException as e:
             # Log technical details
-            from .logging import get_logger
-            logger = get_logger(func.__module__)
-            logger.error(f"ThinkMesh error in {func.__name__}: {e.to_dict()}")
+            logger = _get_handler_logger(func.__module__)
+            logger.error(f"ThinkMesh error in {func.__name__}: {e.to_log_dict()}")
             
             # Return user-friendly error
-            return {
-                "success": False,
-                "error": e.user_message,
-                "error_code": e.error_code.value,
-                "recovery_suggestions": e.recovery_suggestions
-            }
+            return e.to_user_response()
         except Exception as e:
             # Handle unexpected errors
-            from .logging import get_logger
-            logger = get_logger(func.__module__)
+            logger = _get_handler_logger(func.__module__)
             logger.exception(f"Unexpected error in {func.__name__}: {str(e)}")
             
             return {
@@ -218,36 +328,8 @@ def handle_exception_gracefully(func):
 
 
 def create_recovery_suggestions(error_code: ErrorCode) -> list:
-    """Generate recovery suggestions based on error code"""
-    suggestions = {
-        ErrorCode.HRM_MODEL_LOAD_FAILED: [
-            "Check available storage space",
-            "Restart the app",
-            "Clear app cache",
-            "Update to latest version"
-        ],
-        ErrorCode.BATTERY_CRITICALLY_LOW: [
-            "Connect device to charger",
-            "Enable battery saver mode",
-            "Close other apps",
-            "Reduce ThinkMesh usage"
-        ],
-        ErrorCode.NETWORK_UNAVAILABLE: [
-            "Check WiFi connection",
-            "Try mobile data",
-            "Move to area with better signal",
-            "Continue using offline features"
-        ],
-        ErrorCode.MEMORY_PRESSURE_HIGH: [
-            "Close other apps",
-            "Restart device",
-            "Clear app cache",
-            "Free up device storage"
-        ]
-    }
+    """Generate recovery suggestions based on error code
     
-    return suggestions.get(error_code, [
-        "Restart the app",
-        "Check device resources",
-        "Contact support if issue persists"
-    ])
+    Returns a fresh list per call, copied from the shared interned tuples.
+    """
+    return list(_RECOVERY_SUGGESTIONS.get(error_code, _DEFAULT_RECOVERY_SUGGESTIONS))
@@ -10,8 +10,9 @@ import asyncio
 import time
 import psutil
 import platform
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from datetime import datetime, timedelta
 
 from .interfaces import IHealthCheck, ComponentStatus, HealthStatus
@@ -21,8 +22,31 @@ from .exceptions import ThinkMeshException, ErrorCode
 
 logger = get_logger(__name__)
 
+# Resource constraint flags reported by SystemMonitor.assess_resource_constraints
+_CRIT_MEMORY = 1 << 0
+_CRIT_CPU = 1 << 1
+_CRIT_DISK = 1 << 2
+_CRIT_BATTERY = 1 << 3
+_HIGH_MEMORY = 1 << 4
+_HIGH_CPU = 1 << 5
+_HIGH_DISK = 1 << 6
+_LOW_BATTERY = 1 << 7
+_HIGH_TEMPERATURE = 1 << 8
+_NO_NETWORK = 1 << 9
+_CRITICAL_MASK = _CRIT_MEMORY | _CRIT_CPU | _CRIT_DISK | _CRIT_BATTERY
 
-@dataclass
+# Shared read-only default for ComponentMetrics.custom_metrics
+_EMPTY_CUSTOM_METRICS: Mapping[str, Any] = MappingProxyType({})
+
+# Enum members are singletons, so status checks can use identity
+_HEALTHY = ComponentStatus.HEALTHY
+_UNHEALTHY = ComponentStatus.UNHEALTHY
+
+# Upper bound for the adaptive monitoring interval while everything is healthy
+_MAX_MONITORING_INTERVAL = 60.0
+
+
+@dataclass(slots=True, frozen=True)
 class SystemMetrics:
     """System performance metrics"""
     cpu_usage_percent: float
@@ -34,9 +58,23 @@ class SystemMetrics:
     temperature_celsius: Optional[float] = None
     network_connected: bool = True
     network_type: Optional[str] = None
+    
+    def _asdict(self) -> Dict[str, Any]:
+        """Shallow field dictionary (avoids dataclasses.asdict deep copies)"""
+        return {
+            "cpu_usage_percent": self.cpu_usage_percent,
+            "memory_usage_percent": self.memory_usage_percent,
+            "memory_available_mb": self.memory_available_mb,
+            "disk_usage_percent": self.disk_usage_percent,
+            "disk_available_gb": self.disk_available_gb,
+            "battery_level": self.battery_level,
+            "temperature_celsius": self.temperature_celsius,
+            "network_connected": self.network_connected,
+            "network_type": self.network_type
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComponentMetrics:
     """Individual component metrics"""
     component_name: str
@@ -47,7 +85,21 @@ class ComponentMetrics:
     error_count: int
     last_error: Optional[str] = None
     uptime_seconds: float = 0.0
-    custom_metrics: Dict[str, Any] = None
+    custom_metrics: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_CUSTOM_METRICS)
+    
+    def _asdict(self) -> Dict[str, Any]:
+        """Shallow field dictionary (avoids dataclasses.asdict deep copies)"""
+        return {
+            "component_name": self.component_name,
+            "status": self.status,
+            "response_time_ms": self.response_time_ms,
+            "memory_usage_mb": self.memory_usage_mb,
+            "cpu_usage_percent": self.cpu_usage_percent,
+            "error_count": self.error_count,
+            "last_error": self.last_error,
+            "uptime_seconds": self.uptime_seconds,
+            "custom_metrics": dict(self.custom_metrics)
+        }
 
 
 class SystemMonitor:
@@ -56,8 +108,17 @@ class SystemMonitor:
     def __init__(self):
         self.start_time = time.time()
         self._last_metrics = None
-        self._metrics_cache_duration = 5.0  # Cache for 5 seconds
+        self._metrics_cache_duration = 1.0  # CPU/memory drive status; refresh often
         self._last_metrics_time = 0
+        
+        # Slow-changing metrics (disk, battery, temperature, network) are cached longer
+        self._slow_metrics_cache_duration = 60.0
+        self._last_slow_metrics: Optional[Dict[str, Any]] = None
+        self._last_slow_metrics_time = 0
+        
+        # Prime psutil's CPU counters so later non-blocking calls return
+        # usage since the previous sample instead of sleeping
+        psutil.cpu_percent(interval=None)
     
     async def get_system_metrics(self) -> SystemMetrics:
         """Get current system performance metrics"""
@@ -69,77 +130,8 @@ class SystemMonitor:
             return self._last_metrics
         
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            
-            # Memory usage
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent
-            memory_available_mb = memory.available / (1024 * 1024)
-            
-            # Disk usage
-            disk = psutil.disk_usage('/')
-            disk_percent = (disk.used / disk.total) * 100
-            disk_available_gb = disk.free / (1024 * 1024 * 1024)
-            
-            # Battery (mobile devices)
-            battery_level = None
-            try:
-                battery = psutil.sensors_battery()
-                if battery:
-                    battery_level = battery.percent
-            except (AttributeError, NotImplementedError):
-                pass
-            
-            # Temperature (if available)
-            temperature = None
-            try:
-                temps = psutil.sensors_temperatures()
-                if temps:
-                    # Get first available temperature sensor
-                    for sensor_name, sensor_list in temps.items():
-                        if sensor_list:
-                            temperature = sensor_list[0].current
-                            break
-            except (AttributeError, NotImplementedError):
-                pass
-            
-            # Network connectivity
-            network_connected = True
-            network_type = None
-            try:
-                network_stats = psutil.net_if_stats()
-                active_interfaces = [
-                    name for name, stats in network_stats.items() 
-                    if stats.isup and name != 'lo'
-                ]
-                network_connected = len(active_interfaces) > 0
-                
-                if network_connected:
-                    # Determine network type (simplified)
-                    if any('wifi' in iface.lower() or 'wlan' in iface.lower() 
-                          for iface in active_interfaces):
-                        network_type = 'wifi'
-                    elif any('eth' in iface.lower() or 'en' in iface.lower() 
-                            for iface in active_interfaces):
-                        network_type = 'ethernet'
-                    else:
-                        network_type = 'cellular'
-                        
-            except Exception:
-                pass
-            
-            metrics = SystemMetrics(
-                cpu_usage_percent=cpu_percent,
-                memory_usage_percent=memory_percent,
-                memory_available_mb=memory_available_mb,
-                disk_usage_percent=disk_percent,
-                disk_available_gb=disk_available_gb,
-                battery_level=battery_level,
-                temperature_celsius=temperature,
-                network_connected=network_connected,
-                network_type=network_type
-            )
+            # psutil reads /proc (or platform equivalents); keep it off the event loop
+            metrics = await asyncio.to_thread(self._collect_sync, current_time)
             
             # Cache metrics
             self._last_metrics = metrics
@@ -158,56 +150,163 @@ class SystemMonitor:
                 disk_available_gb=0.0
             )
     
+    def _collect_sync(self, current_time: float) -> SystemMetrics:
+        """Collect system metrics synchronously (runs in a worker thread)"""
+        # CPU usage since the previous sample (non-blocking)
+        cpu_percent = psutil.cpu_percent(interval=None)
+        
+        # Memory usage
+        memory = psutil.virtual_memory()
+        memory_percent = memory.percent
+        memory_available_mb = memory.available / (1024 * 1024)
+        
+        # Disk, battery, temperature and network change slowly
+        slow_metrics = self._get_slow_metrics(current_time)
+        
+        return SystemMetrics(
+            cpu_usage_percent=cpu_percent,
+            memory_usage_percent=memory_percent,
+            memory_available_mb=memory_available_mb,
+            **slow_metrics
+        )
+    
+    def _get_slow_metrics(self, current_time: float) -> Dict[str, Any]:
+        """Get disk, battery, temperature and network state, cached for longer than CPU/memory"""
+        if (self._last_slow_metrics is not None and
+            current_time - self._last_slow_metrics_time < self._slow_metrics_cache_duration):
+            return self._last_slow_metrics
+        
+        # Disk usage
+        disk = psutil.disk_usage('/')
+        disk_percent = (disk.used / disk.total) * 100
+        disk_available_gb = disk.free / (1024 * 1024 * 1024)
+        
+        # Battery (mobile devices)
+        battery_level = None
+        try:
+            battery = psutil.sensors_battery()
+            if battery:
+                battery_level = battery.percent
+        except (AttributeError, NotImplementedError):
+            pass
+        
+        # Temperature (if available)
+        temperature = None
+        try:
+            temps = psutil.sensors_temperatures()
+            if temps:
+                # Get first available temperature sensor
+                temperature = next(
+                    (sensor_list[0].current for sensor_list in temps.values() if sensor_list),
+                    None
+                )
+        except (AttributeError, NotImplementedError):
+            pass
+        
+        # Network connectivity
+        network_connected = True
+        network_type = None
+        try:
+            # Single pass: wifi takes precedence, then ethernet, else cellular
+            network_connected = False
+            has_ethernet = False
+            for name, stats in psutil.net_if_stats().items():
+                if not stats.isup or name == 'lo':
+                    continue
+                network_connected = True
+                lname = name.lower()
+                if 'wifi' in lname or 'wlan' in lname:
+                    network_type = 'wifi'
+                    break
+                if not has_ethernet and ('eth' in lname or 'en' in lname):
+                    has_ethernet = True
+            
+            if network_connected and network_type is None:
+                network_type = 'ethernet' if has_ethernet else 'cellular'
+                    
+        except Exception:
+            pass
+        
+        slow_metrics = {
+            "disk_usage_percent": disk_percent,
+            "disk_available_gb": disk_available_gb,
+            "battery_level": battery_level,
+            "temperature_celsius": temperature,
+            "network_connected": network_connected,
+            "network_type": network_type
+        }
+        self._last_slow_metrics = slow_metrics
+        self._last_slow_metrics_time = current_time
+        return slow_metrics
+    
     def get_uptime_seconds(self) -> float:
         """Get system uptime in seconds"""
         return time.time() - self.start_time
     
     async def check_resource_constraints(self) -> List[str]:
         """Check for resource constraints that might affect performance"""
+        _, constraints = await self.assess_resource_constraints()
+        return constraints
+    
+    async def assess_resource_constraints(self) -> Tuple[int, List[str]]:
+        """Check resource constraints, returning a constraint bitmask and messages"""
+        mask = 0
         constraints = []
         metrics = await self.get_system_metrics()
         
         # Memory constraints
         if metrics.memory_usage_percent > 90:
+            mask |= _CRIT_MEMORY
             constraints.append("Critical memory usage")
         elif metrics.memory_usage_percent > 80:
+            mask |= _HIGH_MEMORY
             constraints.append("High memory usage")
         
         # CPU constraints
         if metrics.cpu_usage_percent > 90:
+            mask |= _CRIT_CPU
             constraints.append("Critical CPU usage")
         elif metrics.cpu_usage_percent > 80:
+            mask |= _HIGH_CPU
             constraints.append("High CPU usage")
         
         # Disk constraints
         if metrics.disk_usage_percent > 95:
+            mask |= _CRIT_DISK
             constraints.append("Critical disk usage")
         elif metrics.disk_usage_percent > 90:
+            mask |= _HIGH_DISK
             constraints.append("High disk usage")
         
         # Battery constraints (mobile)
         if metrics.battery_level is not None:
             if metrics.battery_level < 10:
+                mask |= _CRIT_BATTERY
                 constraints.append("Critical battery level")
             elif metrics.battery_level < 20:
+                mask |= _LOW_BATTERY
                 constraints.append("Low battery level")
         
         # Temperature constraints
         if metrics.temperature_celsius is not None:
             if metrics.temperature_celsius > 80:
+                mask |= _HIGH_TEMPERATURE
                 constraints.append("High device temperature")
         
         # Network constraints
         if not metrics.network_connected:
+            mask |= _NO_NETWORK
             constraints.append("No network connectivity")
         
-        return constraints
+        return mask, constraints
 
 
 class ComponentHealthTracker:
     """Track health status of individual components"""
     
     def __init__(self):
+        # Latest metrics per component; instances are frozen, so readers
+        # share them instead of getting copies
         self.components: Dict[str, ComponentMetrics] = {}
         self.error_counts: Dict[str, int] = {}
         self.last_errors: Dict[str, str] = {}
@@ -245,7 +344,7 @@ class ComponentHealthTracker:
             
             uptime = time.time() - self.start_times.get(component_name, time.time())
             
-            metrics = ComponentMetrics(
+            self.components[component_name] = ComponentMetrics(
                 component_name=component_name,
                 status=status,
                 response_time_ms=response_time_ms,
@@ -257,8 +356,6 @@ class ComponentHealthTracker:
                 custom_metrics=custom_metrics
             )
             
-            self.components[component_name] = metrics
-            
         except Exception as e:
             logger.error(f"Failed to update metrics for {component_name}: {e}")
     
@@ -268,23 +365,13 @@ class ComponentHealthTracker:
         """Determine component health status based on metrics"""
         error_count = self.error_counts.get(component_name, 0)
         
-        # Critical conditions
-        if error_count > 10:
-            return ComponentStatus.UNHEALTHY
-        if response_time_ms > 5000:  # 5 second response time
+        # Thresholds: >10 errors, >5s response time, >1GB memory are critical;
+        # >5 errors, >2s response time, >500MB memory are degraded
+        critical = (error_count > 10) | (response_time_ms > 5000) | (memory_usage_mb > 1000)
+        if critical:
             return ComponentStatus.UNHEALTHY
-        if memory_usage_mb > 1000:  # 1GB memory usage
-            return ComponentStatus.UNHEALTHY
-        
-        # Degraded conditions
-        if error_count > 5:
-            return ComponentStatus.DEGRADED
-        if response_time_ms > 2000:  # 2 second response time
-            return ComponentStatus.DEGRADED
-        if memory_usage_mb > 500:  # 500MB memory usage
-            return ComponentStatus.DEGRADED
-        
-        return ComponentStatus.HEALTHY
+        degraded = (error_count > 5) | (response_time_ms > 2000) | (memory_usage_mb > 500)
+        return ComponentStatus.DEGRADED if degraded else ComponentStatus.HEALTHY
     
     def get_component_metrics(self, component_name: str) -> Optional[ComponentMetrics]:
         """Get metrics for a specific component"""
@@ -293,6 +380,12 @@ class ComponentHealthTracker:
     def get_all_components(self) -> Dict[str, ComponentMetrics]:
         """Get metrics for all components"""
         return self.components.copy()
+    
+    def get_all_components_as_dicts(self) -> Dict[str, Dict[str, Any]]:
+        """Get metrics for all components as plain dictionaries"""
+        return {
+            name: metrics._asdict() for name, metrics in self.components.items()
+        }
 
 
 class HealthChecker:
@@ -304,6 +397,7 @@ class HealthChecker:
         self.registered_health_checks: Dict[str, IHealthCheck] = {}
         self.config = get_config()
         self._health_check_task: Optional[asyncio.Task] = None
+        self._healthy_streak = 0
     
     def register_health_check(self, component_name: str, 
                             health_check: IHealthCheck) -> None:
@@ -333,71 +427,96 @@ class HealthChecker:
         logger.info("Stopped health monitoring")
     
     async def _monitoring_loop(self) -> None:
-        """Continuous monitoring loop"""
-        interval = self.config.monitoring.health_check_interval_seconds
+        """Continuous monitoring loop with severity-adaptive interval"""
+        base_interval = self.config.monitoring.health_check_interval_seconds
         
         while True:
             try:
-                await self.check_all_components()
-                await asyncio.sleep(interval)
+                results = await self.check_all_components()
+                await asyncio.sleep(self._next_monitoring_interval(results, base_interval))
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
-                await asyncio.sleep(interval)
+                self._healthy_streak = 0
+                await asyncio.sleep(base_interval)
+    
+    def _next_monitoring_interval(self, results: Dict[str, HealthStatus],
+                                  base_interval: float) -> float:
+        """Back off while everything is healthy; sample faster when unhealthy"""
+        statuses = [result.status for result in results.values()]
+        if all(status is _HEALTHY for status in statuses):
+            self._healthy_streak += 1
+            max_interval = max(base_interval, _MAX_MONITORING_INTERVAL)
+            return min(base_interval * 2 ** min(self._healthy_streak, 4), max_interval)
+        
+        self._healthy_streak = 0
+        if any(status is _UNHEALTHY for status in statuses):
+            return base_interval / 2
+        return base_interval
     
     async def check_all_components(self) -> Dict[str, HealthStatus]:
         """Check health of all registered components"""
-        results = {}
-        
-        # Check system health
-        system_status = await self._check_system_health()
-        results["system"] = system_status
+        component_names = list(self.registered_health_checks)
         
-        # Check individual components
-        for component_name, health_check in self.registered_health_checks.items():
-            try:
-                start_time = time.time()
-                status = await health_check.check_health()
-                response_time = (time.time() - start_time) * 1000  # Convert to ms
-                
-                # Get component metrics
-                metrics = await health_check.get_metrics()
-                metrics['response_time_ms'] = response_time
-                
-                # Update component tracker
-                await self.component_tracker.update_component_metrics(
-                    component_name, metrics
-                )
-                
-                results[component_name] = status
-                
-            except Exception as e:
-                # Record error and create unhealthy status
-                error_msg = f"Health check failed: {str(e)}"
-                self.component_tracker.record_error(component_name, error_msg)
-                
-                results[component_name] = HealthStatus(
-                    status=ComponentStatus.UNHEALTHY,
-                    message=error_msg,
-                    details={"exception": str(e)},
-                    timestamp=time.time(),
-                    component_name=component_name
-                )
+        # Check system health and all components concurrently
+        statuses = await asyncio.gather(
+            self._check_system_health(),
+            *(self._check_component(name, self.registered_health_checks[name])
+              for name in component_names)
+        )
         
+        results = {"system": statuses[0]}
+        results.update(zip(component_names, statuses[1:]))
         return results
     
+    async def _check_component(self, component_name: str,
+                               health_check: IHealthCheck) -> HealthStatus:
+        """Check a single component, recording metrics or errors"""
+        timeout = self.config.monitoring.health_check_timeout_seconds
+        try:
+            start_time = time.time()
+            status = await asyncio.wait_for(health_check.check_health(), timeout)
+            response_time = (time.time() - start_time) * 1000  # Convert to ms
+            
+            # Get component metrics
+            metrics = await asyncio.wait_for(health_check.get_metrics(), timeout)
+            metrics['response_time_ms'] = response_time
+            
+            # Update component tracker
+            await self.component_tracker.update_component_metrics(
+                component_name, metrics
+            )
+            
+            return status
+            
+        except Exception as e:
+            # Record error and create unhealthy status
+            if isinstance(e, asyncio.TimeoutError):
+                error_msg = f"Health check timed out after {timeout}s"
+            else:
+                error_msg = f"Health check failed: {str(e)}"
+            self.component_tracker.record_error(component_name, error_msg)
+            
+            return HealthStatus(
+                status=ComponentStatus.UNHEALTHY,
+                message=error_msg,
+                details={"exception": str(e)},
+                timestamp=time.time(),
+                component_name=component_name
+            )
+    
     async def _check_system_health(self) -> HealthStatus:
         """Check overall system health"""
         try:
             metrics = await self.system_monitor.get_system_metrics()
-            constraints = await self.system_monitor.check_resource_constraints()
+            constraint_mask, constraints = await self.system_monitor.assess_resource_constraints()
             
             # Determine overall system status
-            if any("Critical" in constraint for constraint in constraints):
+            if constraint_mask & _CRITICAL_MASK:
                 status = ComponentStatus.UNHEALTHY
                 message = f"Critical system issues: {', '.join(constraints)}"
-            elif constraints:
+            elif constraint_mask:
                 status = ComponentStatus.DEGRADED
                 message = f"System constraints: {', '.join(constraints)}"
             else:
@@ -407,7 +526,7 @@ class HealthChecker:
             return HealthStatus(
                 status=status,
                 message=message,
-                details=asdict(metrics),
+                details=metrics._asdict(),
                 timestamp=time.time(),
                 component_name="system"
             )
@@ -425,23 +544,20 @@ class HealthChecker:
         """Get comprehensive health summary"""
         health_results = await self.check_all_components()
         system_metrics = await self.system_monitor.get_system_metrics()
-        component_metrics = self.component_tracker.get_all_components()
+        component_metrics = self.component_tracker.get_all_components_as_dicts()
         
         # Calculate overall health score
-        healthy_count = sum(1 for status in health_results.values() 
-                          if status.status == ComponentStatus.HEALTHY)
+        healthy_count = sum(status.status is _HEALTHY for status in health_results.values())
         total_count = len(health_results)
         health_score = (healthy_count / total_count * 100) if total_count > 0 else 0
         
         return {
             "overall_health_score": health_score,
-            "system_metrics": asdict(system_metrics),
+            "system_metrics": system_metrics._asdict(),
             "component_health": {
-                name: asdict(status) for name, status in health_results.items()
-            },
-            "component_metrics": {
-                name: asdict(metrics) for name, metrics in component_metrics.items()
+                name: status._asdict() for name, status in health_results.items()
             },
+            "component_metrics": component_metrics,
             "uptime_seconds": self.system_monitor.get_uptime_seconds(),
             "timestamp": time.time()
         }
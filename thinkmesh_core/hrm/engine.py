@@ -7,10 +7,15 @@ with mobile optimization and privacy-first design.
 """
 
 import asyncio
+import itertools
+import logging
+import mmap
+import os
 import time
 import json
-from typing import Dict, Any, List, Optional, Union
-from dataclasses import dataclass
+from collections.abc import Mapping
+from typing import Callable, Dict, Any, Iterator, List, Optional, Set, Tuple, Union
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
 from ..interfaces import IAIEngine, IHealthCheck, ComponentStatus, HealthStatus, UserContext
@@ -23,10 +28,77 @@ from .task_executor import TaskExecutor
 from .learning_engine import LearningEngine
 from .mobile_optimizer import HRMMobileOptimizer
 
+# Optional imports for device state sampling
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+# Average sensor temperature (Celsius) at or above which each thermal state applies
+_THERMAL_LEVELS_C: Tuple[Tuple[float, str], ...] = (
+    (90.0, "critical"),
+    (80.0, "hot"),
+    (60.0, "warm")
+)
+
+# Capabilities are fixed once the config is applied, so they are built once
+_BASE_CAPABILITIES: Tuple[str, ...] = (
+    "hierarchical_reasoning",
+    "strategic_planning",
+    "task_execution",
+    "continuous_learning",
+    "mobile_optimization",
+    "battery_awareness",
+    "thermal_management",
+    "privacy_preservation",
+    "offline_operation"
+)
+_MOBILE_CAPABILITIES: Tuple[str, ...] = (
+    "adaptive_quantization",
+    "memory_pressure_handling",
+    "performance_scaling"
+)
+
+
+class _LazyDict(Mapping):
+    """Read-only mapping that builds its contents on first access"""
+    
+    def __init__(self, factory: Callable[[], Dict[str, Any]]):
+        self._factory = factory
+        self._cached: Optional[Dict[str, Any]] = None
+    
+    def _resolve(self) -> Dict[str, Any]:
+        if self._cached is None:
+            self._cached = self._factory()
+        return self._cached
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._resolve()[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._resolve())
+    
+    def __len__(self) -> int:
+        return len(self._resolve())
+    
+    def __repr__(self) -> str:
+        return repr(self._resolve())
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class _DeviceReading:
+    """One psutil sample; battery and thermal state are None when not reported"""
+    process_rss_mb: float
+    process_cpu_percent: float
+    memory_pressure: float  # 0.0 to 1.0, system-wide
+    battery_level: Optional[float]  # 0 to 100
+    thermal_state: Optional[str]
+
+
+@dataclass(slots=True)
 class HRMRequest:
     """HRM processing request structure"""
     user_input: str
@@ -36,7 +108,7 @@ class HRMRequest:
     mobile_constraints: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HRMResponse:
     """HRM processing response structure"""
     response: str
@@ -47,6 +119,74 @@ class HRMResponse:
     strategy_used: str
     learning_applied: bool
     mobile_optimizations: Dict[str, Any]
+    
+    def __post_init__(self):
+        # Keep only the most recent reasoning steps
+        if len(self.reasoning_path) > HRMEngine.MAX_REASONING_PATH:
+            self.reasoning_path = self.reasoning_path[-HRMEngine.MAX_REASONING_PATH:]
+
+
+class ReasoningPipeline:
+    """
+    Planning, execution and learning run as a single stage
+    
+    Each batch of requests is planned and executed in one pass and learning is
+    scheduled in the background, so the engine awaits one call per batch
+    instead of one per phase.
+    """
+    
+    def __init__(self, planner: StrategicPlanner, executor: TaskExecutor,
+                 learner: LearningEngine):
+        self.planner = planner
+        self.executor = executor
+        self.learner = learner
+        
+        # Background learning tasks (kept referenced so they are not GC'd)
+        self.pending_learning: Set[asyncio.Task] = set()
+    
+    async def run_batch(
+        self, requests: List[HRMRequest]
+    ) -> List[Union[Tuple[Dict[str, Any], Dict[str, Any], bool], BaseException]]:
+        """Return (strategy, result, learning_applied) or the failure, per request"""
+        outcomes: List[Any] = await self.planner.create_strategy_batch([
+            (request.user_input, request.context, request.mobile_constraints)
+            for request in requests
+        ])
+        
+        planned = [i for i, plan in enumerate(outcomes) if not isinstance(plan, BaseException)]
+        results = await self.executor.execute_strategy_batch([
+            (outcomes[i], requests[i].context) for i in planned
+        ])
+        
+        for i, result in zip(planned, results):
+            if isinstance(result, BaseException):
+                outcomes[i] = result
+                continue
+            
+            strategy = outcomes[i]
+            self._schedule_learning(requests[i], strategy, result)
+            outcomes[i] = (strategy, result, False)  # Learning completes after the response
+        
+        return outcomes
+    
+    def _schedule_learning(self, request: HRMRequest, strategy: Dict[str, Any],
+                           result: Dict[str, Any]) -> None:
+        """Learn from the interaction in the background; the response does not depend on it"""
+        learning_task = asyncio.create_task(
+            self.learner.learn_from_interaction(
+                request=request.user_input,
+                strategy=strategy,
+                result=result,
+                context=request.context
+            )
+        )
+        self.pending_learning.add(learning_task)
+        learning_task.add_done_callback(self.pending_learning.discard)
+    
+    async def wait_for_learning(self) -> None:
+        """Wait for in-flight background learning to finish"""
+        if self.pending_learning:
+            await asyncio.gather(*self.pending_learning, return_exceptions=True)
 
 
 @log_component_lifecycle("hrm_engine")
@@ -61,6 +201,16 @@ class HRMEngine(IAIEngine, IHealthCheck):
     - Mobile optimization with battery awareness
     """
     
+    # Smoothing factor for the response time exponential moving average
+    _EMA_ALPHA = 0.1
+    
+    # Average response time above which the engine reports as degraded
+    HEALTHY_RT_THRESHOLD_MS = 5000.0
+    
+    # Bounds on diagnostic state retained across long-running sessions
+    MAX_LAST_ERROR_CHARS = 512
+    MAX_REASONING_PATH = 32
+    
     def __init__(self, config: HRMConfig):
         self.config = config
         self.is_initialized = False
@@ -75,13 +225,40 @@ class HRMEngine(IAIEngine, IHealthCheck):
         # Performance tracking
         self.total_requests = 0
         self.successful_requests = 0
+        self._total_counter = itertools.count(1)  # Increments atomically under the GIL
+        self._success_counter = itertools.count(1)
+        self._success_rate = 0.0  # Refreshed whenever the counters change
         self.average_response_time = 0.0
         self.last_error: Optional[str] = None
         
+        # Fused planning/execution/learning stage, built in initialize()
+        self._pipeline: Optional[ReasoningPipeline] = None
+        
+        # Process resource usage and device state sampled by a background
+        # task, started in initialize() when psutil is available
+        self._last_rss_mb = 0.0
+        self._last_cpu_pct = 0.0
+        self._sampler_task: Optional[asyncio.Task] = None
+        self._process = psutil.Process() if PSUTIL_AVAILABLE else None
+        
+        # Micro-batching of planning and execution, started in initialize()
+        self._batch_queue: Optional["asyncio.Queue[Tuple[HRMRequest, asyncio.Future]]"] = None
+        self._batcher_task: Optional[asyncio.Task] = None
+        
+        # Capabilities derived from config, refreshed in initialize()
+        self._capabilities: Tuple[str, ...] = self._build_capabilities()
+        
+        # Model file location, resolved once in initialize()
+        self._model_path: Optional[Path] = None
+        self._model_exists = False
+        self._model_mmap: Optional[mmap.mmap] = None
+        self._loaded_model_path: Optional[Path] = None  # Thermal variant actually mapped
+        self._loaded_quantization: Optional[str] = None
+        
         # Mobile state
         self.current_performance_mode = "normal"  # low, normal, high
         self.battery_level = 100.0
-        self.thermal_state = "normal"  # normal, warm, hot
+        self.thermal_state = "normal"  # normal, warm, hot, critical
         
         logger.info("HRM Engine created")
     
@@ -99,6 +276,7 @@ class HRMEngine(IAIEngine, IHealthCheck):
                 for key, value in config.items():
                     if hasattr(self.config, key):
                         setattr(self.config, key, value)
+                self._capabilities = self._build_capabilities()
             
             # Initialize mobile optimizer first (affects other components)
             self.mobile_optimizer = HRMMobileOptimizer(self.config)
@@ -108,19 +286,36 @@ class HRMEngine(IAIEngine, IHealthCheck):
             await self._initialize_strategic_planner()
             await self._initialize_task_executor()
             await self._initialize_learning_engine()
+            self._pipeline = ReasoningPipeline(
+                self.strategic_planner, self.task_executor, self.learning_engine
+            )
+            
+            # Resolve the model file once; loading and optimization reuse it
+            self._model_path = Path(self.config.model_path).resolve(strict=False)
+            self._model_exists = self._model_path.is_file()
+            
+            # Sample the device before loading so quantization sees real
+            # battery and thermal readings; without psutil there is no source
+            # and the defaults stand
+            if PSUTIL_AVAILABLE:
+                await self._sample_device()
             
             # Load the HRM model
             await self._load_hrm_model()
             
+            # Keep the device readings fresh in the background
+            if PSUTIL_AVAILABLE:
+                self._sampler_task = asyncio.create_task(self._sample_loop())
+            
             self.is_initialized = True
             logger.info("HRM Engine initialized successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize HRM Engine: {e}")
+            logger.error("Failed to initialize HRM Engine: %s", e)
             raise HRMEngineException(
                 f"HRM Engine initialization failed: {str(e)}",
                 ErrorCode.HRM_MODEL_LOAD_FAILED,
-                details={"error": str(e), "config": self.config.__dict__}
+                details={"error": str(e), "config": _LazyDict(lambda: asdict(self.config))}
             )
     
     async def _initialize_strategic_planner(self) -> None:
@@ -153,40 +348,89 @@ class HRMEngine(IAIEngine, IHealthCheck):
     async def _load_hrm_model(self) -> None:
         """Load the HRM model with mobile optimizations"""
         try:
-            model_path = Path(self.config.model_path)
+            model_path = self._model_path
             
-            if not model_path.exists():
+            if not self._model_exists:
                 raise HRMEngineException(
                     f"HRM model not found at {model_path}",
                     ErrorCode.HRM_MODEL_LOAD_FAILED,
                     details={"model_path": str(model_path)}
                 )
             
+            # Pick the quantization scheme for the current device state
+            quantization = self._select_quantization()
+            logger.info("Selected %s quantization for HRM model", quantization)
+            
             # Apply mobile optimizations before loading
             optimized_config = await self.mobile_optimizer.optimize_model_loading(
-                model_path=str(model_path),
-                quantization=self.config.quantization,
+                model_path=model_path,
+                quantization=quantization,
                 memory_limit_mb=self.config.memory_limit_mb
             )
             
             # Load model with optimized configuration
             # Note: This would integrate with actual model loading library (e.g., llama-cpp-python)
-            logger.info(f"Loading HRM model from {model_path} with config: {optimized_config}")
+            logger.info("Loading HRM model from %s with config: %s", model_path, optimized_config)
+            
+            # Map the weights read-only instead of reading them into memory;
+            # pages are faulted in on demand and shared across processes.
+            # A hot device starts on the smaller variant picked for it
+            load_path = Path(optimized_config.get("model_variant") or model_path)
+            self._model_mmap = self._mmap_model(load_path)
+            self._loaded_model_path = load_path
             
             # Simulate model loading for now
             await asyncio.sleep(0.1)  # Simulate loading time
             
+            self._loaded_quantization = quantization
             self.model_loaded = True
             logger.info("HRM model loaded successfully")
             
+            # Start coalescing concurrent requests into batches
+            self._batch_queue = asyncio.Queue()
+            self._batcher_task = asyncio.create_task(self._batch_loop())
+            
         except Exception as e:
-            logger.error(f"Failed to load HRM model: {e}")
+            logger.error("Failed to load HRM model: %s", e)
             raise HRMEngineException(
                 f"HRM model loading failed: {str(e)}",
                 ErrorCode.HRM_MODEL_LOAD_FAILED,
                 details={"error": str(e), "model_path": self.config.model_path}
             )
     
+    def _select_quantization(self) -> str:
+        """Choose a more aggressive quantization on low battery or when hot"""
+        if self.battery_level < 30 or self.thermal_state in ("hot", "critical"):
+            return "INT4"
+        return self.config.quantization or "INT8"
+    
+    def _mmap_model(self, path: Path) -> Optional[mmap.mmap]:
+        """Memory-map the model file read-only for the inference backend
+        
+        Returns None for an empty file, which cannot be mapped; loading then
+        proceeds without a mapping.
+        """
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            if os.fstat(fd).st_size == 0:
+                logger.warning("HRM model file %s is empty; loading without mmap", path)
+                return None
+            
+            # Start reading the weights into the page cache now so the first
+            # inference does not stall on flash reads (Linux/Android only)
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            model_map = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)  # The mapping keeps its own reference to the file
+        
+        # Every inference pass reads all the weights, so ask for the whole
+        # mapping to be paged in as well, in line with the fadvise above
+        if hasattr(mmap, "MADV_WILLNEED"):
+            model_map.madvise(mmap.MADV_WILLNEED)
+        
+        return model_map
+    
     @log_function_call()
     async def process_request(self, request: str, context: UserContext) -> str:
         """Process a user request using hierarchical reasoning"""
@@ -196,40 +440,26 @@ class HRMEngine(IAIEngine, IHealthCheck):
                 ErrorCode.HRM_INFERENCE_FAILED
             )
         
-        start_time = time.time()
-        self.total_requests += 1
+        start_ns = time.perf_counter_ns()  # Monotonic; unaffected by clock adjustments
+        self.total_requests = next(self._total_counter)
+        self._success_rate = self.successful_requests / self.total_requests
         
         try:
             # Create HRM request
             hrm_request = HRMRequest(
                 user_input=request,
                 context=context,
-                mobile_constraints=await self._get_mobile_constraints()
+                mobile_constraints=self._get_mobile_constraints()
             )
             
             # Apply mobile optimizations
             optimized_request = await self.mobile_optimizer.optimize_request(hrm_request)
             
-            # Strategic planning phase (high-level, abstract)
-            strategic_plan = await self.strategic_planner.create_strategy(
-                request=optimized_request.user_input,
-                context=optimized_request.context,
-                constraints=optimized_request.mobile_constraints
-            )
-            
-            # Task execution phase (low-level, specific)
-            execution_result = await self.task_executor.execute_strategy(
-                strategy=strategic_plan,
-                context=optimized_request.context
-            )
-            
-            # Apply learning from interaction
-            learning_applied = await self.learning_engine.learn_from_interaction(
-                request=optimized_request.user_input,
-                strategy=strategic_plan,
-                result=execution_result,
-                context=optimized_request.context
-            )
+            # Strategic planning (high-level, abstract), task execution
+            # (low-level, specific) and learning, batched with concurrent requests
+            future = asyncio.get_running_loop().create_future()
+            self._batch_queue.put_nowait((optimized_request, future))
+            strategic_plan, execution_result, learning_applied = await future
             
             # Generate final response
             response = await self._generate_response(
@@ -239,56 +469,103 @@ class HRMEngine(IAIEngine, IHealthCheck):
             )
             
             # Update performance metrics
-            execution_time = (time.time() - start_time) * 1000  # Convert to ms
-            self._update_performance_metrics(execution_time, success=True)
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e6  # Convert to ms
+            self.average_response_time += self._EMA_ALPHA * (execution_time - self.average_response_time)
+            self.successful_requests = next(self._success_counter)
+            self._success_rate = self.successful_requests / self.total_requests
             
-            self.successful_requests += 1
-            
-            logger.info(f"HRM request processed successfully in {execution_time:.2f}ms")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("HRM request processed successfully in %.2fms", execution_time)
             return response
             
         except Exception as e:
-            execution_time = (time.time() - start_time) * 1000
-            self._update_performance_metrics(execution_time, success=False)
-            self.last_error = str(e)
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e6
+            self.average_response_time += self._EMA_ALPHA * (execution_time - self.average_response_time)
+            self.last_error = str(e)[:self.MAX_LAST_ERROR_CHARS]
             
-            logger.error(f"HRM request processing failed: {e}")
+            logger.error("HRM request processing failed: %s", e)
             raise HRMEngineException(
                 f"HRM inference failed: {str(e)}",
                 ErrorCode.HRM_INFERENCE_FAILED,
                 details={"request": request, "error": str(e)}
             )
     
-    async def _get_mobile_constraints(self) -> Dict[str, Any]:
-        """Get current mobile device constraints"""
-        return await self.mobile_optimizer.get_current_constraints()
+    async def _batch_loop(self) -> None:
+        """Collect queued requests into batches and run them together"""
+        loop = asyncio.get_running_loop()
+        window = self.config.batch_window_ms / 1000
+        max_batch = max(self.config.max_batch_size, 1)
+        
+        while True:
+            batch = [await self._batch_queue.get()]
+            # A lone request runs at once; waiting would only add latency.
+            # Concurrent requests coalesce for up to the window
+            deadline = loop.time() + window if not self._batch_queue.empty() else 0.0
+            
+            try:
+                # Flush on either a full batch or the end of the coalescing window
+                while len(batch) < max_batch:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._batch_queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                
+                await self._run_batch(batch)
+            except asyncio.CancelledError:
+                # Shutting down: requests already taken off the queue, whether
+                # still collecting or in flight, are cancelled too
+                for _, future in batch:
+                    if not future.done():
+                        future.cancel()
+                raise
+            except Exception as e:
+                logger.error("HRM batch processing failed: %s", e)
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+    
+    async def _run_batch(self, batch: List[Tuple[HRMRequest, asyncio.Future]]) -> None:
+        """Run a batch through the reasoning pipeline, resolving each caller's future"""
+        outcomes = await self._pipeline.run_batch([request for request, _ in batch])
+        
+        for (_, future), outcome in zip(batch, outcomes):
+            if isinstance(outcome, BaseException):
+                self._fail_future(future, outcome)
+            elif not future.done():
+                future.set_result(outcome)
+    
+    @staticmethod
+    def _fail_future(future: asyncio.Future, error: BaseException) -> None:
+        """Propagate a per-request failure to the waiting caller"""
+        if future.done():
+            return
+        if isinstance(error, asyncio.CancelledError):
+            future.cancel()
+        else:
+            future.set_exception(error)
+    
+    def _get_mobile_constraints(self) -> Dict[str, Any]:
+        """Get current mobile device constraints (shared snapshot, read-only)"""
+        return self.mobile_optimizer.get_current_constraints_snapshot()
     
     async def _generate_response(self, strategic_plan: Dict[str, Any], 
                                execution_result: Dict[str, Any],
                                learning_applied: bool) -> str:
         """Generate final response from strategic plan and execution result"""
         # Combine strategic insights with execution details
-        response_parts = []
-        
-        if strategic_plan.get("user_message"):
-            response_parts.append(strategic_plan["user_message"])
-        
-        if execution_result.get("response"):
-            response_parts.append(execution_result["response"])
+        m = strategic_plan.get("user_message")
+        r = execution_result.get("response")
+        li = execution_result.get("learning_insights") if learning_applied else None
         
-        if learning_applied and execution_result.get("learning_insights"):
-            response_parts.append(execution_result["learning_insights"])
-        
-        return " ".join(response_parts) if response_parts else "I understand your request and I'm working on it."
-    
-    def _update_performance_metrics(self, execution_time_ms: float, success: bool) -> None:
-        """Update performance tracking metrics"""
-        # Update average response time (exponential moving average)
-        alpha = 0.1  # Smoothing factor
-        self.average_response_time = (
-            alpha * execution_time_ms + 
-            (1 - alpha) * self.average_response_time
-        )
+        if m and r:
+            return f"{m} {r} {li}" if li else f"{m} {r}"
+        if m or r:
+            head = m or r
+            return f"{head} {li}" if li else head
+        return li or "I understand your request and I'm working on it."
     
     async def learn_from_interaction(self, request: str, response: str, 
                                    feedback: Optional[Dict[str, Any]] = None) -> None:
@@ -306,30 +583,17 @@ class HRMEngine(IAIEngine, IHealthCheck):
             logger.debug("Learning from interaction completed")
             
         except Exception as e:
-            logger.error(f"Failed to learn from interaction: {e}")
+            logger.error("Failed to learn from interaction: %s", e)
     
     async def get_capabilities(self) -> List[str]:
         """Get list of HRM engine capabilities"""
-        capabilities = [
-            "hierarchical_reasoning",
-            "strategic_planning", 
-            "task_execution",
-            "continuous_learning",
-            "mobile_optimization",
-            "battery_awareness",
-            "thermal_management",
-            "privacy_preservation",
-            "offline_operation"
-        ]
-        
+        return list(self._capabilities)
+    
+    def _build_capabilities(self) -> Tuple[str, ...]:
+        """Build the capability tuple for the current configuration"""
         if self.config.mobile_optimized:
-            capabilities.extend([
-                "adaptive_quantization",
-                "memory_pressure_handling",
-                "performance_scaling"
-            ])
-        
-        return capabilities
+            return _BASE_CAPABILITIES + _MOBILE_CAPABILITIES
+        return _BASE_CAPABILITIES
     
     async def check_health(self) -> HealthStatus:
         """Check HRM engine health status"""
@@ -341,26 +605,28 @@ class HRMEngine(IAIEngine, IHealthCheck):
             elif self.last_error:
                 status = ComponentStatus.DEGRADED
                 message = f"Recent error: {self.last_error}"
-            elif self.average_response_time > 5000:  # 5 seconds
+            elif self.average_response_time > self.HEALTHY_RT_THRESHOLD_MS:
                 status = ComponentStatus.DEGRADED
                 message = "High response times detected"
             else:
                 status = ComponentStatus.HEALTHY
                 message = "HRM Engine operating normally"
             
+            details = {
+                "initialized": self.is_initialized,
+                "model_loaded": self.model_loaded,
+                "total_requests": self.total_requests,
+                "success_rate": self._success_rate,
+                "average_response_time_ms": self.average_response_time,
+                "performance_mode": self.current_performance_mode,
+                "battery_level": self.battery_level,
+                "thermal_state": self.thermal_state
+            }
+            
             return HealthStatus(
                 status=status,
                 message=message,
-                details={
-                    "initialized": self.is_initialized,
-                    "model_loaded": self.model_loaded,
-                    "total_requests": self.total_requests,
-                    "success_rate": self.successful_requests / max(self.total_requests, 1),
-                    "average_response_time_ms": self.average_response_time,
-                    "performance_mode": self.current_performance_mode,
-                    "battery_level": self.battery_level,
-                    "thermal_state": self.thermal_state
-                },
+                details=details,
                 timestamp=time.time(),
                 component_name="hrm_engine"
             )
@@ -379,43 +645,150 @@ class HRMEngine(IAIEngine, IHealthCheck):
         return {
             "total_requests": self.total_requests,
             "successful_requests": self.successful_requests,
-            "success_rate": self.successful_requests / max(self.total_requests, 1),
+            "success_rate": self._success_rate,
             "average_response_time_ms": self.average_response_time,
-            "memory_usage_mb": await self._get_memory_usage(),
-            "cpu_usage_percent": await self._get_cpu_usage(),
+            "process_rss_mb": self._get_process_rss(),
+            "cpu_usage_percent": self._get_cpu_usage(),
             "model_loaded": self.model_loaded,
             "performance_mode": self.current_performance_mode,
             "battery_level": self.battery_level,
             "thermal_state": self.thermal_state
         }
     
-    async def _get_memory_usage(self) -> float:
-        """Get current memory usage in MB"""
-        # This would integrate with actual memory monitoring
-        return 256.0  # Placeholder
+    def _get_process_rss(self) -> float:
+        """Get the last sampled resident memory of the whole process in MB (0.0 without psutil)
+        
+        Reported apart from memory_usage_mb, since the host process is far
+        larger than the HRM engine's own share.
+        """
+        return self._last_rss_mb
+    
+    def _get_cpu_usage(self) -> float:
+        """Get the last sampled CPU usage of this process in percent (0.0 without psutil)"""
+        return self._last_cpu_pct
+    
+    async def _sample_loop(self) -> None:
+        """Refresh the cached device readings until cancelled"""
+        while True:
+            await asyncio.sleep(self.config.sampling_interval_s)
+            try:
+                await self._sample_device()
+            except Exception as e:
+                logger.warning("Device state sampling failed: %s", e)
+    
+    async def _sample_device(self) -> None:
+        """Sample the device off the event loop and pass it on to the mobile optimizer"""
+        reading = await asyncio.to_thread(self._read_device_state)
+        self._last_rss_mb = reading.process_rss_mb
+        self._last_cpu_pct = reading.process_cpu_percent
+        
+        # Devices without a battery or temperature sensors keep the defaults
+        if reading.battery_level is not None:
+            self.battery_level = reading.battery_level
+        if reading.thermal_state is not None:
+            self.thermal_state = reading.thermal_state
+        
+        # The optimizer's plan, strategy adjustments and model variant follow
+        # the same readings
+        await self.mobile_optimizer.update_device_state(
+            battery_level=self.battery_level / 100,
+            thermal_state=self.thermal_state,
+            memory_pressure=reading.memory_pressure,
+            cpu_usage=reading.process_cpu_percent / 100
+        )
+        await self._switch_model_variant()
+    
+    async def _switch_model_variant(self) -> None:
+        """Remap the model when the thermal state calls for a different variant"""
+        variant = self.mobile_optimizer.get_model_variant()
+        if not self.model_loaded or not variant or Path(variant) == self._loaded_model_path:
+            return
+        
+        variant_path = Path(variant)
+        variant_mmap = await asyncio.to_thread(self._mmap_model, variant_path)
+        previous_mmap = self._model_mmap
+        self._model_mmap = variant_mmap
+        self._loaded_model_path = variant_path
+        if previous_mmap is not None:
+            previous_mmap.close()
+        logger.info("Switched HRM model to %s for %s thermal state", variant_path, self.thermal_state)
     
-    async def _get_cpu_usage(self) -> float:
-        """Get current CPU usage percentage"""
-        # This would integrate with actual CPU monitoring
-        return 15.0  # Placeholder
+    def _read_device_state(self) -> _DeviceReading:
+        """Read process usage, memory pressure, battery and thermal state via psutil (blocking)"""
+        process_rss_mb = self._process.memory_info().rss / (1024 * 1024)
+        # Per-process counter, so other psutil.cpu_percent() callers such as
+        # the system monitor do not reset this sampler's interval
+        process_cpu_percent = self._process.cpu_percent(interval=None)
+        memory_pressure = psutil.virtual_memory().percent / 100
+        
+        battery = psutil.sensors_battery() if hasattr(psutil, "sensors_battery") else None
+        battery_level = float(battery.percent) if battery is not None else None
+        
+        thermal_state = None
+        if hasattr(psutil, "sensors_temperatures"):
+            temperatures = [
+                entry.current
+                for entries in psutil.sensors_temperatures().values()
+                for entry in entries if entry.current
+            ]
+            if temperatures:
+                average_c = sum(temperatures) / len(temperatures)
+                thermal_state = next(
+                    (state for threshold, state in _THERMAL_LEVELS_C if average_c >= threshold),
+                    "normal"
+                )
+        
+        return _DeviceReading(
+            process_rss_mb=process_rss_mb,
+            process_cpu_percent=process_cpu_percent,
+            memory_pressure=memory_pressure,
+            battery_level=battery_level,
+            thermal_state=thermal_state
+        )
     
     async def shutdown(self) -> None:
         """Gracefully shutdown the HRM engine"""
         logger.info("Shutting down HRM Engine...")
         
         try:
-            # Shutdown components in reverse order
-            if self.learning_engine:
-                await self.learning_engine.shutdown()
-            
-            if self.task_executor:
-                await self.task_executor.shutdown()
-            
-            if self.strategic_planner:
-                await self.strategic_planner.shutdown()
+            if self._sampler_task:
+                self._sampler_task.cancel()
+                await asyncio.gather(self._sampler_task, return_exceptions=True)
+                self._sampler_task = None
+            
+            # Stop batching; callers still queued are cancelled
+            if self._batcher_task:
+                self._batcher_task.cancel()
+                await asyncio.gather(self._batcher_task, return_exceptions=True)
+                self._batcher_task = None
+                while not self._batch_queue.empty():
+                    _, future = self._batch_queue.get_nowait()
+                    future.cancel()
+            
+            # Let in-flight learning finish before tearing components down
+            if self._pipeline:
+                await self._pipeline.wait_for_learning()
+            
+            # Components are independent, so tear them down concurrently;
+            # one failing component does not stop the others
+            components = [
+                component for component in (
+                    self.learning_engine, self.task_executor,
+                    self.strategic_planner, self.mobile_optimizer
+                ) if component is not None
+            ]
+            results = await asyncio.gather(
+                *(component.shutdown() for component in components),
+                return_exceptions=True
+            )
+            for component, result in zip(components, results):
+                if isinstance(result, Exception):
+                    logger.error("%s shutdown failed: %s", type(component).__name__, result)
             
-            if self.mobile_optimizer:
-                await self.mobile_optimizer.shutdown()
+            if self._model_mmap is not None:
+                self._model_mmap.close()
+                self._model_mmap = None
+            self._loaded_model_path = None
             
             self.model_loaded = False
             self.is_initialized = False
@@ -423,4 +796,4 @@ class HRMEngine(IAIEngine, IHealthCheck):
             logger.info("HRM Engine shutdown complete")
             
         except Exception as e:
-            logger.error(f"Error during HRM Engine shutdown: {e}")
+            logger.error("Error during HRM Engine shutdown: %s", e)
@@ -7,21 +7,43 @@ capability for user-specific adaptation and pattern recognition.
 """
 
 import asyncio
+import sys
 import time
 import json
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Collection, Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, field
 from collections import defaultdict
+from pathlib import Path
 import logging
 
 from ..config import HRMConfig
 from ..interfaces import UserContext
 from ..exceptions import ThinkMeshException, ErrorCode
 
+# Optional imports for vectorized batch scoring
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+_COMPLEXITY_LEVELS = ("low", "medium", "high")
 
-@dataclass
+# Learning data layout: scalar columns plus one JSON line of payloads per record
+_COLUMNS_NPZ = "records.npz"
+_COLUMNS_JSON = "records_columns.json"  # Used when NumPy is unavailable
+_PAYLOADS_JSONL = "records_payloads.jsonl"
+
+# (request, strategy, result, context) awaiting learning
+_Interaction = Tuple[str, Dict[str, Any], Dict[str, Any], UserContext]
+_PATTERN_ID_CACHE_SIZE = 1024
+_ADAPTATION_CACHE_SIZE = 256
+_MISSING = object()  # Sentinel for absent characteristics
+
+
+@dataclass(slots=True)
 class LearningRecord:
     """Individual learning record structure"""
     timestamp: float
@@ -32,9 +54,10 @@ class LearningRecord:
     feedback: Optional[Dict[str, Any]]
     effectiveness_score: float
     pattern_id: str
+    pattern_code: int = -1  # Interned integer id of pattern_id, assigned when recorded
 
 
-@dataclass
+@dataclass(slots=True)
 class UserPattern:
     """User-specific pattern structure"""
     pattern_id: str
@@ -47,6 +70,86 @@ class UserPattern:
     adaptations: List[Dict[str, Any]]
 
 
+def _numeric(value: Any, default: float) -> float:
+    """Return value if it is a number, else default (characteristics may be None)"""
+    return value if isinstance(value, (int, float)) else default
+
+
+@dataclass
+class UserPatternAggregates:
+    """Running per-user totals over all of a user's patterns"""
+    total_frequency: int = 0
+    weighted_complexity: float = 0.0
+    weighted_response_time: float = 0.0
+    success_rate_sum: float = 0.0
+    pattern_count: int = 0
+    approach_scores: Dict[str, float] = field(default_factory=dict)
+    approach_counts: Dict[str, int] = field(default_factory=dict)
+    domain_success_sums: Dict[str, float] = field(default_factory=dict)
+    domain_counts: Dict[str, int] = field(default_factory=dict)
+    most_common_pattern: Optional[UserPattern] = None
+    pattern_order: Dict[str, int] = field(default_factory=dict)
+    
+    def add(self, pattern: UserPattern) -> None:
+        """Add a pattern's contribution to the totals"""
+        frequency = pattern.frequency
+        characteristics = pattern.characteristics
+        self.total_frequency += frequency
+        self.weighted_complexity += _numeric(characteristics.get("complexity"), 0.5) * frequency
+        self.weighted_response_time += _numeric(characteristics.get("response_time"), 1000) * frequency
+        self.success_rate_sum += pattern.success_rate
+        
+        approach = characteristics.get("approach")
+        if approach:
+            self.approach_scores[approach] = (
+                self.approach_scores.get(approach, 0.0) + pattern.success_rate * frequency
+            )
+            self.approach_counts[approach] = self.approach_counts.get(approach, 0) + 1
+        
+        domain = characteristics.get("domain", "general")
+        self.domain_success_sums[domain] = self.domain_success_sums.get(domain, 0.0) + pattern.success_rate
+        self.domain_counts[domain] = self.domain_counts.get(domain, 0) + 1
+    
+    def remove(self, pattern: UserPattern) -> None:
+        """Remove a pattern's contribution before it is modified"""
+        frequency = pattern.frequency
+        characteristics = pattern.characteristics
+        self.total_frequency -= frequency
+        self.weighted_complexity -= _numeric(characteristics.get("complexity"), 0.5) * frequency
+        self.weighted_response_time -= _numeric(characteristics.get("response_time"), 1000) * frequency
+        self.success_rate_sum -= pattern.success_rate
+        
+        approach = characteristics.get("approach")
+        if approach:
+            if self.approach_counts[approach] == 1:
+                del self.approach_scores[approach], self.approach_counts[approach]
+            else:
+                self.approach_scores[approach] -= pattern.success_rate * frequency
+                self.approach_counts[approach] -= 1
+        
+        domain = characteristics.get("domain", "general")
+        if self.domain_counts[domain] == 1:
+            del self.domain_success_sums[domain], self.domain_counts[domain]
+        else:
+            self.domain_success_sums[domain] -= pattern.success_rate
+            self.domain_counts[domain] -= 1
+    
+    def register(self, pattern: UserPattern) -> None:
+        """Track a newly created pattern"""
+        self.pattern_order[pattern.pattern_id] = self.pattern_count
+        self.pattern_count += 1
+        self.add(pattern)
+        self.update_most_common(pattern)
+    
+    def update_most_common(self, pattern: UserPattern) -> None:
+        """Re-rank a pattern whose frequency grew; earlier patterns win ties"""
+        best = self.most_common_pattern
+        if (best is None or pattern.frequency > best.frequency or
+                (pattern.frequency == best.frequency and
+                 self.pattern_order[pattern.pattern_id] < self.pattern_order[best.pattern_id])):
+            self.most_common_pattern = pattern
+
+
 class LearningEngine:
     """
     Continuous Learning Engine
@@ -63,7 +166,9 @@ class LearningEngine:
         
         # Learning state
         self.learning_records: List[LearningRecord] = []
-        self.user_patterns: Dict[str, List[UserPattern]] = defaultdict(list)
+        self._record_index: Dict[str, LearningRecord] = {}  # request -> latest record
+        self.user_patterns: Dict[str, Dict[str, UserPattern]] = defaultdict(dict)  # user -> pattern_id -> pattern
+        self.user_aggregates: Dict[str, UserPatternAggregates] = defaultdict(UserPatternAggregates)
         self.global_patterns: Dict[str, Any] = {}
         
         # Learning parameters
@@ -71,10 +176,27 @@ class LearningEngine:
         self.pattern_threshold = 3  # Minimum occurrences to form a pattern
         self.adaptation_rate = 0.1
         self.forgetting_factor = 0.95
+        self.learning_batch_size = 32
+        self.learning_batch_latency_ms = 20.0
         
         # Performance tracking
         self.learning_effectiveness: Dict[str, float] = {}
         self.adaptation_history: List[Dict[str, Any]] = []
+        
+        # (domain, intent, complexity bucket) -> pattern_id
+        self._pattern_id_cache: Dict[Tuple[Any, Any, int], str] = {}
+        
+        # pattern_id -> small integer code, assigned in first-seen order
+        self._pattern_codes: Dict[str, int] = {}
+        
+        # Per-user pattern version, bumped whenever a user's patterns change,
+        # and user -> (version, adaptations) in least-recently-used order
+        self._user_versions: Dict[str, int] = defaultdict(int)
+        self._adaptation_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        
+        # Interaction micro-batching, started in initialize()
+        self._learn_queue: Optional["asyncio.Queue[Tuple[_Interaction, asyncio.Future]]"] = None
+        self._learn_task: Optional[asyncio.Task] = None
     
     async def initialize(self) -> None:
         """Initialize the learning engine"""
@@ -90,6 +212,10 @@ class LearningEngine:
             # Setup learning optimization
             await self._setup_learning_optimization()
             
+            # Start batching interactions
+            self._learn_queue = asyncio.Queue()
+            self._learn_task = asyncio.create_task(self._learn_loop())
+            
             self.is_initialized = True
             logger.info("Learning Engine initialized successfully")
             
@@ -103,42 +229,100 @@ class LearningEngine:
     async def learn_from_interaction(self, request: str, strategy: Dict[str, Any],
                                    result: Dict[str, Any], context: UserContext) -> bool:
         """Learn from a single interaction"""
-        try:
-            # Calculate effectiveness score
-            effectiveness_score = await self._calculate_effectiveness(
-                strategy, result, context
-            )
-            
-            # Identify pattern
-            pattern_id = await self._identify_pattern(request, strategy, context)
+        interaction = (request, strategy, result, context)
+        
+        if self._learn_task is None:
+            # Batcher not running (not initialized or shut down); learn inline
+            return self._learn_batch([interaction])[0]
+        
+        future = asyncio.get_running_loop().create_future()
+        self._learn_queue.put_nowait((interaction, future))
+        return await future
+    
+    async def _learn_loop(self) -> None:
+        """Collect queued interactions into batches and learn from them together"""
+        loop = asyncio.get_running_loop()
+        window = self.learning_batch_latency_ms / 1000
+        
+        while True:
+            batch = [await self._learn_queue.get()]
+            # A lone interaction is learned at once; waiting would only add
+            # latency. Concurrent interactions coalesce for up to the window
+            deadline = loop.time() + window if not self._learn_queue.empty() else 0.0
             
-            # Create learning record
-            learning_record = LearningRecord(
-                timestamp=time.time(),
-                user_id=context.user_id,
-                request=request,
-                strategy=strategy,
-                result=result,
-                feedback=None,  # Will be updated when feedback is received
-                effectiveness_score=effectiveness_score,
-                pattern_id=pattern_id
+            try:
+                # Flush on either a full batch or the end of the latency window
+                while len(batch) < self.learning_batch_size:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._learn_queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            finally:
+                # Runs on cancellation too, so collected interactions are not lost
+                self._resolve_learning(batch)
+    
+    def _resolve_learning(self, batch: List[Tuple[_Interaction, asyncio.Future]]) -> None:
+        """Learn from a batch of queued interactions and resolve their futures"""
+        outcomes = self._learn_batch([interaction for interaction, _ in batch])
+        for (_, future), adaptations_applied in zip(batch, outcomes):
+            if not future.done():
+                future.set_result(adaptations_applied)
+    
+    def _learn_batch(self, interactions: List[_Interaction]) -> List[bool]:
+        """Learn from interactions in order, returning whether adaptations were applied"""
+        try:
+            # Score the whole batch at once
+            scores: List[Optional[float]] = self._calculate_effectiveness_batch(
+                [strategy for _, strategy, _, _ in interactions],
+                [result for _, _, result, _ in interactions]
             )
-            
-            # Add to learning records
-            await self._add_learning_record(learning_record)
-            
-            # Update user patterns
-            await self._update_user_patterns(learning_record)
-            
-            # Apply adaptations if enough samples
-            adaptations_applied = await self._apply_adaptations(context.user_id)
-            
-            logger.debug(f"Learning from interaction completed. Effectiveness: {effectiveness_score:.3f}")
-            return adaptations_applied
-            
-        except Exception as e:
-            logger.error(f"Learning from interaction failed: {e}")
-            return False
+        except Exception:
+            scores = [None] * len(interactions)  # Score individually below
+        
+        outcomes = []
+        for (request, strategy, result, context), effectiveness_score in zip(interactions, scores):
+            try:
+                now = time.time()  # One clock read per interaction
+                
+                if effectiveness_score is None:
+                    effectiveness_score = self._calculate_effectiveness(
+                        strategy, result, context
+                    )
+                
+                # Identify pattern
+                pattern_id = self._identify_pattern(request, strategy, context)
+                
+                # Create learning record
+                learning_record = LearningRecord(
+                    timestamp=now,
+                    user_id=sys.intern(context.user_id),
+                    request=request,
+                    strategy=strategy,
+                    result=result,
+                    feedback=None,  # Will be updated when feedback is received
+                    effectiveness_score=effectiveness_score,
+                    pattern_id=pattern_id
+                )
+                
+                # Add to learning records
+                self._add_learning_record(learning_record)
+                
+                # Update user patterns
+                self._update_user_patterns(learning_record)
+                
+                # Apply adaptations if enough samples
+                outcomes.append(self._apply_adaptations(context.user_id, now))
+                
+                logger.debug(f"Learning from interaction completed. Effectiveness: {effectiveness_score:.3f}")
+                
+            except Exception as e:
+                logger.error(f"Learning from interaction failed: {e}")
+                outcomes.append(False)
+        
+        return outcomes
     
     async def process_feedback(self, request: str, response: str,
                              feedback: Optional[Dict[str, Any]] = None) -> None:
@@ -148,20 +332,20 @@ class LearningEngine:
                 return
             
             # Find corresponding learning record
-            learning_record = await self._find_learning_record(request, response)
+            learning_record = self._find_learning_record(request, response)
             
             if learning_record:
                 # Update learning record with feedback
                 learning_record.feedback = feedback
                 
                 # Recalculate effectiveness with feedback
-                updated_effectiveness = await self._calculate_effectiveness_with_feedback(
+                updated_effectiveness = self._calculate_effectiveness_with_feedback(
                     learning_record, feedback
                 )
                 learning_record.effectiveness_score = updated_effectiveness
                 
                 # Update patterns based on feedback
-                await self._update_patterns_with_feedback(learning_record, feedback)
+                self._update_patterns_with_feedback(learning_record, feedback)
                 
                 logger.debug("Feedback processed and learning updated")
             
@@ -169,17 +353,36 @@ class LearningEngine:
             logger.error(f"Feedback processing failed: {e}")
     
     async def get_user_adaptations(self, user_id: str) -> Dict[str, Any]:
-        """Get current adaptations for a specific user"""
+        """Get current adaptations for a specific user
+        
+        The result is cached until the user's patterns change and is shared
+        between calls, so callers must not modify it.
+        """
         try:
-            user_patterns = self.user_patterns.get(user_id, [])
+            version = self._user_versions.get(user_id, 0)
+            cached = self._adaptation_cache.pop(user_id, None)
+            if cached is not None and cached[0] == version:
+                self._adaptation_cache[user_id] = cached  # Mark most recently used
+                return cached[1]
             
-            adaptations = {
-                "preferred_approaches": await self._get_preferred_approaches(user_patterns),
-                "response_style": await self._get_response_style(user_patterns),
-                "complexity_preference": await self._get_complexity_preference(user_patterns),
-                "domain_expertise": await self._get_domain_expertise(user_patterns),
-                "interaction_patterns": await self._get_interaction_patterns(user_patterns)
-            }
+            aggregates = self.user_aggregates.get(user_id)
+            if aggregates is not None:
+                adaptations = self._adaptations_from_aggregates(aggregates)
+            else:
+                # Patterns without running totals fall back to a full scan
+                user_patterns = self.user_patterns.get(user_id, {}).values()
+                
+                adaptations = {
+                    "preferred_approaches": self._get_preferred_approaches(user_patterns),
+                    "response_style": self._get_response_style(user_patterns),
+                    "complexity_preference": self._get_complexity_preference(user_patterns),
+                    "domain_expertise": self._get_domain_expertise(user_patterns),
+                    "interaction_patterns": self._get_interaction_patterns(user_patterns)
+                }
+            
+            if len(self._adaptation_cache) >= _ADAPTATION_CACHE_SIZE:
+                del self._adaptation_cache[next(iter(self._adaptation_cache))]
+            self._adaptation_cache[user_id] = (version, adaptations)
             
             return adaptations
             
@@ -187,9 +390,13 @@ class LearningEngine:
             logger.error(f"Failed to get user adaptations: {e}")
             return {}
     
-    async def _calculate_effectiveness(self, strategy: Dict[str, Any],
+    def _calculate_effectiveness(self, strategy: Dict[str, Any],
                                      result: Dict[str, Any], context: UserContext) -> float:
         """Calculate effectiveness score for the interaction"""
+        return self._score_effectiveness(strategy, result)
+    
+    def _score_effectiveness(self, strategy: Dict[str, Any], result: Dict[str, Any]) -> float:
+        """Score a single interaction from its strategy and result"""
         factors = []
         
         # Confidence score factor
@@ -219,7 +426,45 @@ class LearningEngine:
         
         return sum(factors) / len(factors)
     
-    async def _calculate_effectiveness_with_feedback(self, learning_record: LearningRecord,
+    def _calculate_effectiveness_batch(self, strategies: List[Dict[str, Any]],
+                                       results: List[Dict[str, Any]]) -> List[float]:
+        """Calculate effectiveness scores for a batch of interactions
+        
+        Same scoring as _calculate_effectiveness, computed column-wise with
+        NumPy when it is available.
+        """
+        n = len(results)
+        if not NUMPY_AVAILABLE or n == 0:
+            return [
+                self._score_effectiveness(strategy, result)
+                for strategy, result in zip(strategies, results)
+            ]
+        
+        confidence = np.fromiter(
+            (r.get("confidence_score", 0.5) for r in results), dtype=np.float64, count=n
+        )
+        response_time = np.fromiter(
+            (r.get("performance_metrics", {}).get("execution_time_ms", 1000) for r in results),
+            dtype=np.float64, count=n
+        )
+        complexity = np.fromiter(
+            (s.get("complexity", 0.5) for s in strategies), dtype=np.float64, count=n
+        )
+        expert_domain = np.fromiter(
+            (s.get("domain", "general") in ("technical", "analytical") for s in strategies),
+            dtype=bool, count=n
+        )
+        
+        time_factor = np.maximum(0.0, 1.0 - (response_time - 500) / 2000)
+        complexity_factor = np.where(
+            (complexity > 0.7) & (confidence > 0.8), 0.9,
+            np.where((complexity < 0.3) & (confidence > 0.9), 0.8, 0.6)
+        )
+        domain_factor = np.where(expert_domain & (confidence > 0.8), 0.85, 0.7)
+        
+        return ((confidence + time_factor + complexity_factor + domain_factor) / 4).tolist()
+    
+    def _calculate_effectiveness_with_feedback(self, learning_record: LearningRecord,
                                                    feedback: Dict[str, Any]) -> float:
         """Recalculate effectiveness with user feedback"""
         base_effectiveness = learning_record.effectiveness_score
@@ -239,28 +484,56 @@ class LearningEngine:
         # Weighted combination (70% base, 30% feedback)
         return 0.7 * base_effectiveness + 0.3 * feedback_score
     
-    async def _identify_pattern(self, request: str, strategy: Dict[str, Any],
+    def _identify_pattern(self, request: str, strategy: Dict[str, Any],
                               context: UserContext) -> str:
         """Identify pattern for the interaction"""
         # Create pattern identifier based on key characteristics
         domain = strategy.get("domain", "general")
         intent = strategy.get("intent", "general_inquiry")
-        complexity_level = "high" if strategy.get("complexity", 0) > 0.6 else "medium" if strategy.get("complexity", 0) > 0.3 else "low"
-        
-        pattern_id = f"{domain}_{intent}_{complexity_level}"
+        complexity = strategy.get("complexity", 0)
+        bucket = 2 if complexity > 0.6 else 1 if complexity > 0.3 else 0
+        
+        key = (domain, intent, bucket)
+        pattern_id = self._pattern_id_cache.get(key)
+        if pattern_id is None:
+            pattern_id = sys.intern(f"{domain}_{intent}_{_COMPLEXITY_LEVELS[bucket]}")
+            if len(self._pattern_id_cache) >= _PATTERN_ID_CACHE_SIZE:
+                del self._pattern_id_cache[next(iter(self._pattern_id_cache))]
+            self._pattern_id_cache[key] = pattern_id
         return pattern_id
     
-    async def _add_learning_record(self, learning_record: LearningRecord) -> None:
+    def _pattern_code(self, pattern_id: str) -> int:
+        """Intern a pattern_id as a small integer code"""
+        code = self._pattern_codes.get(pattern_id)
+        if code is None:
+            code = self._pattern_codes[pattern_id] = len(self._pattern_codes)
+        return code
+    
+    def _add_learning_record(self, learning_record: LearningRecord) -> None:
         """Add learning record and manage memory"""
+        if learning_record.pattern_code < 0:
+            learning_record.pattern_code = self._pattern_code(learning_record.pattern_id)
         self.learning_records.append(learning_record)
+        self._record_index[learning_record.request] = learning_record
         
         # Implement 1000-sample learning limit
         if len(self.learning_records) > self.max_learning_samples:
             # Remove oldest records, but keep diverse patterns
-            await self._prune_learning_records()
+            self._prune_learning_records()
     
-    async def _prune_learning_records(self) -> None:
+    def _prune_learning_records(self) -> None:
         """Prune learning records while maintaining diversity"""
+        if NUMPY_AVAILABLE:
+            self.learning_records = self._select_retained_records_vectorized()
+        else:
+            self.learning_records = self._select_retained_records()
+        
+        # Later records win, matching a newest-first scan of the list
+        self._record_index = {record.request: record for record in self.learning_records}
+        logger.debug(f"Pruned learning records to {len(self.learning_records)} samples")
+    
+    def _select_retained_records(self) -> List[LearningRecord]:
+        """Select the records to keep after pruning"""
         # Group by pattern
         pattern_groups = defaultdict(list)
         for record in self.learning_records:
@@ -283,22 +556,57 @@ class LearningEngine:
             pruned_records = sorted(pruned_records, key=lambda r: r.timestamp, reverse=True)
             pruned_records = pruned_records[:self.max_learning_samples]
         
-        self.learning_records = pruned_records
-        logger.debug(f"Pruned learning records to {len(self.learning_records)} samples")
+        return pruned_records
     
-    async def _update_user_patterns(self, learning_record: LearningRecord) -> None:
+    def _select_retained_records_vectorized(self) -> List[LearningRecord]:
+        """Select the records to keep after pruning, sorting with NumPy
+        
+        Produces the same records in the same order as _select_retained_records.
+        """
+        records = self.learning_records
+        n = len(records)
+        effectiveness = np.fromiter((r.effectiveness_score for r in records), dtype=np.float64, count=n)
+        timestamps = np.fromiter((r.timestamp for r in records), dtype=np.float64, count=n)
+        
+        # Group record indices by pattern, numbering groups by first appearance
+        pattern_codes = np.fromiter((r.pattern_code for r in records), dtype=np.int64, count=n)
+        _, first_index, inverse, counts = np.unique(
+            pattern_codes, return_index=True, return_inverse=True, return_counts=True
+        )
+        group_order = np.argsort(first_index)
+        group_rank = np.empty_like(group_order)
+        group_rank[group_order] = np.arange(len(group_order))
+        record_groups = group_rank[inverse]
+        group_starts = np.cumsum(counts[group_order]) - counts[group_order]
+        
+        # One sort for all patterns: by group, then most effective, then most
+        # recent; the negated keys give a stable descending order
+        order = np.lexsort((-timestamps, -effectiveness, record_groups))
+        
+        # Keep the top records from each pattern
+        keep_count = self.max_learning_samples // len(group_order)
+        position_in_group = np.arange(n) - group_starts[record_groups[order]]
+        kept = order[position_in_group < keep_count]
+        
+        # If still too many, keep most recent overall
+        if len(kept) > self.max_learning_samples:
+            kept = kept[np.argsort(-timestamps[kept], kind="stable")[:self.max_learning_samples]]
+        
+        return [records[i] for i in kept.tolist()]
+    
+    def _update_user_patterns(self, learning_record: LearningRecord) -> None:
         """Update user-specific patterns"""
         user_id = learning_record.user_id
         pattern_id = learning_record.pattern_id
+        self._user_versions[user_id] += 1
         
         # Find existing pattern or create new one
-        existing_pattern = None
-        for pattern in self.user_patterns[user_id]:
-            if pattern.pattern_id == pattern_id:
-                existing_pattern = pattern
-                break
+        existing_pattern = self.user_patterns[user_id].get(pattern_id)
         
         if existing_pattern:
+            aggregates = self.user_aggregates[user_id]
+            aggregates.remove(existing_pattern)
+            
             # Update existing pattern
             existing_pattern.frequency += 1
             existing_pattern.last_seen = learning_record.timestamp
@@ -311,7 +619,10 @@ class LearningEngine:
             )
             
             # Update characteristics
-            await self._update_pattern_characteristics(existing_pattern, learning_record)
+            self._update_pattern_characteristics(existing_pattern, learning_record)
+            
+            aggregates.add(existing_pattern)
+            aggregates.update_most_common(existing_pattern)
             
         else:
             # Create new pattern
@@ -322,13 +633,14 @@ class LearningEngine:
                 frequency=1,
                 success_rate=learning_record.effectiveness_score,
                 last_seen=learning_record.timestamp,
-                characteristics=await self._extract_pattern_characteristics(learning_record),
+                characteristics=self._extract_pattern_characteristics(learning_record),
                 adaptations=[]
             )
             
-            self.user_patterns[user_id].append(new_pattern)
+            self.user_patterns[user_id][pattern_id] = new_pattern
+            self.user_aggregates[user_id].register(new_pattern)
     
-    async def _extract_pattern_characteristics(self, learning_record: LearningRecord) -> Dict[str, Any]:
+    def _extract_pattern_characteristics(self, learning_record: LearningRecord) -> Dict[str, Any]:
         """Extract characteristics from learning record"""
         return {
             "approach": learning_record.strategy.get("approach"),
@@ -340,24 +652,47 @@ class LearningEngine:
             "confidence": learning_record.result.get("confidence_score")
         }
     
-    async def _update_pattern_characteristics(self, pattern: UserPattern, 
+    def _update_pattern_characteristics(self, pattern: UserPattern, 
                                             learning_record: LearningRecord) -> None:
         """Update pattern characteristics with new data"""
-        new_chars = await self._extract_pattern_characteristics(learning_record)
-        
-        # Update characteristics using exponential moving average
+        strategy = learning_record.strategy
+        result = learning_record.result
+        chars = pattern.characteristics
         alpha = self.adaptation_rate
-        for key, new_value in new_chars.items():
-            if key in pattern.characteristics and isinstance(new_value, (int, float)):
-                pattern.characteristics[key] = (
-                    alpha * new_value + (1 - alpha) * pattern.characteristics[key]
-                )
-            else:
-                pattern.characteristics[key] = new_value
+        retain = 1 - alpha
+        
+        # Categorical characteristics take the latest value
+        chars["approach"] = strategy.get("approach")
+        chars["domain"] = strategy.get("domain")
+        chars["intent"] = strategy.get("intent")
+        chars["urgency"] = strategy.get("urgency")
+        
+        # Numeric characteristics use an exponential moving average; a single
+        # probe per field both checks presence and fetches the previous value
+        value = strategy.get("complexity")
+        previous = chars.get("complexity", _MISSING)
+        if previous is not _MISSING and isinstance(value, (int, float)):
+            value = alpha * value + retain * previous
+        chars["complexity"] = value
+        
+        value = result.get("performance_metrics", {}).get("execution_time_ms")
+        previous = chars.get("response_time", _MISSING)
+        if previous is not _MISSING and isinstance(value, (int, float)):
+            value = alpha * value + retain * previous
+        chars["response_time"] = value
+        
+        value = result.get("confidence_score")
+        previous = chars.get("confidence", _MISSING)
+        if previous is not _MISSING and isinstance(value, (int, float)):
+            value = alpha * value + retain * previous
+        chars["confidence"] = value
     
-    async def _apply_adaptations(self, user_id: str) -> bool:
+    def _apply_adaptations(self, user_id: str, timestamp: Optional[float] = None) -> bool:
         """Apply adaptations based on learned patterns"""
-        user_patterns = self.user_patterns.get(user_id, [])
+        if timestamp is None:
+            timestamp = time.time()
+        
+        user_patterns = self.user_patterns.get(user_id)
         
         if not user_patterns:
             return False
@@ -365,24 +700,28 @@ class LearningEngine:
         adaptations_applied = False
         
         # Apply adaptations for patterns with sufficient frequency
-        for pattern in user_patterns:
+        for pattern in user_patterns.values():
             if pattern.frequency >= self.pattern_threshold:
-                adaptation = await self._generate_adaptation(pattern)
+                adaptation = self._generate_adaptation(pattern, timestamp)
                 if adaptation:
                     pattern.adaptations.append(adaptation)
                     adaptations_applied = True
         
         return adaptations_applied
     
-    async def _generate_adaptation(self, pattern: UserPattern) -> Optional[Dict[str, Any]]:
+    def _generate_adaptation(self, pattern: UserPattern, 
+                            timestamp: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """Generate adaptation based on pattern"""
+        if timestamp is None:
+            timestamp = time.time()
+        
         if pattern.success_rate > 0.8:
             # High success rate - reinforce this approach
             return {
                 "type": "reinforce",
                 "approach": pattern.characteristics.get("approach"),
                 "confidence_boost": 0.1,
-                "timestamp": time.time()
+                "timestamp": timestamp
             }
         elif pattern.success_rate < 0.6:
             # Low success rate - try alternative approach
@@ -390,12 +729,48 @@ class LearningEngine:
                 "type": "alternative",
                 "avoid_approach": pattern.characteristics.get("approach"),
                 "suggested_complexity": pattern.characteristics.get("complexity", 0.5) * 0.8,
-                "timestamp": time.time()
+                "timestamp": timestamp
             }
         
         return None
     
-    async def _get_preferred_approaches(self, user_patterns: List[UserPattern]) -> List[str]:
+    def _adaptations_from_aggregates(self, aggregates: UserPatternAggregates) -> Dict[str, Any]:
+        """Build user adaptations from running totals without scanning patterns"""
+        if not aggregates.pattern_count:
+            return {
+                "preferred_approaches": [],
+                "response_style": {"style": "balanced"},
+                "complexity_preference": 0.5,
+                "domain_expertise": {},
+                "interaction_patterns": {}
+            }
+        
+        total_weight = aggregates.total_frequency
+        sorted_approaches = sorted(aggregates.approach_scores.items(), key=lambda x: x[1], reverse=True)
+        avg_complexity = aggregates.weighted_complexity / total_weight
+        avg_response_time = aggregates.weighted_response_time / total_weight
+        
+        return {
+            "preferred_approaches": [approach for approach, score in sorted_approaches[:3]],
+            "response_style": {
+                "preferred_complexity": avg_complexity,
+                "preferred_response_time": avg_response_time,
+                "style": "detailed" if avg_complexity > 0.6 else "concise" if avg_complexity < 0.4 else "balanced"
+            },
+            "complexity_preference": avg_complexity,
+            "domain_expertise": {
+                domain: success_sum / aggregates.domain_counts[domain]
+                for domain, success_sum in aggregates.domain_success_sums.items()
+            },
+            "interaction_patterns": {
+                "total_interactions": total_weight,
+                "most_common_pattern": aggregates.most_common_pattern.pattern_id,
+                "pattern_diversity": aggregates.pattern_count,
+                "average_success_rate": aggregates.success_rate_sum / aggregates.pattern_count
+            }
+        }
+    
+    def _get_preferred_approaches(self, user_patterns: Collection[UserPattern]) -> List[str]:
         """Get user's preferred approaches"""
         approach_scores = defaultdict(float)
         
@@ -408,17 +783,22 @@ class LearningEngine:
         sorted_approaches = sorted(approach_scores.items(), key=lambda x: x[1], reverse=True)
         return [approach for approach, score in sorted_approaches[:3]]
     
-    async def _get_response_style(self, user_patterns: List[UserPattern]) -> Dict[str, Any]:
+    def _get_response_style(self, user_patterns: Collection[UserPattern]) -> Dict[str, Any]:
         """Get user's preferred response style"""
-        total_weight = sum(p.frequency for p in user_patterns)
+        total_weight = 0
+        weighted_complexity = 0
+        weighted_response_time = 0
+        for p in user_patterns:
+            frequency = p.frequency
+            total_weight += frequency
+            weighted_complexity += p.characteristics.get("complexity", 0.5) * frequency
+            weighted_response_time += p.characteristics.get("response_time", 1000) * frequency
+        
         if total_weight == 0:
             return {"style": "balanced"}
         
-        avg_complexity = sum(p.characteristics.get("complexity", 0.5) * p.frequency 
-                           for p in user_patterns) / total_weight
-        
-        avg_response_time = sum(p.characteristics.get("response_time", 1000) * p.frequency 
-                              for p in user_patterns) / total_weight
+        avg_complexity = weighted_complexity / total_weight
+        avg_response_time = weighted_response_time / total_weight
         
         return {
             "preferred_complexity": avg_complexity,
@@ -426,18 +806,20 @@ class LearningEngine:
             "style": "detailed" if avg_complexity > 0.6 else "concise" if avg_complexity < 0.4 else "balanced"
         }
     
-    async def _get_complexity_preference(self, user_patterns: List[UserPattern]) -> float:
+    def _get_complexity_preference(self, user_patterns: Collection[UserPattern]) -> float:
         """Get user's complexity preference"""
         if not user_patterns:
             return 0.5
         
-        total_weight = sum(p.frequency for p in user_patterns)
-        weighted_complexity = sum(p.characteristics.get("complexity", 0.5) * p.frequency 
-                                for p in user_patterns)
+        total_weight = 0
+        weighted_complexity = 0
+        for p in user_patterns:
+            total_weight += p.frequency
+            weighted_complexity += p.characteristics.get("complexity", 0.5) * p.frequency
         
         return weighted_complexity / total_weight if total_weight > 0 else 0.5
     
-    async def _get_domain_expertise(self, user_patterns: List[UserPattern]) -> Dict[str, float]:
+    def _get_domain_expertise(self, user_patterns: Collection[UserPattern]) -> Dict[str, float]:
         """Get user's domain expertise levels"""
         domain_scores = defaultdict(list)
         
@@ -452,7 +834,7 @@ class LearningEngine:
         
         return domain_expertise
     
-    async def _get_interaction_patterns(self, user_patterns: List[UserPattern]) -> Dict[str, Any]:
+    def _get_interaction_patterns(self, user_patterns: Collection[UserPattern]) -> Dict[str, Any]:
         """Get user's interaction patterns"""
         if not user_patterns:
             return {}
@@ -467,38 +849,92 @@ class LearningEngine:
             "average_success_rate": sum(p.success_rate for p in user_patterns) / len(user_patterns)
         }
     
-    async def _find_learning_record(self, request: str, response: str) -> Optional[LearningRecord]:
+    def _find_learning_record(self, request: str, response: str) -> Optional[LearningRecord]:
         """Find learning record for feedback processing"""
         # Simple matching - in production, use more sophisticated matching
-        for record in reversed(self.learning_records):  # Start from most recent
-            if record.request == request:
-                return record
-        return None
+        return self._record_index.get(request)
     
-    async def _update_patterns_with_feedback(self, learning_record: LearningRecord,
+    def _update_patterns_with_feedback(self, learning_record: LearningRecord,
                                            feedback: Dict[str, Any]) -> None:
         """Update patterns based on user feedback"""
         # Update the pattern's success rate based on feedback
-        user_patterns = self.user_patterns.get(learning_record.user_id, [])
+        pattern = self.user_patterns.get(learning_record.user_id, {}).get(learning_record.pattern_id)
         
-        for pattern in user_patterns:
-            if pattern.pattern_id == learning_record.pattern_id:
-                # Incorporate feedback into success rate
-                feedback_score = (
-                    feedback.get("satisfaction", 0.5) + 
-                    feedback.get("usefulness", 0.5) + 
-                    feedback.get("accuracy", 0.5)
-                ) / 3
-                
-                # Update with exponential moving average
-                alpha = self.adaptation_rate
-                pattern.success_rate = alpha * feedback_score + (1 - alpha) * pattern.success_rate
-                break
+        if pattern:
+            self._user_versions[learning_record.user_id] += 1
+            aggregates = self.user_aggregates[learning_record.user_id]
+            aggregates.remove(pattern)
+            
+            # Incorporate feedback into success rate
+            feedback_score = (
+                feedback.get("satisfaction", 0.5) + 
+                feedback.get("usefulness", 0.5) + 
+                feedback.get("accuracy", 0.5)
+            ) / 3
+            
+            # Update with exponential moving average
+            alpha = self.adaptation_rate
+            pattern.success_rate = alpha * feedback_score + (1 - alpha) * pattern.success_rate
+            
+            aggregates.add(pattern)
     
     async def _load_learning_data(self) -> None:
         """Load existing learning data"""
-        # In production, this would load from persistent storage
-        logger.debug("Learning data loaded (simulated)")
+        if not self.config.learning_data_path:
+            logger.debug("Learning data loaded (simulated)")
+            return
+        
+        path = Path(self.config.learning_data_path)
+        try:
+            records = await asyncio.to_thread(self._read_learning_records, path)
+        except Exception as e:
+            logger.warning(f"Unreadable learning data in {path}, starting empty: {e}")
+            return
+        
+        # Replay in order through the same path as _learn_batch, rebuilding
+        # user patterns, their aggregates and the pattern versions
+        for record in records:
+            self._add_learning_record(record)
+            self._update_user_patterns(record)
+            self._apply_adaptations(record.user_id, record.timestamp)
+        logger.debug(f"Loaded {len(records)} learning records from {path}")
+    
+    def _read_learning_records(self, path: Path) -> List[LearningRecord]:
+        """Read columnar learning records written by _write_learning_records"""
+        payloads_file = path / _PAYLOADS_JSONL
+        if NUMPY_AVAILABLE and (path / _COLUMNS_NPZ).exists():
+            with np.load(path / _COLUMNS_NPZ) as data:
+                columns = {name: data[name].tolist() for name in data.files}
+        elif (path / _COLUMNS_JSON).exists():
+            with open(path / _COLUMNS_JSON, "r") as f:
+                columns = json.load(f)
+        else:
+            return []
+        
+        with open(payloads_file, "r") as f:
+            payloads = [json.loads(line) for line in f]
+        
+        if any(len(column) != len(payloads) for column in columns.values()):
+            raise ValueError(
+                f"{len(payloads)} payloads for {len(columns['timestamps'])} records"
+            )
+        
+        return [
+            LearningRecord(
+                timestamp=timestamp,
+                user_id=sys.intern(user_id),
+                request=request,
+                strategy=payload["strategy"],
+                result=payload["result"],
+                feedback=payload["feedback"],
+                effectiveness_score=effectiveness_score,
+                pattern_id=sys.intern(pattern_id)
+            )
+            for timestamp, user_id, request, effectiveness_score, pattern_id, payload in zip(
+                columns["timestamps"], columns["user_ids"], columns["requests"],
+                columns["effectiveness_scores"], columns["pattern_ids"], payloads
+            )
+        ]
     
     async def _initialize_pattern_recognition(self) -> None:
         """Initialize pattern recognition system"""
@@ -522,6 +958,18 @@ class LearningEngine:
     async def shutdown(self) -> None:
         """Shutdown the learning engine"""
         try:
+            # Stop batching; interactions still queued are learned inline
+            if self._learn_task:
+                self._learn_task.cancel()
+                await asyncio.gather(self._learn_task, return_exceptions=True)
+                self._learn_task = None
+                
+                pending = []
+                while not self._learn_queue.empty():
+                    pending.append(self._learn_queue.get_nowait())
+                if pending:
+                    self._resolve_learning(pending)
+            
             # Save learning data before shutdown
             await self._save_learning_data()
             
@@ -532,5 +980,42 @@ class LearningEngine:
     
     async def _save_learning_data(self) -> None:
         """Save learning data to persistent storage"""
-        # In production, this would save to persistent storage
-        logger.debug("Learning data saved (simulated)")
+        if not self.config.learning_data_path:
+            logger.debug("Learning data saved (simulated)")
+            return
+        
+        path = Path(self.config.learning_data_path)
+        await asyncio.to_thread(self._write_learning_records, path, list(self.learning_records))
+        logger.debug(f"Saved {len(self.learning_records)} learning records to {path}")
+    
+    def _write_learning_records(self, path: Path, records: List[LearningRecord]) -> None:
+        """Write records as scalar columns plus a JSON-lines file of dict payloads"""
+        path.mkdir(parents=True, exist_ok=True)
+        
+        columns = {
+            "timestamps": [r.timestamp for r in records],
+            "user_ids": [r.user_id for r in records],
+            "requests": [r.request for r in records],
+            "effectiveness_scores": [r.effectiveness_score for r in records],
+            "pattern_ids": [r.pattern_id for r in records]
+        }
+        if NUMPY_AVAILABLE:
+            np.savez(
+                path / _COLUMNS_NPZ,
+                timestamps=np.asarray(columns["timestamps"], dtype=np.float64),
+                user_ids=np.asarray(columns["user_ids"], dtype=str),
+                requests=np.asarray(columns["requests"], dtype=str),
+                effectiveness_scores=np.asarray(columns["effectiveness_scores"], dtype=np.float64),
+                pattern_ids=np.asarray(columns["pattern_ids"], dtype=str)
+            )
+        else:
+            with open(path / _COLUMNS_JSON, "w") as f:
+                json.dump(columns, f)
+        
+        with open(path / _PAYLOADS_JSONL, "w") as f:
+            for r in records:
+                f.write(json.dumps(
+                    {"strategy": r.strategy, "result": r.result, "feedback": r.feedback},
+                    default=str
+                ))
+                f.write("\n")
@@ -8,9 +8,12 @@ thermal management, and performance scaling for the HRM engine.
 
 import asyncio
 import time
-from typing import Dict, Any, List, Optional, Tuple
+from collections import deque
+from types import MappingProxyType
+from typing import Deque, Dict, Any, List, Mapping, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
 import logging
 
 from ..config import HRMConfig
@@ -35,7 +38,7 @@ class ThermalState(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class MobileConstraints:
     """Mobile device constraints"""
     battery_level: float  # 0.0 to 1.0
@@ -46,7 +49,7 @@ class MobileConstraints:
     performance_mode: PerformanceMode
 
 
-@dataclass
+@dataclass(slots=True)
 class OptimizationResult:
     """Optimization result structure"""
     optimized_config: Dict[str, Any]
@@ -55,6 +58,110 @@ class OptimizationResult:
     estimated_impact: Dict[str, float]
 
 
+@dataclass(frozen=True)
+class MobilePlan:
+    """Optimization decisions precomputed for one band of device constraints"""
+    performance_mode: PerformanceMode
+    applied_optimizations: Tuple[str, ...]
+    thread_count: int
+    max_response_length: int
+    battery_saving: bool  # Battery < 0.3
+    thermal_throttling: bool  # HOT or CRITICAL
+    memory_saving: bool  # Memory pressure > 0.7
+    adjusts_strategy: bool  # Any of the three above
+    step_up_quantization: bool  # Memory pressure > 0.7
+    reduce_memory_limit: bool  # Memory pressure > 0.8
+    memory_mapping: bool  # Memory pressure < 0.5
+    reduce_learning: bool  # Battery < 0.2
+
+
+_BATTERY_BANDS = 5
+_MEMORY_BANDS = 4
+_THERMAL_STATES = tuple(ThermalState)
+_THERMAL_BY_VALUE = {state.value: state for state in ThermalState}
+_THROTTLING_STATES = frozenset({ThermalState.HOT, ThermalState.CRITICAL})
+
+
+# Optimization profiles and thresholds, shared read-only by all optimizers
+_OPTIMIZATION_PROFILES: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "power_saver": MappingProxyType({
+        "max_complexity": 0.4,
+        "max_response_length": 300,
+        "processing_intensity": "low",
+        "thread_count": 1
+    }),
+    "balanced": MappingProxyType({
+        "max_complexity": 0.7,
+        "max_response_length": 600,
+        "processing_intensity": "medium",
+        "thread_count": 2
+    }),
+    "performance": MappingProxyType({
+        "max_complexity": 1.0,
+        "max_response_length": 1000,
+        "processing_intensity": "high",
+        "thread_count": 4
+    })
+})
+
+_THERMAL_THRESHOLDS: Mapping[ThermalState, Mapping[str, float]] = MappingProxyType({
+    ThermalState.NORMAL: MappingProxyType({"max_cpu": 0.7, "max_complexity": 1.0}),
+    ThermalState.WARM: MappingProxyType({"max_cpu": 0.5, "max_complexity": 0.7}),
+    ThermalState.HOT: MappingProxyType({"max_cpu": 0.3, "max_complexity": 0.4}),
+    ThermalState.CRITICAL: MappingProxyType({"max_cpu": 0.1, "max_complexity": 0.2})
+})
+
+# Final step substituted for the trimmed steps of a battery-optimized strategy
+_BATTERY_STEP = "Provide simplified response for battery optimization"
+
+# Model file suffix per thermal state: hotter devices step down to smaller
+# variants of the same model so sustained throughput survives throttling.
+# Variants without a file next to the configured model are skipped
+_THERMAL_MODEL_SUFFIXES: Mapping[ThermalState, str] = MappingProxyType({
+    ThermalState.NORMAL: "",
+    ThermalState.WARM: "-small",
+    ThermalState.HOT: "-tiny",
+    ThermalState.CRITICAL: "-tiny"
+})
+
+_BATTERY_THRESHOLDS: Mapping[str, float] = MappingProxyType({
+    "critical": 0.1,
+    "low": 0.2,
+    "medium": 0.5,
+    "high": 0.8
+})
+_PERFORMANCE_MODES = tuple(PerformanceMode)
+_THERMAL_INDEX = {state: i for i, state in enumerate(_THERMAL_STATES)}
+_MODE_INDEX = {mode: i for i, mode in enumerate(_PERFORMANCE_MODES)}
+
+
+def _battery_band(battery_level: float) -> int:
+    """0: < 0.2, 1: < 0.3, 2: < 0.5, 3: <= 0.8, 4: > 0.8"""
+    if battery_level < 0.2:
+        return 0
+    if battery_level < 0.3:
+        return 1
+    if battery_level < 0.5:
+        return 2
+    return 3 if battery_level <= 0.8 else 4
+
+
+def _memory_band(memory_pressure: float) -> int:
+    """0: < 0.5, 1: <= 0.7, 2: <= 0.8, 3: > 0.8"""
+    if memory_pressure < 0.5:
+        return 0
+    if memory_pressure <= 0.7:
+        return 1
+    return 2 if memory_pressure <= 0.8 else 3
+
+
+def _plan_key(battery_band: int, thermal_state: ThermalState,
+              memory_band: int, performance_mode: PerformanceMode) -> int:
+    """Index of a constraint combination in the plan table"""
+    return ((battery_band * len(_THERMAL_STATES) + _THERMAL_INDEX[thermal_state])
+            * _MEMORY_BANDS + memory_band) * len(_PERFORMANCE_MODES) + _MODE_INDEX[performance_mode]
+
+
 class HRMMobileOptimizer:
     """
     Mobile Optimizer for HRM Engine
@@ -67,6 +174,14 @@ class HRMMobileOptimizer:
     - Network optimization
     """
     
+    __slots__ = (
+        "config", "is_initialized", "current_constraints",
+        "_constraints_snapshot", "_active_plan", "_min_poll_interval_s", "_last_poll",
+        "_thermal_model_ladder",
+        "optimization_profiles", "thermal_thresholds", "battery_thresholds",
+        "optimization_history", "performance_metrics"
+    )
+    
     def __init__(self, config: HRMConfig):
         self.config = config
         self.is_initialized = False
@@ -81,13 +196,28 @@ class HRMMobileOptimizer:
             performance_mode=PerformanceMode.BALANCED
         )
         
+        # Constraints as a plain dict and the matching optimization plan,
+        # rebuilt whenever the device state changes
+        self._constraints_snapshot: Dict[str, Any] = {}
+        self._active_plan: MobilePlan
+        self._refresh_constraints()
+        
+        # Device polling is coalesced to at most once per interval
+        self._min_poll_interval_s = config.device_poll_interval_s
+        self._last_poll = float("-inf")
+        
+        # Model variant to run in each thermal state, set by optimize_model_loading
+        self._thermal_model_ladder: Mapping[ThermalState, str] = {}
+        
         # Optimization parameters
-        self.optimization_profiles: Dict[str, Dict[str, Any]] = {}
-        self.thermal_thresholds: Dict[ThermalState, Dict[str, float]] = {}
-        self.battery_thresholds: Dict[str, float] = {}
+        self.optimization_profiles: Mapping[str, Mapping[str, Any]] = {}
+        self.thermal_thresholds: Mapping[ThermalState, Mapping[str, float]] = {}
+        self.battery_thresholds: Mapping[str, float] = {}
         
         # Performance tracking
-        self.optimization_history: List[Dict[str, Any]] = []
+        self.optimization_history: Deque[Dict[str, Any]] = deque(
+            maxlen=config.optimization_history_cap or None
+        )
         self.performance_metrics: Dict[str, float] = {}
     
     async def initialize(self) -> None:
@@ -96,16 +226,16 @@ class HRMMobileOptimizer:
             logger.info("Initializing HRM Mobile Optimizer...")
             
             # Load optimization profiles
-            await self._load_optimization_profiles()
+            self._load_optimization_profiles()
             
             # Setup thermal management
-            await self._setup_thermal_management()
+            self._setup_thermal_management()
             
             # Initialize battery management
-            await self._setup_battery_management()
+            self._setup_battery_management()
             
             # Setup performance monitoring
-            await self._setup_performance_monitoring()
+            self._setup_performance_monitoring()
             
             self.is_initialized = True
             logger.info("HRM Mobile Optimizer initialized successfully")
@@ -117,25 +247,26 @@ class HRMMobileOptimizer:
                 ErrorCode.HRM_INITIALIZATION_FAILED
             )
     
-    async def optimize_model_loading(self, model_path: str, quantization: str,
+    async def optimize_model_loading(self, model_path: Path, quantization: str,
                                    memory_limit_mb: int) -> Dict[str, Any]:
         """Optimize model loading configuration for mobile"""
-        try:
-            base_config = {
-                "model_path": model_path,
-                "quantization": quantization,
-                "memory_limit_mb": memory_limit_mb
-            }
-            
-            # Apply mobile optimizations
-            optimized_config = await self._apply_loading_optimizations(base_config)
-            
-            logger.debug(f"Model loading optimized: {optimized_config}")
-            return optimized_config
-            
-        except Exception as e:
-            logger.error(f"Model loading optimization failed: {e}")
-            return base_config
+        base_config = {
+            "model_path": model_path,
+            "quantization": quantization,
+            "memory_limit_mb": memory_limit_mb
+        }
+        
+        # Resolve the smaller variants to fall back to as the device heats up
+        if isinstance(model_path, (str, Path)):
+            self._thermal_model_ladder = self._build_thermal_model_ladder(Path(model_path))
+        
+        # Apply mobile optimizations
+        optimized_config = self._apply_loading_optimizations(base_config)
+        self._record_optimization("model_loading")
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Model loading optimized: %s", optimized_config)
+        return optimized_config
     
     async def optimize_request(self, request) -> Any:
         """Optimize request processing for mobile constraints"""
@@ -144,7 +275,7 @@ class HRMMobileOptimizer:
             await self._update_device_state()
             
             # Apply request optimizations
-            optimized_request = await self._apply_request_optimizations(request)
+            optimized_request = self._apply_request_optimizations(request)
             
             return optimized_request
             
@@ -155,85 +286,92 @@ class HRMMobileOptimizer:
     async def optimize_strategy(self, strategy: Dict[str, Any], 
                               constraints: Dict[str, Any]) -> Dict[str, Any]:
         """Optimize strategic plan for mobile constraints"""
-        try:
-            optimized_strategy = strategy.copy()
-            
-            # Apply battery optimizations
-            if self.current_constraints.battery_level < 0.3:
-                optimized_strategy = await self._apply_battery_optimizations(optimized_strategy)
-            
-            # Apply thermal optimizations
-            if self.current_constraints.thermal_state in [ThermalState.HOT, ThermalState.CRITICAL]:
-                optimized_strategy = await self._apply_thermal_optimizations(optimized_strategy)
-            
-            # Apply memory optimizations
-            if self.current_constraints.memory_pressure > 0.7:
-                optimized_strategy = await self._apply_memory_optimizations(optimized_strategy)
-            
-            return optimized_strategy
-            
-        except Exception as e:
-            logger.error(f"Strategy optimization failed: {e}")
+        # Apply battery, thermal and memory optimizations as the plan
+        # requires; the common no-op case hands back the caller's
+        # strategy without copying it
+        plan = self._active_plan
+        if not plan.adjusts_strategy or not isinstance(strategy, dict):
             return strategy
+        
+        optimized = self._apply_strategy_optimizations(strategy, plan)
+        self._record_optimization("strategy")
+        return optimized
     
     async def optimize_execution_result(self, execution_result: Dict[str, Any],
-                                      strategy: Dict[str, Any]) -> Dict[str, Any]:
-        """Optimize execution result for mobile delivery"""
-        try:
-            optimized_result = execution_result.copy()
-            
-            # Optimize response length for mobile
-            if "response" in optimized_result:
-                optimized_result["response"] = await self._optimize_response_length(
-                    optimized_result["response"]
-                )
-            
-            # Add mobile-specific metadata
-            optimized_result["mobile_optimizations"] = {
-                "battery_level": self.current_constraints.battery_level,
-                "thermal_state": self.current_constraints.thermal_state.value,
-                "performance_mode": self.current_constraints.performance_mode.value,
-                "optimizations_applied": await self._get_applied_optimizations()
-            }
-            
-            return optimized_result
-            
-        except Exception as e:
-            logger.error(f"Execution result optimization failed: {e}")
+                                      strategy: Dict[str, Any],
+                                      with_metadata: bool = True) -> Dict[str, Any]:
+        """Optimize execution result for mobile delivery
+        
+        Pass with_metadata=False to skip attaching mobile_optimizations when
+        the caller does not report it.
+        """
+        if not isinstance(execution_result, dict):
+            return execution_result
+        
+        response = execution_result.get("response")
+        has_text = isinstance(response, str)
+        if not with_metadata and not has_text:
             return execution_result
+        
+        optimized_result = execution_result.copy()
+        
+        # Optimize response length for mobile
+        if has_text:
+            optimized_result["response"] = self._optimize_response_length(response)
+        
+        if not with_metadata:
+            return optimized_result
+        
+        # Add mobile-specific metadata
+        snapshot = self._constraints_snapshot
+        optimized_result["mobile_optimizations"] = {
+            "battery_level": snapshot["battery_level"],
+            "thermal_state": snapshot["thermal_state"],
+            "performance_mode": snapshot["performance_mode"],
+            "optimizations_applied": self._get_applied_optimizations()
+        }
+        
+        return optimized_result
     
     async def optimize_learning_parameters(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Optimize learning parameters for mobile"""
-        try:
-            optimized_params = params.copy()
-            
-            # Reduce learning complexity on low battery
-            if self.current_constraints.battery_level < 0.2:
-                optimized_params["max_samples"] = min(params.get("max_samples", 1000), 500)
-                optimized_params["adaptation_rate"] = params.get("adaptation_rate", 0.1) * 0.5
-            
-            # Reduce memory usage under pressure
-            if self.current_constraints.memory_pressure > 0.8:
-                optimized_params["max_samples"] = min(params.get("max_samples", 1000), 300)
-            
-            return optimized_params
-            
-        except Exception as e:
-            logger.error(f"Learning parameters optimization failed: {e}")
+        if not isinstance(params, dict):
             return params
+        
+        optimized_params = params.copy()
+        plan = self._active_plan
+        max_samples = params.get("max_samples", 1000)
+        adaptation_rate = params.get("adaptation_rate", 0.1)
+        
+        # Reduce learning complexity on low battery
+        if plan.reduce_learning:
+            if isinstance(max_samples, (int, float)):
+                optimized_params["max_samples"] = min(max_samples, 500)
+            if isinstance(adaptation_rate, (int, float)):
+                optimized_params["adaptation_rate"] = adaptation_rate * 0.5
+        
+        # Reduce memory usage under pressure
+        if plan.reduce_memory_limit and isinstance(max_samples, (int, float)):
+            optimized_params["max_samples"] = min(max_samples, 300)
+        
+        return optimized_params
     
     async def get_current_constraints(self) -> Dict[str, Any]:
         """Get current mobile constraints"""
         await self._update_device_state()
         
-        return {
-            "battery_level": self.current_constraints.battery_level,
-            "thermal_state": self.current_constraints.thermal_state.value,
-            "memory_pressure": self.current_constraints.memory_pressure,
-            "cpu_usage": self.current_constraints.cpu_usage,
-            "network_quality": self.current_constraints.network_quality,
-            "performance_mode": self.current_constraints.performance_mode.value
-        }
+        return self._constraints_snapshot.copy()
+    
+    def get_model_variant(self) -> Optional[str]:
+        """Get the model file to run in the current thermal state, if one exists"""
+        return self._thermal_model_ladder.get(self.current_constraints.thermal_state)
+    
+    def get_current_constraints_snapshot(self) -> Dict[str, Any]:
+        """Get the latest mobile constraints without polling the device
+        
+        The returned dict is shared and must not be modified.
+        """
+        return self._constraints_snapshot
     
     async def update_device_state(self, battery_level: float, thermal_state: str,
                                 memory_pressure: float, cpu_usage: float,
@@ -241,25 +379,31 @@ class HRMMobileOptimizer:
         """Update device state from external monitoring"""
         try:
             self.current_constraints.battery_level = max(0.0, min(1.0, battery_level))
-            self.current_constraints.thermal_state = ThermalState(thermal_state)
+            self.current_constraints.thermal_state = (
+                _THERMAL_BY_VALUE.get(thermal_state) or ThermalState(thermal_state)
+            )
             self.current_constraints.memory_pressure = max(0.0, min(1.0, memory_pressure))
             self.current_constraints.cpu_usage = max(0.0, min(1.0, cpu_usage))
             self.current_constraints.network_quality = network_quality
             
-            # Update performance mode based on constraints
-            await self._update_performance_mode()
+            # Update performance mode and plan based on constraints
+            self._update_performance_mode()
             
-            logger.debug(f"Device state updated: {self.current_constraints}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Device state updated: %s", self.current_constraints)
             
         except Exception as e:
+            # Fields assigned before the failure still apply
+            self._refresh_constraints()
             logger.error(f"Device state update failed: {e}")
     
-    async def _apply_loading_optimizations(self, config: Dict[str, Any]) -> Dict[str, Any]:
+    def _apply_loading_optimizations(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Apply optimizations for model loading"""
         optimized = config.copy()
+        plan = self._active_plan
         
         # Adjust quantization based on constraints
-        if self.current_constraints.memory_pressure > 0.7:
+        if plan.step_up_quantization:
             # Use more aggressive quantization
             if config.get("quantization") == "fp16":
                 optimized["quantization"] = "int8"
@@ -267,132 +411,135 @@ class HRMMobileOptimizer:
                 optimized["quantization"] = "int4"
         
         # Reduce memory limit under pressure
-        if self.current_constraints.memory_pressure > 0.8:
-            current_limit = config.get("memory_limit_mb", 512)
+        current_limit = config.get("memory_limit_mb", 512)
+        if plan.reduce_memory_limit and isinstance(current_limit, (int, float)):
             optimized["memory_limit_mb"] = int(current_limit * 0.7)
         
+        # Load the model variant suited to the current thermal state
+        model_variant = self.get_model_variant()
+        if model_variant:
+            optimized["model_variant"] = model_variant
+        
         # Add mobile-specific loading options
         optimized["mobile_optimizations"] = {
             "lazy_loading": True,
-            "memory_mapping": self.current_constraints.memory_pressure < 0.5,
-            "cpu_threads": await self._get_optimal_thread_count()
+            "memory_mapping": plan.memory_mapping,
+            "cpu_threads": plan.thread_count
         }
         
         return optimized
     
-    async def _apply_request_optimizations(self, request) -> Any:
+    def _apply_request_optimizations(self, request) -> Any:
         """Apply optimizations to request processing"""
         # Add mobile constraints to request
         if hasattr(request, 'mobile_constraints'):
-            request.mobile_constraints = await self.get_current_constraints()
+            request.mobile_constraints = self._constraints_snapshot
         
         # Adjust timeout based on performance mode
         if hasattr(request, 'timeout_seconds'):
-            if self.current_constraints.performance_mode == PerformanceMode.POWER_SAVER:
+            performance_mode = self._active_plan.performance_mode
+            if performance_mode == PerformanceMode.POWER_SAVER:
                 request.timeout_seconds = min(request.timeout_seconds or 30, 15)
-            elif self.current_constraints.performance_mode == PerformanceMode.PERFORMANCE:
+            elif performance_mode == PerformanceMode.PERFORMANCE:
                 request.timeout_seconds = max(request.timeout_seconds or 30, 60)
         
         return request
     
-    async def _apply_battery_optimizations(self, strategy: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply battery-saving optimizations to strategy"""
-        optimized = strategy.copy()
-        
-        # Reduce complexity for battery saving
-        if "complexity" in optimized:
-            optimized["complexity"] = min(optimized["complexity"], 0.6)
-        
-        # Simplify key steps
-        if "key_steps" in optimized and len(optimized["key_steps"]) > 3:
-            optimized["key_steps"] = optimized["key_steps"][:3]
-            optimized["key_steps"].append("Provide simplified response for battery optimization")
+    def _apply_strategy_optimizations(self, strategy: Dict[str, Any],
+                                      plan: MobilePlan) -> Dict[str, Any]:
+        """Apply the plan's battery, thermal and memory optimizations to strategy
         
-        # Adjust resource requirements
-        if "resource_requirements" in optimized:
-            optimized["resource_requirements"]["processing_intensity"] = "low"
-            optimized["resource_requirements"]["response_time_target"] = "fast"
-        
-        return optimized
-    
-    async def _apply_thermal_optimizations(self, strategy: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply thermal throttling optimizations to strategy"""
+        All three are applied in one pass over a single copy, writing each
+        field once however many of them are active.
+        """
         optimized = strategy.copy()
         
-        # Reduce processing intensity
-        if "resource_requirements" in optimized:
-            optimized["resource_requirements"]["processing_intensity"] = "low"
-        
-        # Simplify approach for thermal management
-        if optimized.get("approach") == "hierarchical_decomposition":
-            optimized["approach"] = "direct_response"
-        
-        # Add thermal management message
-        optimized["thermal_message"] = "Response optimized for thermal management"
+        if plan.battery_saving:
+            # Reduce complexity for battery saving
+            complexity = optimized.get("complexity")
+            if isinstance(complexity, (int, float)):
+                optimized["complexity"] = min(complexity, 0.6)
+            
+            # Simplify key steps
+            key_steps = optimized.get("key_steps")
+            if isinstance(key_steps, (list, tuple)) and len(key_steps) > 3:
+                optimized["key_steps"] = [*key_steps[:3], _BATTERY_STEP]
         
-        return optimized
-    
-    async def _apply_memory_optimizations(self, strategy: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply memory pressure optimizations to strategy"""
-        optimized = strategy.copy()
+        # Adjust resource requirements
+        resources = optimized.get("resource_requirements")
+        if isinstance(resources, dict):
+            if plan.battery_saving or plan.thermal_throttling:
+                resources["processing_intensity"] = "low"
+            if plan.battery_saving:
+                resources["response_time_target"] = "fast"
+            if plan.memory_saving:
+                resources["memory_usage"] = "low"
         
-        # Reduce memory usage
-        if "resource_requirements" in optimized:
-            optimized["resource_requirements"]["memory_usage"] = "low"
+        if plan.thermal_throttling:
+            # Simplify approach for thermal management
+            if optimized.get("approach") == "hierarchical_decomposition":
+                optimized["approach"] = "direct_response"
+            
+            # Run a smaller model variant while throttled
+            model_variant = self.get_model_variant()
+            if model_variant:
+                optimized["model_variant"] = model_variant
+            
+            # Add thermal management message
+            optimized["thermal_message"] = "Response optimized for thermal management"
         
-        # Limit context requirements
-        if "context_requirements" in optimized:
-            optimized["context_requirements"] = optimized["context_requirements"][:2]
+        # Limit context requirements under memory pressure
+        context_requirements = optimized.get("context_requirements")
+        if plan.memory_saving and isinstance(context_requirements, (list, tuple)):
+            optimized["context_requirements"] = context_requirements[:2]
         
         return optimized
     
-    async def _optimize_response_length(self, response: str) -> str:
+    def _optimize_response_length(self, response: str) -> str:
         """Optimize response length for mobile"""
         # Limit response length based on constraints
-        max_length = 1000  # Default
-        
-        if self.current_constraints.battery_level < 0.2:
-            max_length = 300
-        elif self.current_constraints.battery_level < 0.5:
-            max_length = 600
+        max_length = self._active_plan.max_response_length
         
         if len(response) > max_length:
-            truncated = response[:max_length - 50]
-            last_sentence = truncated.rfind('.')
-            if last_sentence > max_length // 2:
-                response = truncated[:last_sentence + 1]
+            # Cut after the last sentence in the back half of the allowed
+            # window, searching the original string so only one slice is made
+            cut = max_length - 50
+            last_sentence = response.rfind('.', max_length // 2 + 1, cut)
+            if last_sentence != -1:
+                response = response[:last_sentence + 1] + " [Response optimized for mobile]"
             else:
-                response = truncated + "..."
-            
-            response += " [Response optimized for mobile]"
+                response = response[:cut] + "... [Response optimized for mobile]"
         
         return response
     
-    async def _get_applied_optimizations(self) -> List[str]:
+    def _record_optimization(self, target: str) -> None:
+        """Append the active plan's decisions to the bounded optimization history"""
+        plan = self._active_plan
+        self.optimization_history.append({
+            "timestamp": time.time(),
+            "target": target,
+            "performance_mode": plan.performance_mode.value,
+            "thermal_state": self.current_constraints.thermal_state.value,
+            "optimizations": plan.applied_optimizations
+        })
+    
+    def _get_applied_optimizations(self) -> List[str]:
         """Get list of applied optimizations"""
-        optimizations = []
-        
-        if self.current_constraints.battery_level < 0.3:
-            optimizations.append("battery_optimization")
-        
-        if self.current_constraints.thermal_state in [ThermalState.HOT, ThermalState.CRITICAL]:
-            optimizations.append("thermal_throttling")
-        
-        if self.current_constraints.memory_pressure > 0.7:
-            optimizations.append("memory_optimization")
-        
-        if self.current_constraints.performance_mode == PerformanceMode.POWER_SAVER:
-            optimizations.append("power_saving")
-        
-        return optimizations
+        return list(self._active_plan.applied_optimizations)
     
     async def _update_device_state(self) -> None:
         """Update device state from system monitoring"""
+        # Skip polls that repeat one made moments ago (e.g. within one request)
+        now = time.monotonic()
+        if now - self._last_poll < self._min_poll_interval_s:
+            return
+        self._last_poll = now
+        
         # In production, this would interface with actual device monitoring
         # For now, simulate some state changes
         pass
     
-    async def _update_performance_mode(self) -> None:
+    def _update_performance_mode(self) -> None:
         """Update performance mode based on current constraints"""
         if self.current_constraints.battery_level < 0.2:
             self.current_constraints.performance_mode = PerformanceMode.POWER_SAVER
@@ -404,62 +551,58 @@ class HRMMobileOptimizer:
             self.current_constraints.performance_mode = PerformanceMode.PERFORMANCE
         else:
             self.current_constraints.performance_mode = PerformanceMode.BALANCED
+        
+        self._refresh_constraints()
+    
+    def _refresh_constraints(self) -> None:
+        """Rebuild the constraints snapshot and select the matching plan"""
+        constraints = self.current_constraints
+        self._constraints_snapshot = self._build_constraints_snapshot()
+        self._active_plan = _PLAN_TABLE[_plan_key(
+            _battery_band(constraints.battery_level),
+            constraints.thermal_state,
+            _memory_band(constraints.memory_pressure),
+            constraints.performance_mode
+        )]
+    
+    def _build_constraints_snapshot(self) -> Dict[str, Any]:
+        """Build the constraints dict served to callers"""
+        return {
+            "battery_level": self.current_constraints.battery_level,
+            "thermal_state": self.current_constraints.thermal_state.value,
+            "memory_pressure": self.current_constraints.memory_pressure,
+            "cpu_usage": self.current_constraints.cpu_usage,
+            "network_quality": self.current_constraints.network_quality,
+            "performance_mode": self.current_constraints.performance_mode.value
+        }
+    
+    @staticmethod
+    def _build_thermal_model_ladder(model_path: Path) -> Dict[ThermalState, str]:
+        """Map each thermal state to the model file to run in it, if that file exists"""
+        ladder = {}
+        for state, suffix in _THERMAL_MODEL_SUFFIXES.items():
+            variant = model_path.with_stem(model_path.stem + suffix) if suffix else model_path
+            if variant.is_file():
+                ladder[state] = str(variant)
+        return ladder
     
-    async def _get_optimal_thread_count(self) -> int:
+    def _get_optimal_thread_count(self) -> int:
         """Get optimal thread count for current constraints"""
-        base_threads = 4
-        
-        if self.current_constraints.thermal_state in [ThermalState.HOT, ThermalState.CRITICAL]:
-            return max(1, base_threads // 2)
-        elif self.current_constraints.battery_level < 0.3:
-            return max(1, base_threads // 2)
-        elif self.current_constraints.performance_mode == PerformanceMode.PERFORMANCE:
-            return base_threads
-        else:
-            return max(2, base_threads // 2)
+        return self._active_plan.thread_count
     
-    async def _load_optimization_profiles(self) -> None:
+    def _load_optimization_profiles(self) -> None:
         """Load optimization profiles"""
-        self.optimization_profiles = {
-            "power_saver": {
-                "max_complexity": 0.4,
-                "max_response_length": 300,
-                "processing_intensity": "low",
-                "thread_count": 1
-            },
-            "balanced": {
-                "max_complexity": 0.7,
-                "max_response_length": 600,
-                "processing_intensity": "medium",
-                "thread_count": 2
-            },
-            "performance": {
-                "max_complexity": 1.0,
-                "max_response_length": 1000,
-                "processing_intensity": "high",
-                "thread_count": 4
-            }
-        }
+        self.optimization_profiles = _OPTIMIZATION_PROFILES
     
-    async def _setup_thermal_management(self) -> None:
+    def _setup_thermal_management(self) -> None:
         """Setup thermal management thresholds"""
-        self.thermal_thresholds = {
-            ThermalState.NORMAL: {"max_cpu": 0.7, "max_complexity": 1.0},
-            ThermalState.WARM: {"max_cpu": 0.5, "max_complexity": 0.7},
-            ThermalState.HOT: {"max_cpu": 0.3, "max_complexity": 0.4},
-            ThermalState.CRITICAL: {"max_cpu": 0.1, "max_complexity": 0.2}
-        }
+        self.thermal_thresholds = _THERMAL_THRESHOLDS
     
-    async def _setup_battery_management(self) -> None:
+    def _setup_battery_management(self) -> None:
         """Setup battery management thresholds"""
-        self.battery_thresholds = {
-            "critical": 0.1,
-            "low": 0.2,
-            "medium": 0.5,
-            "high": 0.8
-        }
+        self.battery_thresholds = _BATTERY_THRESHOLDS
     
-    async def _setup_performance_monitoring(self) -> None:
+    def _setup_performance_monitoring(self) -> None:
         """Setup performance monitoring"""
         self.performance_metrics = {
             "optimization_overhead": 0.0,
@@ -475,3 +618,61 @@ class HRMMobileOptimizer:
             logger.info("HRM Mobile Optimizer shutdown complete")
         except Exception as e:
             logger.error(f"Error during HRM Mobile Optimizer shutdown: {e}")
+
+
+def _build_plan(battery_band: int, thermal_state: ThermalState,
+                memory_band: int, performance_mode: PerformanceMode) -> MobilePlan:
+    """Evaluate every optimization rule for one constraint combination"""
+    low_battery = battery_band <= 1  # < 0.3
+    throttling = thermal_state in _THROTTLING_STATES
+    memory_optimization = memory_band >= 2  # > 0.7
+    
+    applied = []
+    if low_battery:
+        applied.append("battery_optimization")
+    if throttling:
+        applied.append("thermal_throttling")
+    if memory_optimization:
+        applied.append("memory_optimization")
+    if performance_mode == PerformanceMode.POWER_SAVER:
+        applied.append("power_saving")
+    
+    base_threads = 4
+    if throttling or low_battery:
+        thread_count = max(1, base_threads // 2)
+    elif performance_mode == PerformanceMode.PERFORMANCE:
+        thread_count = base_threads
+    else:
+        thread_count = max(2, base_threads // 2)
+    
+    if battery_band == 0:  # < 0.2
+        max_response_length = 300
+    elif battery_band <= 2:  # < 0.5
+        max_response_length = 600
+    else:
+        max_response_length = 1000
+    
+    return MobilePlan(
+        performance_mode=performance_mode,
+        applied_optimizations=tuple(applied),
+        thread_count=thread_count,
+        max_response_length=max_response_length,
+        battery_saving=low_battery,
+        thermal_throttling=throttling,
+        memory_saving=memory_optimization,
+        adjusts_strategy=low_battery or throttling or memory_optimization,
+        step_up_quantization=memory_optimization,
+        reduce_memory_limit=memory_band == 3,
+        memory_mapping=memory_band == 0,
+        reduce_learning=battery_band == 0
+    )
+
+
+# Plans for every (battery band, thermal state, memory band, performance mode)
+_PLAN_TABLE: Tuple[MobilePlan, ...] = tuple(
+    _build_plan(battery_band, thermal_state, memory_band, performance_mode)
+    for battery_band in range(_BATTERY_BANDS)
+    for thermal_state in _THERMAL_STATES
+    for memory_band in range(_MEMORY_BANDS)
+    for performance_mode in _PERFORMANCE_MODES
+)
@@ -7,8 +7,12 @@ for abstract reasoning and goal decomposition.
 """
 
 import asyncio
+import functools
+import re
 import time
-from typing import Dict, Any, List, Optional
+from collections import deque
+from types import MappingProxyType
+from typing import Deque, Dict, Any, FrozenSet, List, Mapping, Optional, Set, Tuple, Union
 from dataclasses import dataclass
 import logging
 
@@ -18,8 +22,326 @@ from ..exceptions import ThinkMeshException, ErrorCode
 
 logger = logging.getLogger(__name__)
 
+# Most recent strategic decisions kept for learning
+_STRATEGIC_MEMORY_SIZE = 1000
 
-@dataclass
+# Distinct request texts whose keyword analysis is cached
+_ANALYSIS_CACHE_SIZE = 4096
+
+# Request keywords, matched as whole words against the tokenized request
+_WORD_PATTERN = re.compile(r"\w+")
+
+# ASCII characters outside \w, mapped to spaces so str.split() yields the same words
+_ASCII_NON_WORD = str.maketrans(dict.fromkeys(
+    (chr(code) for code in range(128) if not _WORD_PATTERN.match(chr(code))), " "
+))
+
+_QUESTION_WORDS = frozenset({"how", "why", "what", "when", "where", "which", "who"})
+_TECHNICAL_TERMS = frozenset({"implement", "design", "architecture", "algorithm", "system", "optimize"})
+_STEP_INDICATORS = frozenset({"first", "then", "next", "finally", "also", "additionally"})
+
+_SCOPE_INDICATORS: Dict[str, FrozenSet[str]] = {
+    "narrow": frozenset({"specific", "particular", "exact", "precise"}),
+    "medium": frozenset({"general", "typical", "common", "standard"}),
+    "broad": frozenset({"comprehensive", "complete", "full", "entire", "all"})
+}
+
+_URGENT_INDICATORS = frozenset({"urgent", "asap", "immediately", "critical", "emergency", "now"})
+_IMPORTANT_INDICATORS = frozenset({"important", "priority", "need", "required", "must"})
+
+_DOMAIN_KEYWORDS: Dict[str, FrozenSet[str]] = {
+    "technical": frozenset({"code", "programming", "software", "system", "algorithm", "technical"}),
+    "creative": frozenset({"create", "design", "write", "generate", "creative", "artistic"}),
+    "analytical": frozenset({"analyze", "compare", "evaluate", "assess", "research", "study"}),
+    "informational": frozenset({"what", "who", "when", "where", "explain", "describe"}),
+    "problem_solving": frozenset({"solve", "fix", "troubleshoot", "debug", "resolve", "help"}),
+    "conversational": frozenset({"chat", "talk", "discuss", "conversation", "opinion"})
+}
+
+_INTENT_KEYWORDS: Dict[str, FrozenSet[str]] = {
+    "information_seeking": frozenset({"what", "who", "when", "where", "explain"}),
+    "task_completion": frozenset({"do", "make", "create", "build", "implement", "execute"}),
+    "problem_solving": frozenset({"how", "solve", "fix", "help", "troubleshoot"}),
+    "decision_support": frozenset({"should", "recommend", "suggest", "advise", "choose"}),
+    "learning": frozenset({"learn", "understand", "teach", "show", "tutorial"}),
+    "creative": frozenset({"write", "design", "generate", "create", "compose"})
+}
+
+_PERSONAL_INDICATORS = frozenset({"my", "i", "me", "mine", "personal"})
+_HISTORY_INDICATORS = frozenset({"previous", "earlier", "before", "history"})
+_CURRENT_INDICATORS = frozenset({"current", "now", "today", "this", "present"})
+
+# Every keyword group under a category tag, so one pass over the tokens finds all hits
+_SCOPE_TAGS = tuple((scope, "scope." + scope) for scope in _SCOPE_INDICATORS)
+_DOMAIN_TAGS = tuple((domain, "domain." + domain) for domain in _DOMAIN_KEYWORDS)
+_INTENT_TAGS = tuple((intent, "intent." + intent) for intent in _INTENT_KEYWORDS)
+
+_KEYWORD_GROUPS: Dict[str, FrozenSet[str]] = {
+    "question": _QUESTION_WORDS,
+    "technical": _TECHNICAL_TERMS,
+    "step": _STEP_INDICATORS,
+    "urgent": _URGENT_INDICATORS,
+    "important": _IMPORTANT_INDICATORS,
+    "personal": _PERSONAL_INDICATORS,
+    "history": _HISTORY_INDICATORS,
+    "current": _CURRENT_INDICATORS,
+    "project": frozenset({"project"}),
+    "work": frozenset({"work"}),
+    **{tag: _SCOPE_INDICATORS[scope] for scope, tag in _SCOPE_TAGS},
+    **{tag: _DOMAIN_KEYWORDS[domain] for domain, tag in _DOMAIN_TAGS},
+    **{tag: _INTENT_KEYWORDS[intent] for intent, tag in _INTENT_TAGS}
+}
+
+# Multi-word keywords can't match a single token, so they are matched as phrases
+_KEYWORD_PHRASES: Dict[str, Tuple[str, ...]] = {
+    "intent.information_seeking": ("tell me",),
+    "history": ("last time",)
+}
+
+
+def _build_keyword_index() -> Dict[str, Tuple[str, ...]]:
+    """Map each keyword to the tags of every group it belongs to"""
+    index: Dict[str, List[str]] = {}
+    for tag, keywords in _KEYWORD_GROUPS.items():
+        for keyword in keywords:
+            index.setdefault(keyword, []).append(tag)
+    return {keyword: tuple(tags) for keyword, tags in index.items()}
+
+
+_KEYWORD_INDEX = _build_keyword_index()
+
+# Inflected forms ("implementing", "systems", "optimization") count as their
+# keyword; words this short ("i", "me", "do") are left alone so "is" and
+# "does" don't match
+_INFLECTION_SUFFIXES = ("s", "es", "ed", "ing", "ion", "ions", "ation", "ations")
+_MIN_INFLECTED_LENGTH = 3
+
+# Agent nouns ("designer", "executor") are formed only from content keywords,
+# so function words like "must" and "mine" don't pick up "muster" or "miner"
+_AGENT_SUFFIXES = ("er", "ers", "or", "ors")
+_AGENTIVE_KEYWORDS = frozenset().union(
+    _TECHNICAL_TERMS, *_DOMAIN_KEYWORDS.values(), *_INTENT_KEYWORDS.values()
+)
+
+# Suffixes before which a short final consonant doubles ("debugging", "programmer")
+_DOUBLING_SUFFIXES = frozenset({"ed", "ing", "er", "ers"})
+_VOWELS = frozenset("aeiou")
+
+
+def _doubles_final_consonant(word: str) -> bool:
+    """Whether word ends consonant-vowel-consonant, as "debug" and "program" do"""
+    return (len(word) >= 3 and word[-1] not in _VOWELS and word[-1] not in "wxy"
+            and word[-2] in _VOWELS and word[-3] not in _VOWELS)
+
+
+def _keyword_root(keyword: str) -> str:
+    """The verb behind an -ing keyword ("programming" -> "program"), else the keyword"""
+    if not keyword.endswith("ing") or len(keyword) - 3 < _MIN_INFLECTED_LENGTH:
+        return keyword
+    root = keyword[:-3]
+    if root[-1] == root[-2] and root[-1] not in _VOWELS:
+        root = root[:-1]
+    return root
+
+
+def _inflections(keyword: str) -> Set[str]:
+    """Regular inflected forms of a keyword and of its root"""
+    if len(keyword) < _MIN_INFLECTED_LENGTH:
+        return set()
+    suffixes = _INFLECTION_SUFFIXES
+    if keyword in _AGENTIVE_KEYWORDS:
+        suffixes += _AGENT_SUFFIXES
+    
+    forms = set()
+    for base in {keyword, _keyword_root(keyword)}:
+        forms.add(base)
+        forms.update(base + suffix for suffix in suffixes)
+        if base.endswith("e"):
+            # Drop the e: "optimization", "creator"
+            forms.update(base[:-1] + suffix for suffix in suffixes)
+            if base.endswith("olve"):  # "solution", "resolutions"
+                forms.update((base[:-2] + "ution", base[:-2] + "utions"))
+            elif base.endswith("yze"):  # "analysis", "analyses"
+                forms.update((base[:-2] + "sis", base[:-2] + "ses"))
+        elif base.endswith("y"):
+            forms.update((base[:-1] + "ies", base[:-1] + "ied"))
+        elif _doubles_final_consonant(base):
+            forms.update(base + base[-1] + suffix for suffix in suffixes
+                         if suffix in _DOUBLING_SUFFIXES)
+    return forms
+
+
+def _build_keyword_forms() -> Dict[str, str]:
+    """Map every keyword and its inflected forms to the keyword"""
+    forms: Dict[str, str] = {}
+    for keyword in _KEYWORD_INDEX:
+        for form in _inflections(keyword):
+            forms.setdefault(form, keyword)
+    # A form that is itself a keyword stays that keyword
+    forms.update((keyword, keyword) for keyword in _KEYWORD_INDEX)
+    return forms
+
+
+_KEYWORD_FORMS = _build_keyword_forms()
+_ALL_KEYWORD_FORMS = frozenset(_KEYWORD_FORMS)
+
+
+def _tokenize(lowered: str) -> FrozenSet[str]:
+    """Distinct words of the lowercased request"""
+    if lowered.isascii():
+        # translate + split stay in C; several times faster than the regex on long requests
+        return frozenset(lowered.translate(_ASCII_NON_WORD).split())
+    return frozenset(_WORD_PATTERN.findall(lowered))
+
+
+def _count_keyword_hits(lowered: str, tokens: FrozenSet[str]) -> Dict[str, int]:
+    """Count distinct keyword hits per group tag in a single pass over the tokens"""
+    hits: Dict[str, int] = {}
+    index = _KEYWORD_INDEX
+    forms = _KEYWORD_FORMS
+    # Resolve forms first so "system" and "systems" count as one hit
+    for keyword in {forms[token] for token in tokens & _ALL_KEYWORD_FORMS}:
+        for tag in index[keyword]:
+            hits[tag] = hits.get(tag, 0) + 1
+    for tag, phrases in _KEYWORD_PHRASES.items():
+        for phrase in phrases:
+            if phrase in lowered:
+                hits[tag] = hits.get(tag, 0) + 1
+    return hits
+
+
+@functools.lru_cache(maxsize=_ANALYSIS_CACHE_SIZE)
+def _analyze_text(request: str) -> Tuple[Mapping[str, int], int]:
+    """Keyword hit counts and word count of a request
+    
+    A pure function of the request text, cached so repeated requests
+    (retries, chatty clients) skip the scan. The hit counts are shared
+    between callers and read-only.
+    """
+    lowered = request.lower()
+    hits = _count_keyword_hits(lowered, _tokenize(lowered))
+    return MappingProxyType(hits), len(lowered.split())
+
+
+# Plan templates per approach, shared read-only across plans
+_STEP_TEMPLATES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "hierarchical_decomposition": (
+        "Break down complex goal into sub-goals",
+        "Prioritize sub-goals by importance and dependencies",
+        "Plan execution sequence",
+        "Synthesize results"
+    ),
+    "systematic_analysis": (
+        "Gather relevant information",
+        "Analyze systematically",
+        "Identify patterns and insights",
+        "Present structured findings"
+    ),
+    "generative_exploration": (
+        "Explore creative possibilities",
+        "Generate multiple alternatives",
+        "Refine and enhance ideas",
+        "Present creative solution"
+    ),
+    "analytical_problem_solving": (
+        "Define problem clearly",
+        "Analyze root causes",
+        "Generate solution options",
+        "Recommend optimal solution"
+    ),
+    "knowledge_retrieval": (
+        "Identify information requirements",
+        "Search relevant knowledge",
+        "Synthesize information",
+        "Present comprehensive answer"
+    ),
+    "direct_response": (
+        "Understand immediate need",
+        "Provide direct solution"
+    ),
+    "contextual_reasoning": (
+        "Consider context and background",
+        "Apply reasoning to situation",
+        "Generate contextual response"
+    )
+})
+_DEFAULT_STEPS = ("Analyze request", "Generate response")
+
+_BASE_CRITERIA = ("Addresses user request accurately", "Response is clear and helpful")
+
+# Full success criteria per approach, base criteria first
+_APPROACH_CRITERIA: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    approach: _BASE_CRITERIA + criteria for approach, criteria in {
+        "hierarchical_decomposition": ("All sub-goals addressed", "Logical structure maintained"),
+        "systematic_analysis": ("Analysis is thorough", "Insights are valuable"),
+        "generative_exploration": ("Solution is creative", "Meets requirements"),
+        "analytical_problem_solving": ("Problem is solved", "Solution is practical"),
+        "knowledge_retrieval": ("Information is accurate", "Coverage is comprehensive"),
+        "direct_response": ("Response is immediate", "Need is satisfied"),
+        "contextual_reasoning": ("Context is considered", "Response is appropriate")
+    }.items()
+})
+
+_APPROACH_MESSAGES: Mapping[str, str] = MappingProxyType({
+    "hierarchical_decomposition": "I'll break this down into manageable parts and work through them systematically.",
+    "systematic_analysis": "Let me analyze this systematically to provide you with comprehensive insights.",
+    "generative_exploration": "I'll explore creative approaches to develop an innovative solution for you.",
+    "analytical_problem_solving": "I'll analyze the problem and work through potential solutions step by step.",
+    "knowledge_retrieval": "Let me gather and synthesize the relevant information for you.",
+    "direct_response": "I'll provide you with a direct answer to your immediate need.",
+    "contextual_reasoning": "I'll consider the context and provide a thoughtful response."
+})
+_DEFAULT_MESSAGE = "I'll work on this request for you."
+
+# Knowledge base shared by every planner, aliased on initialize
+_STRATEGIC_PATTERNS: Mapping[str, Mapping[str, float]] = MappingProxyType({
+    "complexity_thresholds": MappingProxyType({
+        "simple": 0.3,
+        "moderate": 0.6,
+        "complex": 0.8
+    }),
+    "approach_effectiveness": MappingProxyType({
+        "hierarchical_decomposition": 0.85,
+        "systematic_analysis": 0.80,
+        "generative_exploration": 0.75,
+        "analytical_problem_solving": 0.82,
+        "knowledge_retrieval": 0.88,
+        "direct_response": 0.90,
+        "contextual_reasoning": 0.78
+    })
+})
+
+_GOAL_TEMPLATES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "technical_implementation": (
+        "Requirements analysis",
+        "Design planning",
+        "Implementation",
+        "Testing and validation"
+    ),
+    "problem_analysis": (
+        "Problem definition",
+        "Root cause analysis",
+        "Solution generation",
+        "Solution evaluation"
+    ),
+    "creative_project": (
+        "Concept exploration",
+        "Idea development",
+        "Creative execution",
+        "Refinement and polish"
+    )
+})
+
+_SUCCESS_METRICS: Mapping[str, str] = MappingProxyType({
+    "accuracy": "Response addresses the request correctly",
+    "completeness": "All aspects of the request are covered",
+    "clarity": "Response is clear and understandable",
+    "usefulness": "Response provides practical value",
+    "efficiency": "Response is generated in reasonable time"
+})
+
+
+@dataclass(slots=True)
 class StrategicPlan:
     """Strategic plan structure"""
     goal: str
@@ -31,6 +353,22 @@ class StrategicPlan:
     success_criteria: List[str]
     resource_requirements: Dict[str, Any]
     timeline_estimate: str
+    domain: str
+    intent: str
+    urgency: str
+    user_message: str
+
+
+@dataclass(slots=True)
+class StrategicDecision:
+    """Strategic decision kept in strategic memory for learning"""
+    timestamp: float
+    request: str
+    approach: str
+    complexity: float
+    domain: str
+    user_id: str
+    plan: Dict[str, Any]
 
 
 class StrategicPlanner:
@@ -47,12 +385,12 @@ class StrategicPlanner:
         self.is_initialized = False
         
         # Strategic knowledge base
-        self.strategic_patterns: Dict[str, Any] = {}
-        self.goal_templates: Dict[str, List[str]] = {}
-        self.success_metrics: Dict[str, Any] = {}
+        self.strategic_patterns: Mapping[str, Any] = {}
+        self.goal_templates: Mapping[str, Tuple[str, ...]] = {}
+        self.success_metrics: Mapping[str, Any] = {}
         
         # Learning state
-        self.strategic_memory: List[Dict[str, Any]] = []
+        self.strategic_memory: Deque[StrategicDecision] = deque(maxlen=_STRATEGIC_MEMORY_SIZE)
         self.pattern_effectiveness: Dict[str, float] = {}
     
     async def initialize(self) -> None:
@@ -78,29 +416,48 @@ class StrategicPlanner:
     async def create_strategy(self, request: str, context: UserContext, 
                             constraints: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Create strategic plan for the given request"""
-        try:
-            # Analyze request complexity and scope
-            analysis = await self._analyze_request(request, context)
-            
-            # Determine strategic approach
-            approach = await self._determine_approach(analysis, constraints)
-            
-            # Generate strategic plan
-            strategic_plan = await self._generate_strategic_plan(
-                request, analysis, approach, context
+        plans = await self.create_strategies([request], [context], constraints)
+        return plans[0]
+    
+    async def create_strategies(self, requests: List[str], contexts: List[UserContext],
+                                constraints: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Create strategic plans for requests sharing the same mobile constraints
+        
+        Analysis and plan generation run for the whole batch in one synchronous
+        loop, so the per-request cost is plain function calls rather than a
+        coroutine each. Plans are returned in input order; any failure fails
+        the batch (use create_strategy_batch to isolate failures).
+        """
+        if len(requests) != len(contexts):
+            raise ValueError(
+                f"Got {len(requests)} requests but {len(contexts)} contexts"
             )
+        
+        try:
+            # Analyze each request and generate its plan
+            strategic_plans = [
+                self._generate_strategic_plan(
+                    request, self._analyze_request(request, context), context
+                )
+                for request, context in zip(requests, contexts)
+            ]
             
             # Optimize for mobile constraints
             if self.mobile_optimizer and constraints:
-                strategic_plan = await self.mobile_optimizer.optimize_strategy(
-                    strategic_plan, constraints
-                )
+                optimize_strategy = self.mobile_optimizer.optimize_strategy
+                strategic_plans = [
+                    await optimize_strategy(strategic_plan, constraints)
+                    for strategic_plan in strategic_plans
+                ]
             
             # Store in strategic memory
-            await self._store_strategic_decision(request, strategic_plan, context)
+            for request, strategic_plan, context in zip(requests, strategic_plans, contexts):
+                await self._store_strategic_decision(request, strategic_plan, context)
             
-            logger.debug(f"Strategic plan created: {strategic_plan['approach']}")
-            return strategic_plan
+            if logger.isEnabledFor(logging.DEBUG):
+                for strategic_plan in strategic_plans:
+                    logger.debug(f"Strategic plan created: {strategic_plan['approach']}")
+            return strategic_plans
             
         except Exception as e:
             logger.error(f"Strategic planning failed: {e}")
@@ -109,61 +466,70 @@ class StrategicPlanner:
                 ErrorCode.HRM_PROCESSING_FAILED
             )
     
-    async def _analyze_request(self, request: str, context: UserContext) -> Dict[str, Any]:
-        """Analyze request for strategic planning"""
+    async def create_strategy_batch(
+        self, requests: List[Tuple[str, UserContext, Optional[Dict[str, Any]]]]
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """Create strategic plans for a batch of (request, context, constraints)
+        
+        Results are returned in input order; a failed plan is returned as its
+        exception so one bad request does not fail the whole batch.
+        """
+        return await asyncio.gather(
+            *(self.create_strategy(request, context, constraints)
+              for request, context, constraints in requests),
+            return_exceptions=True
+        )
+    
+    def _analyze_request(self, request: str, context: UserContext) -> Dict[str, Any]:
+        """Analyze request for strategic planning
+        
+        A single synchronous pass: the helpers are pure string scans, so there
+        is nothing to await. The request is lowercased, tokenized and matched
+        against every keyword group once (cached per request text); the
+        helpers only read the hit counts.
+        """
+        hits, word_count = _analyze_text(request)
+        
         analysis = {
-            "complexity": await self._assess_complexity(request),
-            "scope": await self._assess_scope(request),
-            "urgency": await self._assess_urgency(request, context),
-            "domain": await self._identify_domain(request),
-            "user_intent": await self._analyze_intent(request),
-            "context_dependencies": await self._identify_context_dependencies(request, context)
+            "complexity": self._assess_complexity(hits, word_count),
+            "scope": self._assess_scope(hits, word_count),
+            "urgency": self._assess_urgency(hits, context),
+            "domain": self._identify_domain(hits),
+            "user_intent": self._analyze_intent(hits),
+            "context_dependencies": self._identify_context_dependencies(hits, context)
         }
         
         return analysis
     
-    async def _assess_complexity(self, request: str) -> float:
+    def _assess_complexity(self, hits: Mapping[str, int], word_count: int) -> float:
         """Assess complexity of the request (0.0 to 1.0)"""
         complexity_factors = []
         
         # Length factor
-        length_factor = min(len(request.split()) / 100, 1.0)
+        length_factor = min(word_count / 100, 1.0)
         complexity_factors.append(length_factor)
         
         # Question complexity
-        question_words = ["how", "why", "what", "when", "where", "which", "who"]
-        question_count = sum(1 for word in question_words if word in request.lower())
-        question_factor = min(question_count / 3, 1.0)
+        question_factor = min(hits.get("question", 0) / 3, 1.0)
         complexity_factors.append(question_factor)
         
         # Technical complexity
-        technical_terms = ["implement", "design", "architecture", "algorithm", "system", "optimize"]
-        tech_count = sum(1 for term in technical_terms if term in request.lower())
-        tech_factor = min(tech_count / 3, 1.0)
+        tech_factor = min(hits.get("technical", 0) / 3, 1.0)
         complexity_factors.append(tech_factor)
         
         # Multi-step indicators
-        step_indicators = ["first", "then", "next", "finally", "also", "additionally"]
-        step_count = sum(1 for indicator in step_indicators if indicator in request.lower())
-        step_factor = min(step_count / 3, 1.0)
+        step_factor = min(hits.get("step", 0) / 3, 1.0)
         complexity_factors.append(step_factor)
         
         return sum(complexity_factors) / len(complexity_factors)
     
-    async def _assess_scope(self, request: str) -> str:
+    def _assess_scope(self, hits: Mapping[str, int], word_count: int) -> str:
         """Assess scope of the request"""
-        scope_indicators = {
-            "narrow": ["specific", "particular", "exact", "precise"],
-            "medium": ["general", "typical", "common", "standard"],
-            "broad": ["comprehensive", "complete", "full", "entire", "all"]
-        }
-        
-        for scope, indicators in scope_indicators.items():
-            if any(indicator in request.lower() for indicator in indicators):
+        for scope, tag in _SCOPE_TAGS:
+            if tag in hits:
                 return scope
         
         # Default based on length
-        word_count = len(request.split())
         if word_count < 10:
             return "narrow"
         elif word_count < 30:
@@ -171,305 +537,170 @@ class StrategicPlanner:
         else:
             return "broad"
     
-    async def _assess_urgency(self, request: str, context: UserContext) -> str:
+    def _assess_urgency(self, hits: Mapping[str, int], context: UserContext) -> str:
         """Assess urgency of the request"""
-        urgent_indicators = ["urgent", "asap", "immediately", "critical", "emergency", "now"]
-        if any(indicator in request.lower() for indicator in urgent_indicators):
+        if "urgent" in hits:
             return "high"
         
-        important_indicators = ["important", "priority", "need", "required", "must"]
-        if any(indicator in request.lower() for indicator in important_indicators):
+        if "important" in hits:
             return "medium"
         
         return "low"
     
-    async def _identify_domain(self, request: str) -> str:
+    def _identify_domain(self, hits: Mapping[str, int]) -> str:
         """Identify the domain/category of the request"""
-        domain_keywords = {
-            "technical": ["code", "programming", "software", "system", "algorithm", "technical"],
-            "creative": ["create", "design", "write", "generate", "creative", "artistic"],
-            "analytical": ["analyze", "compare", "evaluate", "assess", "research", "study"],
-            "informational": ["what", "who", "when", "where", "explain", "describe"],
-            "problem_solving": ["solve", "fix", "troubleshoot", "debug", "resolve", "help"],
-            "conversational": ["chat", "talk", "discuss", "conversation", "opinion"]
-        }
-        
-        for domain, keywords in domain_keywords.items():
-            if any(keyword in request.lower() for keyword in keywords):
+        for domain, tag in _DOMAIN_TAGS:
+            if tag in hits:
                 return domain
         
         return "general"
     
-    async def _analyze_intent(self, request: str) -> str:
+    def _analyze_intent(self, hits: Mapping[str, int]) -> str:
         """Analyze user intent"""
-        intent_patterns = {
-            "information_seeking": ["what", "who", "when", "where", "explain", "tell me"],
-            "task_completion": ["do", "make", "create", "build", "implement", "execute"],
-            "problem_solving": ["how", "solve", "fix", "help", "troubleshoot"],
-            "decision_support": ["should", "recommend", "suggest", "advise", "choose"],
-            "learning": ["learn", "understand", "teach", "show", "tutorial"],
-            "creative": ["write", "design", "generate", "create", "compose"]
-        }
-        
-        for intent, patterns in intent_patterns.items():
-            if any(pattern in request.lower() for pattern in patterns):
+        for intent, tag in _INTENT_TAGS:
+            if tag in hits:
                 return intent
         
         return "general_inquiry"
     
-    async def _identify_context_dependencies(self, request: str, context: UserContext) -> List[str]:
+    def _identify_context_dependencies(self, hits: Mapping[str, int],
+                                       context: UserContext) -> List[str]:
         """Identify what context is needed"""
         dependencies = []
         
         # Personal context indicators
-        personal_indicators = ["my", "i", "me", "mine", "personal"]
-        if any(indicator in request.lower() for indicator in personal_indicators):
+        if "personal" in hits:
             dependencies.append("user_personal_context")
         
         # Historical context indicators
-        history_indicators = ["previous", "earlier", "before", "last time", "history"]
-        if any(indicator in request.lower() for indicator in history_indicators):
+        if "history" in hits:
             dependencies.append("conversation_history")
         
         # Current context indicators
-        current_indicators = ["current", "now", "today", "this", "present"]
-        if any(indicator in request.lower() for indicator in current_indicators):
+        if "current" in hits:
             dependencies.append("current_context")
         
         # Domain-specific context
-        if "project" in request.lower():
+        if "project" in hits:
             dependencies.append("project_context")
-        if "work" in request.lower():
+        if "work" in hits:
             dependencies.append("work_context")
         
         return dependencies
     
-    async def _determine_approach(self, analysis: Dict[str, Any], 
-                                constraints: Optional[Dict[str, Any]]) -> str:
-        """Determine strategic approach based on analysis"""
+    def _classify(self, analysis: Dict[str, Any]) -> Tuple[str, str, Dict[str, Any]]:
+        """Determine strategic approach, timeline and resource requirements
+        
+        All three branch on the same complexity thresholds, so they are
+        decided together in one pass over the analysis.
+        """
         complexity = analysis["complexity"]
-        domain = analysis["domain"]
-        intent = analysis["intent"]
         urgency = analysis["urgency"]
         
-        # High complexity requires decomposition
         if complexity > 0.7:
-            return "hierarchical_decomposition"
-        
-        # Technical domain with medium complexity
-        if domain == "technical" and complexity > 0.4:
-            return "systematic_analysis"
-        
-        # Creative tasks
-        if domain == "creative" or intent == "creative":
-            return "generative_exploration"
-        
-        # Problem solving
-        if intent == "problem_solving":
-            return "analytical_problem_solving"
-        
-        # Information seeking
-        if intent == "information_seeking":
-            return "knowledge_retrieval"
-        
-        # High urgency with low complexity
-        if urgency == "high" and complexity < 0.5:
-            return "direct_response"
+            # High complexity requires decomposition
+            approach = "hierarchical_decomposition"
+            timeline = "extended"
+            processing_intensity = "high"
+        else:
+            domain = analysis["domain"]
+            intent = analysis["user_intent"]
+            
+            if complexity > 0.4:
+                timeline = "moderate"
+                processing_intensity = "medium"
+            else:
+                timeline = "quick"
+                processing_intensity = "low"
+            
+            if domain == "technical" and complexity > 0.4:
+                # Technical domain with medium complexity
+                approach = "systematic_analysis"
+            elif domain == "creative" or intent == "creative":
+                approach = "generative_exploration"
+            elif intent == "problem_solving":
+                approach = "analytical_problem_solving"
+            elif intent == "information_seeking":
+                approach = "knowledge_retrieval"
+            elif urgency == "high" and complexity < 0.5:
+                # High urgency with low complexity
+                approach = "direct_response"
+            else:
+                approach = "contextual_reasoning"
+        
+        urgent = urgency == "high"
+        if urgent:
+            timeline = "immediate"
+        
+        resources = {
+            "processing_intensity": processing_intensity,
+            "memory_usage": "high" if complexity > 0.6 else "medium" if complexity > 0.3 else "low",
+            "response_time_target": "fast" if urgent else "normal"
+        }
         
-        # Default approach
-        return "contextual_reasoning"
+        return approach, timeline, resources
     
-    async def _generate_strategic_plan(self, request: str, analysis: Dict[str, Any],
-                                     approach: str, context: UserContext) -> Dict[str, Any]:
+    def _generate_strategic_plan(self, request: str, analysis: Dict[str, Any],
+                               context: UserContext) -> Dict[str, Any]:
         """Generate the strategic plan"""
+        approach, timeline, resources = self._classify(analysis)
+        
         plan = {
             "goal": request,
             "approach": approach,
             "complexity": analysis["complexity"],
             "domain": analysis["domain"],
-            "intent": analysis["intent"],
+            "intent": analysis["user_intent"],
             "urgency": analysis["urgency"],
-            "key_steps": await self._generate_key_steps(approach, analysis),
-            "success_criteria": await self._define_success_criteria(approach, analysis),
-            "resource_requirements": await self._estimate_resources(analysis),
-            "timeline_estimate": await self._estimate_timeline(analysis),
+            "key_steps": self._generate_key_steps(approach, analysis),
+            "success_criteria": self._define_success_criteria(approach, analysis),
+            "resource_requirements": resources,
+            "timeline_estimate": timeline,
             "context_requirements": analysis["context_dependencies"],
-            "user_message": await self._generate_user_message(approach, analysis)
+            "user_message": self._generate_user_message(approach, analysis)
         }
         
         return plan
     
-    async def _generate_key_steps(self, approach: str, analysis: Dict[str, Any]) -> List[str]:
-        """Generate key strategic steps"""
-        step_templates = {
-            "hierarchical_decomposition": [
-                "Break down complex goal into sub-goals",
-                "Prioritize sub-goals by importance and dependencies",
-                "Plan execution sequence",
-                "Synthesize results"
-            ],
-            "systematic_analysis": [
-                "Gather relevant information",
-                "Analyze systematically",
-                "Identify patterns and insights",
-                "Present structured findings"
-            ],
-            "generative_exploration": [
-                "Explore creative possibilities",
-                "Generate multiple alternatives",
-                "Refine and enhance ideas",
-                "Present creative solution"
-            ],
-            "analytical_problem_solving": [
-                "Define problem clearly",
-                "Analyze root causes",
-                "Generate solution options",
-                "Recommend optimal solution"
-            ],
-            "knowledge_retrieval": [
-                "Identify information requirements",
-                "Search relevant knowledge",
-                "Synthesize information",
-                "Present comprehensive answer"
-            ],
-            "direct_response": [
-                "Understand immediate need",
-                "Provide direct solution"
-            ],
-            "contextual_reasoning": [
-                "Consider context and background",
-                "Apply reasoning to situation",
-                "Generate contextual response"
-            ]
-        }
-        
-        return step_templates.get(approach, ["Analyze request", "Generate response"])
-    
-    async def _define_success_criteria(self, approach: str, analysis: Dict[str, Any]) -> List[str]:
-        """Define success criteria for the strategic plan"""
-        base_criteria = ["Addresses user request accurately", "Response is clear and helpful"]
-        
-        approach_criteria = {
-            "hierarchical_decomposition": ["All sub-goals addressed", "Logical structure maintained"],
-            "systematic_analysis": ["Analysis is thorough", "Insights are valuable"],
-            "generative_exploration": ["Solution is creative", "Meets requirements"],
-            "analytical_problem_solving": ["Problem is solved", "Solution is practical"],
-            "knowledge_retrieval": ["Information is accurate", "Coverage is comprehensive"],
-            "direct_response": ["Response is immediate", "Need is satisfied"],
-            "contextual_reasoning": ["Context is considered", "Response is appropriate"]
-        }
-        
-        return base_criteria + approach_criteria.get(approach, [])
-    
-    async def _estimate_resources(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
-        """Estimate resource requirements"""
-        complexity = analysis["complexity"]
-        
-        return {
-            "processing_intensity": "high" if complexity > 0.7 else "medium" if complexity > 0.4 else "low",
-            "memory_usage": "high" if complexity > 0.6 else "medium" if complexity > 0.3 else "low",
-            "response_time_target": "fast" if analysis["urgency"] == "high" else "normal"
-        }
+    def _generate_key_steps(self, approach: str, analysis: Dict[str, Any]) -> Tuple[str, ...]:
+        """Generate key strategic steps (shared, immutable tuple)"""
+        return _STEP_TEMPLATES.get(approach, _DEFAULT_STEPS)
     
-    async def _estimate_timeline(self, analysis: Dict[str, Any]) -> str:
-        """Estimate timeline for completion"""
-        complexity = analysis["complexity"]
-        urgency = analysis["urgency"]
-        
-        if urgency == "high":
-            return "immediate"
-        elif complexity > 0.7:
-            return "extended"
-        elif complexity > 0.4:
-            return "moderate"
-        else:
-            return "quick"
+    def _define_success_criteria(self, approach: str, analysis: Dict[str, Any]) -> Tuple[str, ...]:
+        """Define success criteria for the strategic plan (shared, immutable tuple)"""
+        return _APPROACH_CRITERIA.get(approach, _BASE_CRITERIA)
     
-    async def _generate_user_message(self, approach: str, analysis: Dict[str, Any]) -> str:
+    def _generate_user_message(self, approach: str, analysis: Dict[str, Any]) -> str:
         """Generate user-facing message about the strategic approach"""
-        messages = {
-            "hierarchical_decomposition": "I'll break this down into manageable parts and work through them systematically.",
-            "systematic_analysis": "Let me analyze this systematically to provide you with comprehensive insights.",
-            "generative_exploration": "I'll explore creative approaches to develop an innovative solution for you.",
-            "analytical_problem_solving": "I'll analyze the problem and work through potential solutions step by step.",
-            "knowledge_retrieval": "Let me gather and synthesize the relevant information for you.",
-            "direct_response": "I'll provide you with a direct answer to your immediate need.",
-            "contextual_reasoning": "I'll consider the context and provide a thoughtful response."
-        }
-        
-        return messages.get(approach, "I'll work on this request for you.")
+        return _APPROACH_MESSAGES.get(approach, _DEFAULT_MESSAGE)
     
     async def _store_strategic_decision(self, request: str, plan: Dict[str, Any], 
                                       context: UserContext) -> None:
         """Store strategic decision for learning"""
-        decision_record = {
-            "timestamp": time.time(),
-            "request": request,
-            "approach": plan["approach"],
-            "complexity": plan["complexity"],
-            "domain": plan["domain"],
-            "user_id": context.user_id,
-            "plan": plan
-        }
-        
+        decision_record = StrategicDecision(
+            timestamp=time.time(),
+            request=request,
+            approach=plan["approach"],
+            complexity=plan["complexity"],
+            domain=plan["domain"],
+            user_id=context.user_id,
+            plan=plan
+        )
+        
+        # Bounded deque: the oldest decision is dropped once the memory is full
         self.strategic_memory.append(decision_record)
-        
-        # Limit memory size
-        if len(self.strategic_memory) > 1000:
-            self.strategic_memory = self.strategic_memory[-500:]
     
     async def _load_strategic_patterns(self) -> None:
         """Load strategic patterns from knowledge base"""
-        # Initialize with basic patterns
-        self.strategic_patterns = {
-            "complexity_thresholds": {
-                "simple": 0.3,
-                "moderate": 0.6,
-                "complex": 0.8
-            },
-            "approach_effectiveness": {
-                "hierarchical_decomposition": 0.85,
-                "systematic_analysis": 0.80,
-                "generative_exploration": 0.75,
-                "analytical_problem_solving": 0.82,
-                "knowledge_retrieval": 0.88,
-                "direct_response": 0.90,
-                "contextual_reasoning": 0.78
-            }
-        }
+        self.strategic_patterns = _STRATEGIC_PATTERNS
     
     async def _load_goal_templates(self) -> None:
         """Load goal decomposition templates"""
-        self.goal_templates = {
-            "technical_implementation": [
-                "Requirements analysis",
-                "Design planning",
-                "Implementation",
-                "Testing and validation"
-            ],
-            "problem_analysis": [
-                "Problem definition",
-                "Root cause analysis",
-                "Solution generation",
-                "Solution evaluation"
-            ],
-            "creative_project": [
-                "Concept exploration",
-                "Idea development",
-                "Creative execution",
-                "Refinement and polish"
-            ]
-        }
+        self.goal_templates = _GOAL_TEMPLATES
     
     async def _load_success_metrics(self) -> None:
         """Load success metrics definitions"""
-        self.success_metrics = {
-            "accuracy": "Response addresses the request correctly",
-            "completeness": "All aspects of the request are covered",
-            "clarity": "Response is clear and understandable",
-            "usefulness": "Response provides practical value",
-            "efficiency": "Response is generated in reasonable time"
-        }
+        self.success_metrics = _SUCCESS_METRICS
     
     async def shutdown(self) -> None:
         """Shutdown the strategic planner"""
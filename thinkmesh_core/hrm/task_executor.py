@@ -8,7 +8,7 @@ for specific task implementation and response generation.
 
 import asyncio
 import time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass
 import logging
 
@@ -78,8 +78,13 @@ class TaskExecutor:
             )
     
     async def execute_strategy(self, strategy: Dict[str, Any], 
-                             context: UserContext) -> Dict[str, Any]:
-        """Execute the strategic plan"""
+                             context: UserContext,
+                             with_mobile_metadata: bool = True) -> Dict[str, Any]:
+        """Execute the strategic plan
+        
+        Pass with_mobile_metadata=False to leave mobile_optimizations off the
+        result when the caller does not report it.
+        """
         try:
             start_time = time.time()
             task_id = f"task_{int(time.time() * 1000)}"
@@ -102,7 +107,7 @@ class TaskExecutor:
                 # Apply mobile optimizations
                 if self.mobile_optimizer:
                     execution_result = await self.mobile_optimizer.optimize_execution_result(
-                        execution_result, strategy
+                        execution_result, strategy, with_metadata=with_mobile_metadata
                     )
                 
                 # Calculate performance metrics
@@ -129,6 +134,22 @@ class TaskExecutor:
                 ErrorCode.HRM_PROCESSING_FAILED
             )
     
+    async def execute_strategy_batch(
+        self, strategies: List[Tuple[Dict[str, Any], UserContext]]
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """Execute a batch of (strategy, context) pairs
+        
+        Results are returned in input order; a failed execution is returned as
+        its exception so one bad strategy does not fail the whole batch. The
+        engine builds its response from the text alone, so batched results
+        skip the mobile metadata.
+        """
+        return await asyncio.gather(
+            *(self.execute_strategy(strategy, context, with_mobile_metadata=False)
+              for strategy, context in strategies),
+            return_exceptions=True
+        )
+    
     async def _select_execution_approach(self, strategy: Dict[str, Any]) -> str:
         """Select execution approach based on strategy"""
         approach = strategy.get("approach", "contextual_reasoning")
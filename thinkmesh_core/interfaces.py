@@ -46,6 +46,16 @@ class HealthStatus:
     details: Dict[str, Any]
     timestamp: float
     component_name: str
+    
+    def _asdict(self) -> Dict[str, Any]:
+        """Shallow field dictionary (avoids dataclasses.asdict deep copies)"""
+        return {
+            "status": self.status,
+            "message": self.message,
+            "details": self.details,
+            "timestamp": self.timestamp,
+            "component_name": self.component_name
+        }
 
 
 @dataclass